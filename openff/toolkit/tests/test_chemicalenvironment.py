@@ -93,6 +93,8 @@ class TestChemicalEnvironments:
                 ImproperChemicalEnvironment,
             ],
             ["[#6X4:1]1~[*:2]~[*$(*~[#1]):3]1", "Angle", AngleChemicalEnvironment],
+            # Atoms tagged inside recursive SMARTS are not atoms of the environment
+            ["[#6:1]-[#6:2]-[$([#6]-[#8:3])]", "Bond", BondChemicalEnvironment],
             ["[$([#7]1~[#6]-CC1)]", None, ChemicalEnvironment],
             ["[$(c1ccccc1)]", None, ChemicalEnvironment],
             # The next two tests are for ring-closing bonds
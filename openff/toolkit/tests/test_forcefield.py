@@ -1044,6 +1044,56 @@ class TestForceField:
         # Ensure that the cosmetic attributes stuck around
         assert "blah=blah2" in forcefield_2.to_string()
 
+    def test_parameter_cache_directory(self, tmp_path):
+        """
+        Test that parameter sections loaded through the on-disk cache match those parsed from source
+        """
+        import pickle
+
+        reference = ForceField(xml_simple_ff).to_string()
+
+        forcefield_1 = ForceField(xml_simple_ff, parameter_cache_directory=tmp_path)
+        cache_files = sorted(tmp_path.glob("*.pkl"))
+        assert len(cache_files) > 0
+        assert forcefield_1.to_string() == reference
+
+        forcefield_2 = ForceField(xml_simple_ff, parameter_cache_directory=tmp_path)
+        assert sorted(tmp_path.glob("*.pkl")) == cache_files
+        assert forcefield_2.to_string() == reference
+
+        # A corrupt cache entry is treated as a miss and rewritten
+        cache_files[0].write_bytes(b"not a pickle")
+        forcefield_3 = ForceField(xml_simple_ff, parameter_cache_directory=tmp_path)
+        assert forcefield_3.to_string() == reference
+        assert cache_files[0].read_bytes() != b"not a pickle"
+
+        # So is a pickle that fails while it is being loaded
+        class _FailsToUnpickle:
+            def __reduce__(self):
+                return (int, ("not an int",))
+
+        cache_files[0].write_bytes(pickle.dumps(_FailsToUnpickle()))
+        forcefield_4 = ForceField(xml_simple_ff, parameter_cache_directory=tmp_path)
+        assert forcefield_4.to_string() == reference
+
+    def test_parameter_cache_directory_format_version(self, tmp_path, monkeypatch):
+        """
+        Test that parameters cached with another cache format version are not reused
+        """
+        from openff.toolkit.typing.engines.smirnoff import forcefield
+
+        ForceField(xml_simple_ff, parameter_cache_directory=tmp_path)
+        cache_files = set(tmp_path.glob("*.pkl"))
+
+        monkeypatch.setattr(
+            forcefield,
+            "_PARAMETER_CACHE_FORMAT_VERSION",
+            forcefield._PARAMETER_CACHE_FORMAT_VERSION + 1,
+        )
+        ForceField(xml_simple_ff, parameter_cache_directory=tmp_path)
+        new_cache_files = set(tmp_path.glob("*.pkl")) - cache_files
+        assert len(new_cache_files) == len(cache_files)
+
     def test_xml_string_roundtrip(self):
         """
         Test writing a ForceField to an XML string
@@ -1922,6 +1972,26 @@ class TestForceField:
 
         assert force_field["bogus"] is not None
 
+    def test_label_molecules_n_jobs(self):
+        """Test that labeling molecules in worker processes matches labeling them serially"""
+        force_field = ForceField("test_forcefields/test_forcefield.offxml")
+        topology = Topology.from_molecules(
+            [Molecule.from_smiles("CCO"), Molecule.from_smiles("c1ccccc1")]
+        )
+
+        serial_labels = force_field.label_molecules(topology)
+        parallel_labels = force_field.label_molecules(topology, n_jobs=2)
+
+        assert len(parallel_labels) == len(serial_labels) == 2
+        for serial, parallel in zip(serial_labels, parallel_labels):
+            assert serial.keys() == parallel.keys()
+            for tag in serial:
+                assert parallel[tag].__class__ is serial[tag].__class__
+                assert list(parallel[tag].keys()) == list(serial[tag].keys())
+                # The labels refer to the parameters of this force field, not copies
+                for key, parameter in parallel[tag].items():
+                    assert parameter is serial[tag][key]
+
 
 class TestForceFieldSerializaiton:
     def test_json_dump(self):
@@ -47,7 +47,12 @@ from openff.toolkit.topology.molecule import (
     InvalidAtomMetadataError,
     Molecule,
     SmilesParsingError,
+    _find_isomorphism_atom_map,
+    _get_isomorphism_edge_match_func,
+    _get_isomorphism_match_funcs,
     _networkx_graph_to_hill_formula,
+    _smarts_required_atomic_numbers,
+    _to_rdkit_for_atom_mapping,
 )
 from openff.toolkit.utils import get_data_file_path
 from openff.toolkit.utils.exceptions import (
@@ -1609,6 +1614,20 @@ class TestMolecule:
             "CCC[N@@](C)CC"
         )
 
+    @pytest.mark.parametrize("mol_smiles", ["C[C@H](F)CC[N@](C)CC", "C[C@H](F)CCN"])
+    def test_isomorphism_graph_strips_pyrimidal_nitrogen_stereo(self, mol_smiles):
+        """Test that only pyrimidal nitrogen stereo is left out of the isomorphism graph"""
+        mol = Molecule.from_smiles(mol_smiles)
+        original_stereo = [atom.stereochemistry for atom in mol.atoms]
+
+        graph = Molecule._to_isomorphism_graph(mol)
+
+        for atom in mol.atoms:
+            expected = None if atom.atomic_number == 7 else atom.stereochemistry
+            assert graph.nodes[atom.molecule_atom_index]["stereochemistry"] == expected
+        # The molecule itself is not modified
+        assert [atom.stereochemistry for atom in mol.atoms] == original_stereo
+
     def test_remap(self):
         """Test the remap function which should return a new molecule in the requested ordering"""
         # the order here is CCO
@@ -1661,6 +1680,78 @@ class TestMolecule:
         round_trip_ethanol = new_ethanol.remap(round_trip_mapping, current_to_new=True)
         assert_molecules_match_after_remap(round_trip_ethanol, ethanol)
 
+    def test_remap_partial_charges_and_conformers(self):
+        """Test that remap reorders the partial charges and conformers with the atoms"""
+        ethanol = create_ethanol()
+        ethanol.partial_charges = (
+            np.arange(ethanol.n_atoms, dtype=float) * unit.elementary_charge
+        )
+        ethanol._add_conformer(
+            np.arange(3 * ethanol.n_atoms, dtype=float).reshape(-1, 3) * unit.nanometer
+        )
+        new_to_current = {
+            new_index: ethanol.n_atoms - 1 - new_index
+            for new_index in range(ethanol.n_atoms)
+        }
+
+        remapped = ethanol.remap(new_to_current, current_to_new=False)
+
+        for new_index, current_index in new_to_current.items():
+            assert (
+                remapped.partial_charges[new_index]
+                == ethanol.partial_charges[current_index]
+            )
+            assert np.allclose(
+                remapped.conformers[0][new_index].m_as(unit.angstrom),
+                ethanol.conformers[0][current_index].m_as(unit.angstrom),
+            )
+
+    @pytest.mark.parametrize(
+        "smiles, expected", [("CCO", False), ("[Na+].[Cl-]", True), ("[He]", False)]
+    )
+    def test_has_multiple_molecules(self, smiles, expected):
+        """Test detecting molecules made of disconnected fragments"""
+        assert Molecule.from_smiles(smiles)._has_multiple_molecules() is expected
+        assert Molecule()._has_multiple_molecules() is False
+
+    def test_partial_charges_e(self):
+        """Test the unitless elementary-charge view of partial charges"""
+        ethanol = Molecule.from_smiles("CCO")
+        assert ethanol._partial_charges_e is None
+
+        ethanol.partial_charges = (
+            np.arange(ethanol.n_atoms, dtype=float) * 0.1 * unit.elementary_charge
+        )
+        charges = ethanol._partial_charges_e
+        assert charges.dtype == np.float64
+        assert np.allclose(charges, np.arange(ethanol.n_atoms) * 0.1)
+
+        ethanol._partial_charges_e = -charges
+        assert ethanol.partial_charges.units == unit.elementary_charge
+        assert np.allclose(
+            ethanol.partial_charges.m_as(unit.elementary_charge), -charges
+        )
+
+        with pytest.raises(ValueError, match="Expected 9 partial charges"):
+            ethanol._partial_charges_e = np.zeros(3)
+
+        ethanol._partial_charges_e = None
+        assert ethanol.partial_charges is None
+
+    def test_get_atom_invariants(self):
+        """Test that atom invariants agree for isomorphic molecules and tell isomers apart"""
+        ethanol = create_ethanol()
+        assert ethanol._get_atom_invariants() == (
+            create_reversed_ethanol()._get_atom_invariants()
+        )
+        # Cyclopropane and propene have the same formula, but different degrees
+        assert Molecule.from_smiles("C1CC1")._get_atom_invariants() != (
+            Molecule.from_smiles("C=CC")._get_atom_invariants()
+        )
+        assert Molecule.from_smiles("C[O-]")._get_atom_invariants() != (
+            Molecule.from_smiles("CO")._get_atom_invariants()
+        )
+
     @requires_openeye
     def test_canonical_ordering_openeye(self):
         """Make sure molecules are returned in canonical ordering of openeye"""
@@ -2992,6 +3083,115 @@ class TestMolecule:
             len(matches) == 0
         )  # this is the wrong stereochemistry, so there shouldn't be any matches
 
+    @pytest.mark.parametrize(
+        ("smarts", "atomic_numbers"),
+        [
+            ("[#6:1]", {6}),
+            ("[#17X1:1]-[#6:2]", {6, 17}),
+            ("[#6;$([#8]=[#6]):1]", {6}),
+            ("[#6,#7:1]", set()),
+            ("[$([#6]=O),#7:1]", set()),
+            ("[!#1:1]", set()),
+            ("[C:1]", set()),
+            ("[*:1]~[#6:2](~[#8])~[#16:3]", {6, 8, 16}),
+            ("[#1:1].[#8:2]", {1, 8}),
+        ],
+    )
+    def test_smarts_required_atomic_numbers(self, smarts, atomic_numbers):
+        """Test finding the elements a molecule must contain to match a SMARTS pattern"""
+        assert _smarts_required_atomic_numbers(smarts) == atomic_numbers
+
+    def test_isomorphism_edge_match_func(self):
+        """Test that the edge match functions compare the requested bond attributes"""
+        aromatic = {"is_aromatic": True, "bond_order": 1, "stereochemistry": None}
+        kekule = {"is_aromatic": True, "bond_order": 2, "stereochemistry": None}
+        double = {"is_aromatic": False, "bond_order": 2, "stereochemistry": "E"}
+
+        assert _get_isomorphism_edge_match_func(False, False, False) is None
+        # Matchers are built once per set of options
+        match_func = _get_isomorphism_edge_match_func(True, True, True)
+        assert _get_isomorphism_edge_match_func(True, True, True) is match_func
+
+        # Aromatic bonds match regardless of their Kekule bond order
+        assert match_func(aromatic, kekule)
+        assert not match_func(aromatic, double)
+        assert not match_func(kekule, double)
+        assert _get_isomorphism_edge_match_func(True, True, False)(kekule, double)
+        assert not _get_isomorphism_edge_match_func(False, True, False)(
+            aromatic, kekule
+        )
+        assert _get_isomorphism_edge_match_func(False, True, False)(kekule, double)
+        assert not _get_isomorphism_edge_match_func(False, False, True)(kekule, double)
+
+    @requires_rdkit
+    @pytest.mark.parametrize(
+        "smiles", ["CCO", "c1ccccc1C(=O)[O-]", "C[C@H](N)C(=O)O", "C/C=C/C"]
+    )
+    def test_find_isomorphism_atom_map(self, smiles):
+        """Test that atom maps proposed by RDKit are only kept if they are isomorphisms"""
+        molecule = Molecule.from_smiles(smiles)
+        reordered = molecule.remap(
+            {i: molecule.n_atoms - 1 - i for i in range(molecule.n_atoms)}
+        )
+        graphs = [Molecule._to_isomorphism_graph(mol) for mol in (molecule, reordered)]
+        match_funcs = _get_isomorphism_match_funcs()
+
+        vf2_atom_map = _find_isomorphism_atom_map(*graphs, *match_funcs)
+        rdkit_atom_map = _find_isomorphism_atom_map(
+            *graphs,
+            *match_funcs,
+            rdmols=tuple(
+                _to_rdkit_for_atom_mapping(mol) for mol in (molecule, reordered)
+            ),
+        )
+
+        for atom_map in (vf2_atom_map, rdkit_atom_map):
+            assert sorted(atom_map) == list(range(molecule.n_atoms))
+            assert molecule.remap(atom_map).is_isomorphic_with(reordered)
+            assert molecule.remap(atom_map)._is_exactly_the_same_as(reordered)
+
+        # The enantiomer is not isomorphic, even though RDKit may propose a map
+        if "@" in smiles:
+            enantiomer = Molecule.from_smiles(smiles.replace("@", "@@"))
+            assert (
+                _find_isomorphism_atom_map(
+                    graphs[0],
+                    Molecule._to_isomorphism_graph(enantiomer),
+                    *match_funcs,
+                    rdmols=(
+                        _to_rdkit_for_atom_mapping(molecule),
+                        _to_rdkit_for_atom_mapping(enantiomer),
+                    ),
+                )
+                is None
+            )
+
+    @requires_rdkit
+    def test_chemical_environment_matches_batch_skips_absent_elements(self):
+        """Test that batched queries for absent elements return no matches"""
+        molecule = Molecule.from_smiles("CO")
+        queries = [
+            "[#6:1]-[#8:2]",
+            "[#16:1]",
+            "[*:1]~[#16:2]",
+            "[#6:1]-[#16:2]",
+            "[#8:1]-[#1:2]",
+        ]
+
+        matches = molecule.chemical_environment_matches_batch(
+            queries, toolkit_registry=RDKitToolkitWrapper()
+        )
+
+        assert matches == [
+            molecule.chemical_environment_matches(
+                query, toolkit_registry=RDKitToolkitWrapper()
+            )
+            for query in queries
+        ]
+        assert len(matches[0]) == 1
+        assert matches[1] == matches[2] == matches[3] == []
+        assert len(matches[4]) == 1
+
     @requires_rdkit
     @requires_openeye
     @pytest.mark.slow
@@ -3246,6 +3446,20 @@ class TestMolecule:
 
         with pytest.raises(NotBondedError):
             mol.get_bond_between(hydrogens[0], hydrogens[1])
+        with pytest.raises(NotBondedError):
+            mol.get_bond_between(
+                hydrogens[0].molecule_atom_index, hydrogens[1].molecule_atom_index
+            )
+
+        # Bonds added after a lookup are found by index too
+        assert mol._get_bond_atom_index_array().shape == (mol.n_bonds, 2)
+        mol.add_bond(hydrogens[0], hydrogens[1], 1, False)
+        assert mol._get_bond_atom_index_array().tolist() == [
+            [bond.atom1_index, bond.atom2_index] for bond in mol.bonds
+        ]
+        assert mol.get_bond_between(
+            hydrogens[1].molecule_atom_index, hydrogens[0].molecule_atom_index
+        ) is mol.get_bond_between(hydrogens[0], hydrogens[1])
 
     def test_is_in_ring(self):
         """
@@ -41,6 +41,27 @@ def test_force_field_custom_handler():
     assert parameter_handler.__class__ in force_field._plugin_parameter_handler_classes
 
 
+def test_force_field_plugins_do_not_modify_handler_classes(monkeypatch):
+    """Tests that loading plugins does not append to a list of handler classes
+    passed in by the caller."""
+    from openff.toolkit.typing.engines.smirnoff import BondHandler, vdWHandler
+
+    monkeypatch.setattr(
+        "openff.toolkit.typing.engines.smirnoff.forcefield.load_handler_plugins",
+        lambda: [BondHandler],
+    )
+
+    parameter_handler_classes = [vdWHandler]
+
+    for _ in range(2):
+        force_field = ForceField(
+            parameter_handler_classes=parameter_handler_classes, load_plugins=True
+        )
+        assert force_field._plugin_parameter_handler_classes == [BondHandler]
+
+    assert parameter_handler_classes == [vdWHandler]
+
+
 def test_load_handler_plugins():
     """Tests that parameter handlers can be registered as plugins."""
 
@@ -18,8 +18,10 @@ from openff.toolkit.tests.utils import does_not_raise
 from openff.toolkit.topology import Molecule, Topology
 from openff.toolkit.typing.engines.smirnoff import ForceField
 from openff.toolkit.typing.engines.smirnoff.parameters import (
+    AngleHandler,
     BondHandler,
     ChargeIncrementModelHandler,
+    ConstraintHandler,
     ElectrostaticsHandler,
     GBSAHandler,
     ImproperTorsionHandler,
@@ -34,6 +36,7 @@ from openff.toolkit.typing.engines.smirnoff.parameters import (
     _cal_mol_a2,
     _linear_inter_or_extrapolate,
     _ParameterAttributeHandler,
+    _reorder_smirks_fragments,
     vdWHandler,
 )
 from openff.toolkit.utils.collections import ValidatedList
@@ -42,6 +45,7 @@ from openff.toolkit.utils.exceptions import (
     IncompatibleParameterError,
     IncompatibleUnitError,
     MissingIndexedAttributeError,
+    NotBondedError,
     NotEnoughPointsForInterpolationError,
     ParameterLookupError,
     SMIRNOFFSpecError,
@@ -322,6 +326,29 @@ class TestInterpolation:
         assert k.m < 0
 
 
+def test_reorder_smirks_fragments():
+    """Test that the fragments of a SMIRKS are ordered from longest to shortest"""
+    assert _reorder_smirks_fragments("[#6:1]-[#6:2]") == "[#6:1]-[#6:2]"
+    assert (
+        _reorder_smirks_fragments("[#8:3].[#6:1]-[#6:2]-[#1]")
+        == "[#6:1]-[#6:2]-[#1].[#8:3]"
+    )
+    # Dots in recursive SMARTS and component-level groups do not split fragments
+    assert (
+        _reorder_smirks_fragments("[$(C.O):1].([#6:2]-[#6].[#8])")
+        == "([#6:2]-[#6].[#8]).[$(C.O):1]"
+    )
+
+
+def test_reorder_smirks_fragments_matches():
+    """Test that reordering fragments does not change the matched atoms"""
+    molecule = Molecule.from_smiles("CCO.N")
+    smirks = "[#7:3].[#6:1]-[#8:2]"
+    assert molecule.chemical_environment_matches(
+        smirks
+    ) == molecule.chemical_environment_matches(_reorder_smirks_fragments(smirks))
+
+
 class TestParameterAttributeHandler:
     """Test suite for the base class _ParameterAttributeHandler."""
 
@@ -462,6 +489,20 @@ class TestParameterHandler:
         bh = BondHandler(skip_version_check=True)
         assert bh.TAGNAME == "Bonds"
 
+    def test_lookup_after_smirks_reassignment(self):
+        """Test that SMIRKS lookups follow a parameter whose SMIRKS is reassigned"""
+        bh = BondHandler(skip_version_check=True)
+        for id, smirks in [("a", "[#6:1]-[#7:2]"), ("b", "[#6:1]-[#8:2]")]:
+            bh.add_parameter(
+                {"smirks": smirks, "length": self.length, "k": self.k, "id": id}
+            )
+        assert bh.parameters.index("[#6:1]-[#8:2]") == 1
+
+        bh.parameters[0].smirks = "[#6:1]-[#8:2]"
+        assert bh.parameters.index("[#6:1]-[#8:2]") == 0
+        assert bh["[#6:1]-[#8:2]"].id == "a"
+        assert "[#6:1]-[#7:2]" not in bh.parameters
+
     def test_add_parameter(self):
         """Test the behavior of add_parameter"""
         bh = BondHandler(skip_version_check=True)
@@ -745,6 +786,64 @@ class TestParameterHandler:
         assert "pilot" not in param_dict
         assert not (bh.attribute_is_cosmetic("pilot"))
 
+    def test_assert_correct_connectivity(self):
+        """Test that ParameterHandler._assert_correct_connectivity checks bonds of the matched atoms"""
+        handler = AngleHandler(skip_version_check=True)
+        handler.add_parameter(
+            {
+                "smirks": "[*:1]~[*:2]~[*:3]",
+                "angle": 109.5 * unit.degree,
+                "k": 100 * unit.kilocalorie / unit.mole / unit.degree**2,
+            }
+        )
+
+        molecule = Molecule.from_smiles("CCO")
+        matches = handler.find_matches(molecule.to_topology())
+        assert len(matches) == molecule.n_angles
+
+        for match in matches.values():
+            handler._assert_correct_connectivity(match, [(0, 1), (1, 2)])
+            handler._assert_correct_connectivity(match, [(2, 1), (1, 0)])
+
+            with pytest.raises(NotBondedError, match="No bond between atom"):
+                handler._assert_correct_connectivity(match, [(0, 2)])
+
+    def test_find_matches_expected_connectivity(self):
+        """Test that find_matches checks the connectivity of the matches when requested"""
+        angle_handler = AngleHandler(skip_version_check=True)
+        angle_handler.add_parameter(
+            {
+                "smirks": "[*:1]~[*:2]~[*:3]",
+                "angle": 109.5 * unit.degree,
+                "k": 100 * unit.kilocalorie / unit.mole / unit.degree**2,
+            }
+        )
+        topology = Molecule.from_smiles("CCO").to_topology()
+
+        matches = angle_handler.find_matches(
+            topology, expected_connectivity=[(0, 1), (1, 2)]
+        )
+        assert matches.keys() == angle_handler.find_matches(topology).keys()
+
+        with pytest.raises(NotBondedError, match="No bond between atom"):
+            angle_handler.find_matches(topology, expected_connectivity=[(0, 2)])
+
+        # Constraints may be between atoms that are not bonded, e.g. in rigid water
+        constraint_handler = ConstraintHandler(skip_version_check=True)
+        constraint_handler.add_parameter({"smirks": "[#1:1]-[#8X2H2]-[#1:2]"})
+        water = Molecule.from_smiles("O").to_topology()
+
+        assert len(constraint_handler.find_matches(water)) == 1
+        with pytest.raises(NotBondedError, match="No bond between atom"):
+            constraint_handler.find_matches(water, expected_connectivity=[(0, 1)])
+
+        # Matches of every copy of a molecule are checked
+        waters = Topology.from_molecules([Molecule.from_smiles("O")] * 3)
+        matches = constraint_handler.find_matches(waters)
+        assert len(matches) == 3
+        with pytest.raises(NotBondedError, match="No bond between atom"):
+            ParameterHandler._assert_all_correct_connectivity(matches, [(0, 1)])
+
     def test_get_parameter(self):
         """Test that ParameterHandler.get_parameter can lookup function"""
         bh = BondHandler(skip_version_check=True, allow_cosmetic_attributes=True)
@@ -840,6 +939,18 @@ class TestParameterList:
         assert parameters[0].smirks == "[*X4:1]"
         assert p1.smirks == "[*X4:1]"
 
+    def test_get_by_smirks(self):
+        """Test the ParameterList SMIRKS accessor that bypasses __getitem__ dispatch."""
+        p1 = ParameterType(smirks="[*:1]")
+        p2 = ParameterType(smirks="[#1:1]")
+        parameters = ParameterList([p1, p2])
+        assert parameters.get_by_smirks("[*:1]") is p1
+        assert parameters.get_by_smirks("[#1:1]") is p2
+        with pytest.raises(
+            ParameterLookupError, match=r"SMIRKS \[#2:1\] not found in ParameterList"
+        ):
+            parameters.get_by_smirks("[#2:1]")
+
     def test_index(self):
         """
         Tests the ParameterList.index() function by attempting lookups by SMIRKS and by ParameterType equivalence.
@@ -864,6 +975,35 @@ class TestParameterList:
         with pytest.raises(ValueError, match="is not in list"):
             parameters.index(p4)
 
+    def test_index_after_mutation(self):
+        """Test that SMIRKS lookups stay correct after the list or its parameters change."""
+        p1 = ParameterType(smirks="[*:1]")
+        p2 = ParameterType(smirks="[#1:1]")
+        p3 = ParameterType(smirks="[#7:1]")
+        parameters = ParameterList([p1, p2])
+        assert parameters.index("[#1:1]") == 1
+
+        parameters.insert(0, p3)
+        assert parameters.index("[#7:1]") == 0
+        assert parameters.index("[#1:1]") == 2
+
+        del parameters["[#7:1]"]
+        assert parameters.index("[*:1]") == 0
+        assert "[#7:1]" not in parameters
+
+        p2.smirks = "[#6:1]"
+        assert "[#1:1]" not in parameters
+        assert parameters.index("[#6:1]") == 1
+
+        parameters[0] = p3
+        assert "[*:1]" not in parameters
+        assert parameters.index("[#7:1]") == 0
+
+        # With duplicated SMIRKS, lookups return the first occurrence.
+        p2.smirks = "[#7:1]"
+        assert parameters.index("[#7:1]") == 0
+        assert "[#6:1]" not in parameters
+
     def test_contains(self):
         """Test ParameterList __contains__ overloading."""
         p1 = ParameterType(smirks="[*:1]")
@@ -951,6 +1091,15 @@ class TestParameterList:
         assert "[*:1]=[*:2]" in param_list1
         assert param_list1[-1] == p2
 
+        # Plain iterables of parameters are accepted too
+        p3 = ParameterType(smirks="[*:1]#[*:2]")
+        param_list1.extend(p for p in [p3])
+        assert param_list1.index("[*:1]#[*:2]") == 2
+
+        with pytest.raises(TypeError, match="expected an iterable of ParameterType"):
+            param_list1.extend(["[*:1]~[*:2]"])
+        assert len(param_list1) == 3
+
     def test_to_list(self):
         """Test basic ParameterList.to_list() function, ensuring units are preserved"""
         p1 = BondHandler.BondType(
@@ -1091,6 +1240,29 @@ class TestParameterType:
         assert "pilot" not in param_dict
         assert not (my_par.attribute_is_cosmetic("pilot"))
 
+    def test_re_add_cosmetic_attribute(self):
+        """
+        Test that adding an existing cosmetic attribute again updates it in place
+        without duplicating it or changing its position in the output
+        """
+
+        class MyParameter(ParameterType):
+            required = ParameterAttribute()
+
+        my_par = MyParameter(smirks="[*:1]", required="aaa")
+        my_par.add_cosmetic_attribute("pilot", "alice")
+        my_par.add_cosmetic_attribute("copilot", "bob")
+        my_par.add_cosmetic_attribute("pilot", "carol")
+
+        param_dict = my_par.to_dict()
+        assert list(param_dict)[-2:] == ["pilot", "copilot"]
+        assert param_dict["pilot"] == "carol"
+
+        # A single deletion removes the attribute entirely
+        my_par.delete_cosmetic_attribute("pilot")
+        assert not my_par.attribute_is_cosmetic("pilot")
+        assert "pilot" not in my_par.to_dict()
+
     def test_indexed_attrs(self):
         """ParameterType handles indexed attributes correctly."""
 
@@ -1443,6 +1615,30 @@ class TestBondHandler:
 
         ff_v3._load_smirnoff_data(ff_v4._to_smirnoff_data())
 
+    def test_find_matches_last_parameter_wins(self):
+        """Test that later bond parameters take precedence over earlier ones"""
+        handler = BondHandler(skip_version_check=True)
+
+        for smirks in ["[*:1]~[*:2]", "[#6:1]-[*:2]", "[#6:1]-[#8:2]"]:
+            handler.add_parameter(
+                {
+                    "smirks": smirks,
+                    "length": 1.0 * unit.angstrom,
+                    "k": 5 * unit.kilocalorie / unit.mole / unit.angstrom**2,
+                }
+            )
+
+        topology = Molecule.from_mapped_smiles(
+            "[C:1]([O:2][H:3])([H:4])([H:5])[H:6]"
+        ).to_topology()
+        matches = handler.find_matches(topology)
+
+        assert len(matches) == topology.n_bonds
+        assert matches[(0, 1)].parameter_type.smirks == "[#6:1]-[#8:2]"
+        assert matches[(1, 0)].parameter_type.smirks == "[#6:1]-[#8:2]"
+        assert matches[(0, 3)].parameter_type.smirks == "[#6:1]-[*:2]"
+        assert matches[(1, 2)].parameter_type.smirks == "[*:1]~[*:2]"
+
 
 class TestProperTorsionType:
     """Tests for the ProperTorsionType class."""
@@ -1714,6 +1910,27 @@ class TestProperTorsionHandler:
             potential="k*(1+cos(periodicity*theta-phase))", skip_version_check=True
         )
 
+    @pytest.mark.parametrize(
+        "handler_class", [ProperTorsionHandler, ImproperTorsionHandler]
+    )
+    def test_default_idivf_converter(self, handler_class):
+        """Test that default_idivf is validated and converted when it is set"""
+        assert handler_class(skip_version_check=True).default_idivf == "auto"
+
+        handler = handler_class(default_idivf="2", skip_version_check=True)
+        assert handler.default_idivf == "2"
+        assert handler.to_dict()["default_idivf"] == "2"
+        handler.check_handler_compatibility(
+            handler_class(default_idivf=2.0, skip_version_check=True)
+        )
+        with pytest.raises(IncompatibleParameterError):
+            handler.check_handler_compatibility(
+                handler_class(default_idivf=3, skip_version_check=True)
+            )
+
+        with pytest.raises(SMIRNOFFSpecError, match="Only 'auto' or a number"):
+            handler.default_idivf = "automatic"
+
 
 class TestvdWHandler:
     def test_add_param_str(self):
@@ -1753,6 +1970,27 @@ class TestvdWHandler:
         with pytest.raises(SMIRNOFFSpecError, match="unable to handle scale15"):
             handler.scale15 = 0.1
 
+    def test_check_handler_compatibility(self):
+        """Test that vdW handlers are compared exactly or up to a tolerance"""
+        handler = vdWHandler(version=0.3)
+        handler.check_handler_compatibility(vdWHandler(version=0.3))
+        handler.check_handler_compatibility(vdWHandler(version=0.3, scale14=0.5 + 1e-7))
+
+        with pytest.raises(IncompatibleParameterError, match="scale14"):
+            handler.check_handler_compatibility(vdWHandler(version=0.3, scale14=0.8))
+
+        with pytest.raises(IncompatibleParameterError, match="method"):
+            handler.check_handler_compatibility(vdWHandler(version=0.3, method="PME"))
+
+        # Quantities in different but compatible units are compared by magnitude
+        handler.check_handler_compatibility(
+            vdWHandler(version=0.3, cutoff=0.9 * unit.nanometer)
+        )
+        with pytest.raises(IncompatibleParameterError, match="cutoff"):
+            handler.check_handler_compatibility(
+                vdWHandler(version=0.3, cutoff=1.0 * unit.nanometer)
+            )
+
 
 class TestvdWType:
     """
@@ -1814,6 +2052,18 @@ class TestElectrostaticsHandler:
         ):
             handler.solvent_dielectric = 78.3
 
+    def test_switch_width(self):
+        handler = ElectrostaticsHandler(version=0.4)
+        handler.switch_width = 0.0 * unit.angstrom
+        handler.switch_width = 0.0 * unit.nanometer
+        handler.switch_width = None
+
+        with pytest.raises(
+            SMIRNOFFSpecUnimplementedError,
+            match="does not support an electrostatic switch width",
+        ):
+            handler.switch_width = 1.0 * unit.angstrom
+
     def test_unknown_periodic_potential(self):
         handler = ElectrostaticsHandler(version=0.4)
 
@@ -1868,6 +2118,15 @@ class TestElectrostaticsHandlerUpconversion:
         assert handler.nonperiodic_potential == "Coulomb"
         assert handler.exception_potential == "Coulomb"
 
+    def test_upconversion_default_method(self):
+        """The 0.3 default method (PME) is up-converted when no method is given"""
+        handler = ElectrostaticsHandler(version=0.3)
+        assert handler.version == Version("0.4")
+        assert handler.periodic_potential == "Ewald3D-ConductingBoundary"
+
+        with pytest.raises(NotImplementedError, match="method=LJPME"):
+            ElectrostaticsHandler(version=0.3, method="LJPME")
+
     def test_invalid_0_4_kwargs(self):
         with pytest.raises(SMIRNOFFSpecError, match="removed in version 0.4 of the E"):
             ElectrostaticsHandler(version=0.4, method="PME")
@@ -2592,6 +2851,23 @@ class TestGBSAHandler:
         assert gbsa_handler.surface_area_penalty == 5.4 * _cal_mol_a2
         assert gbsa_handler.solvent_radius == 1.4 * unit.angstrom
 
+    def test_check_handler_compatibility(self):
+        """Test that GBSA handlers are only compatible if they use the same models"""
+        gbsa_handler = GBSAHandler(skip_version_check=True)
+        gbsa_handler.check_handler_compatibility(gbsa_handler)
+        gbsa_handler.check_handler_compatibility(
+            GBSAHandler(skip_version_check=True, solvent_dielectric=78.5 + 1e-7)
+        )
+
+        with pytest.raises(IncompatibleParameterError, match="gb_model"):
+            gbsa_handler.check_handler_compatibility(
+                GBSAHandler(skip_version_check=True, gb_model="HCT")
+            )
+        with pytest.raises(IncompatibleParameterError, match="sa_model"):
+            gbsa_handler.check_handler_compatibility(
+                GBSAHandler(skip_version_check=True, sa_model=None)
+            )
+
     def test_gbsahandler_setters(self):
         """Test creation of an empty GBSAHandler, with all default attributes"""
         gbsa_handler = GBSAHandler(skip_version_check=True)
@@ -3280,6 +3280,30 @@ class TestRDKitToolkitWrapper:
         assert len(ret) == 5998
         assert len(ret[0]) == 2
 
+    def test_find_smarts_matches_caches_parsed_queries(self):
+        """Test that RDKitToolkitWrapper reuses parsed SMARTS queries across molecules"""
+        from openff.toolkit.utils.rdkit_wrapper import _compile_smarts
+
+        tk = RDKitToolkitWrapper()
+        query = "[#6:1]-[#8:2]"
+
+        _compile_smarts.cache_clear()
+        ethanol = tk.from_smiles("CCO")
+        methanol = tk.from_smiles("CO")
+        assert tk.find_smarts_matches(ethanol, query) == [(1, 2)]
+        assert tk.find_smarts_matches(methanol, query) == [(0, 1)]
+        assert _compile_smarts.cache_info().misses == 1
+
+        assert tk.find_smarts_matches_batch(ethanol, [query, "[#6:1]-[#6:2]"]) == [
+            tk.find_smarts_matches(ethanol, query),
+            tk.find_smarts_matches(ethanol, "[#6:1]-[#6:2]"),
+        ]
+
+        # Parse failures are not cached
+        for _ in range(2):
+            with pytest.raises(ValueError, match="could not parse"):
+                tk.find_smarts_matches(ethanol, "[#6:1]-[#8:2")
+
         # TODO: Add test for higher bonds orders
         # TODO: Add test for aromaticity
         # TODO: Add test and molecule functionality for isotopes
@@ -278,6 +278,37 @@ class TestTopology:
         with pytest.raises(Exception):
             topology.atom(8)
 
+    def test_get_atom_and_bond_multiple_molecules(self):
+        """Test that atom and bond lookups by index follow molecules added to the topology"""
+        topology = Topology.from_molecules(
+            [ethane_from_smiles(), Molecule.from_smiles("O")]
+        )
+        assert [topology.atom(i) for i in range(11)] == list(topology.atoms)
+        assert [topology.bond(i) for i in range(9)] == list(topology.bonds)
+
+        topology.add_molecule(ethene_from_smiles())
+        assert [topology.atom(i) for i in range(17)] == list(topology.atoms)
+        assert [topology.bond(i) for i in range(14)] == list(topology.bonds)
+
+        with pytest.raises(Exception):
+            topology.atom(17)
+        with pytest.raises(Exception):
+            topology.bond(14)
+
+    def test_get_atom_and_bond_after_molecule_modified(self):
+        """Test that atom and bond lookups by index follow molecules modified in place"""
+        topology = Topology.from_molecules(
+            [ethane_from_smiles(), Molecule.from_smiles("O")]
+        )
+        assert topology.bond(7).molecule is topology.molecule(1)
+
+        ethane = topology.molecule(0)
+        ethane.add_atom(1, 0, False)
+        ethane.add_bond(0, 8, 1, False)
+        assert [topology.atom(i) for i in range(12)] == list(topology.atoms)
+        assert [topology.bond(i) for i in range(10)] == list(topology.bonds)
+        assert topology.bond(7).molecule is ethane
+
     def test_atom_index(self):
         topology = create_ethanol().to_topology()
 
@@ -1386,6 +1417,31 @@ class TestTopology:
         assert_cyclohexane_is_grouped_correctly(groupings)
         assert_last_ethanol_is_grouped_correctly(groupings)
 
+    def test_group_chemically_identical_isomers(self):
+        """Test grouping reordered copies of isomers, which are compared with more than one reference"""
+        ethanol = create_ethanol()
+        dimethyl_ether = Molecule.from_smiles("COC")
+        reversed_ether = dimethyl_ether.remap(
+            {i: dimethyl_ether.n_atoms - 1 - i for i in range(dimethyl_ether.n_atoms)}
+        )
+        topology = Topology.from_molecules(
+            [ethanol, dimethyl_ether, create_reversed_ethanol(), reversed_ether]
+        )
+
+        groupings = topology.identical_molecule_groups
+
+        assert sorted(groupings) == [0, 1]
+        assert [mol_idx for mol_idx, _ in groupings[0]] == [0, 2]
+        assert [mol_idx for mol_idx, _ in groupings[1]] == [1, 3]
+        for unique_mol_idx, group in groupings.items():
+            unique_mol = topology.molecule(unique_mol_idx)
+            for mol_idx, atom_map in group:
+                molecule = topology.molecule(mol_idx)
+                for bond in unique_mol.bonds:
+                    assert molecule.get_bond_between(
+                        atom_map[bond.atom1_index], atom_map[bond.atom2_index]
+                    )
+
     @requires_openeye
     def test_chemical_environments_matches_OE(self):
         """Test Topology.chemical_environment_matches"""
@@ -1454,6 +1510,47 @@ class TestTopology:
         )
         assert len(matches) == 0
 
+    @requires_rdkit
+    def test_chemical_environment_matches_batch(self):
+        """Test that Topology.chemical_environment_matches_batch agrees with per-query matching"""
+        toolkit_wrapper = RDKitToolkitWrapper()
+        topology = Topology.from_molecules(
+            [
+                Molecule.from_smiles("CCO"),
+                Molecule.from_smiles("C1CCCCC1"),
+                Molecule.from_smiles("OCC"),
+            ]
+        )
+        queries = ["[C:1]-[C:2]-[O:3]", "[#6:1]-[#1:2]", "[C][C:1]-[C:2]-[O:3]"]
+
+        batch = topology.chemical_environment_matches_batch(
+            queries, toolkit_registry=toolkit_wrapper
+        )
+        assert len(batch) == len(queries)
+
+        for query, batch_matches in zip(queries, batch):
+            single_matches = topology.chemical_environment_matches(
+                query, toolkit_registry=toolkit_wrapper
+            )
+            assert [match.topology_atom_indices for match in batch_matches] == [
+                match.topology_atom_indices for match in single_matches
+            ]
+
+        assert len(batch[0]) == 2
+        assert len(batch[2]) == 0
+
+        parallel_batch = topology.chemical_environment_matches_batch(
+            queries, toolkit_registry=toolkit_wrapper, n_jobs=2
+        )
+        for batch_matches, parallel_matches in zip(batch, parallel_batch):
+            assert [
+                (match.reference_atom_indices, match.topology_atom_indices)
+                for match in parallel_matches
+            ] == [
+                (match.reference_atom_indices, match.topology_atom_indices)
+                for match in batch_matches
+            ]
+
     def test_topology_hierarchy_iterators(
         self,
     ):
@@ -1595,6 +1692,27 @@ class TestAddTopology:
             1.234, unit.angstrom
         )
 
+    def test_get_bond_and_angle_atom_indices(self):
+        """Test that the batched bond and angle indices match the per-term iterators"""
+        topology = Topology.from_molecules(
+            [create_ethanol(), Molecule.from_smiles("O"), create_ethanol()]
+        )
+
+        bond_indices = topology._get_bond_atom_indices()
+        assert bond_indices.shape == (topology.n_bonds, 2)
+        assert bond_indices.tolist() == [
+            [topology.atom_index(bond.atom1), topology.atom_index(bond.atom2)]
+            for bond in topology.bonds
+        ]
+
+        angle_indices = topology._get_angle_atom_indices()
+        assert angle_indices.shape == (topology.n_angles, 3)
+        assert angle_indices.tolist() == [
+            [topology.atom_index(atom) for atom in angle] for angle in topology.angles
+        ]
+
+        assert Topology()._get_bond_atom_indices().shape == (0, 2)
+
 
 class TestTopologySerialization:
     @pytest.fixture
@@ -1733,6 +1851,24 @@ def test_tagsorted_dict_multiple_keys(tsd):
     assert len(tsd) == 2  # should not be 3
 
 
+@pytest.mark.parametrize(
+    "transformed_dict",
+    [
+        TagSortedDict({(2, 0, 1): 5, (1, 2): 4}),
+        ValenceDict({(2, 0, 1): 5, (1, 2): 4}),
+    ],
+)
+def test_transformed_dict_items_values(transformed_dict):
+    """Test that items and values follow the order of the stored keys"""
+    keys = list(transformed_dict)
+    assert list(transformed_dict.items()) == [
+        (key, transformed_dict[key]) for key in keys
+    ]
+    assert list(transformed_dict.values()) == [transformed_dict[key] for key in keys]
+    assert len(transformed_dict.items()) == len(transformed_dict.values()) == 2
+    assert (keys[0], transformed_dict[keys[0]]) in transformed_dict.items()
+
+
 @pytest.mark.parametrize("tsd", [TagSortedDict({(0, 1, 2): 5, (1, 2): 4})])
 def test_tagsorted_dict_clear(tsd):
     """Test the clear method"""
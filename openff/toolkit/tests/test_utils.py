@@ -94,3 +94,30 @@ def test_sort_smirnoff_dict():
     assert smirnoff_dict == OrderedDict(
         sort_smirnoff_dict(forcefield._to_smirnoff_data())
     )
+
+
+def test_convert_all_strings_to_quantity():
+    from openff.toolkit.utils.utils import convert_all_strings_to_quantity
+
+    smirnoff_data = {
+        "Bonds": {
+            "potential": "harmonic",
+            "Bond": [
+                {"smirks": "[#6:1]-[#6:2]", "length": "1.5 * angstrom", "k": 2},
+                {"smirks": "[#6:1]-[#1:2]", "length": "1.5 * angstrom", "k": 2.0},
+            ],
+        }
+    }
+
+    converted = convert_all_strings_to_quantity(smirnoff_data, ignore_keys=["smirks"])
+
+    bonds = converted["Bonds"]["Bond"]
+    assert converted["Bonds"]["potential"] == "harmonic"
+    assert bonds[0]["smirks"] == "[#6:1]-[#6:2]"
+    assert bonds[0]["length"] == 1.5 * unit.angstrom
+    assert bonds[1]["k"] == 2.0
+
+    # Repeated strings must not be converted to a shared (mutable) Quantity
+    assert bonds[0]["length"] is not bonds[1]["length"]
+    bonds[0]["length"].ito(unit.nanometer)
+    assert bonds[1]["length"].units == unit.angstrom
@@ -122,6 +122,24 @@ class TestValidatedList(TestValidatedMixin):
         with pytest.raises(TypeError, match="value is not positive"):
             vlist.insert(1, 0)
 
+    def test_already_validated(self):
+        """Converters and validators are not run on pre-validated initial elements."""
+
+        def is_positive(value):
+            if value <= 0:
+                raise TypeError("value is not positive")
+
+        vlist = ValidatedList(
+            [1, "2"], converter=int, validator=is_positive, already_validated=True
+        )
+        assert vlist == [1, "2"]
+
+        # Elements added after initialization are still converted and validated.
+        vlist.append("3")
+        assert vlist[-1] == 3
+        with pytest.raises(TypeError, match="value is not positive"):
+            vlist.append(-1)
+
     def test_multiple_converters(self):
         """Multiple converters of ValidatedList are called in order."""
         vlist = ValidatedList([1, 2, -3], converter=[abs, str])
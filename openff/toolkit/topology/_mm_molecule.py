@@ -11,6 +11,8 @@ TypedMolecule TODOs
 """
 from typing import TYPE_CHECKING, Dict, List, NoReturn, Optional, Union
 
+import numpy as np
+from numpy.typing import NDArray
 from openff.units import unit
 from openff.units.elements import MASSES, SYMBOLS
 
@@ -83,6 +85,12 @@ class _SimpleMolecule:
     def bond(self, index):
         return self.bonds[index]
 
+    def _get_bond_atom_index_array(self) -> NDArray:
+        return np.array(
+            [(bond.atom1_index, bond.atom2_index) for bond in self.bonds],
+            dtype=np.int32,
+        ).reshape(-1, 2)
+
     def get_bond_between(self, atom1_index, atom2_index):
         atom1 = self.atom(atom1_index)
         atom2 = self.atom(atom2_index)
@@ -24,17 +24,21 @@ Molecular chemical entity representation and routines to interface with cheminfo
    * Speed up overall import time by putting non-global imports only where they are needed
 
 """
+import functools
 import json
 import operator
 import pathlib
+import re
 import warnings
 from collections import UserDict
 from copy import deepcopy
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     DefaultDict,
     Dict,
+    FrozenSet,
     Generator,
     List,
     Optional,
@@ -46,6 +50,7 @@ from typing import (
 
 import networkx as nx
 import numpy as np
+from numpy.typing import NDArray
 from openff.units import unit
 from openff.units.elements import MASSES, SYMBOLS
 from openff.utilities.exceptions import MissingOptionalDependencyError
@@ -672,11 +677,12 @@ class Bond(Serializable):
 
     @property
     def atom1_index(self):
-        return self.molecule.atoms.index(self._atom1)
+        # Use the atom's cached index rather than searching the molecule's atoms.
+        return self._atom1.molecule_atom_index
 
     @property
     def atom2_index(self):
-        return self.molecule.atoms.index(self._atom2)
+        return self._atom2.molecule_atom_index
 
     @property
     def atoms(self):
@@ -1108,7 +1114,7 @@ class FrozenMolecule(Serializable):
             molecule_dict["partial_charges_unit"] = None
 
         else:
-            charges_unitless = self._partial_charges.m_as(unit.elementary_charge)
+            charges_unitless = self._partial_charges_e
             charges_serialized, charges_shape = serialize_numpy(charges_unitless)
             molecule_dict["partial_charges"] = charges_serialized
             molecule_dict["partial_charges_unit"] = "elementary_charge"
@@ -1800,6 +1806,29 @@ class FrozenMolecule(Serializable):
                 return False
         return True
 
+    def _get_atom_invariants(self) -> Tuple[Tuple[int, int, bool, int], ...]:
+        """
+        Return the sorted atomic number, formal charge, aromaticity and degree of each atom.
+
+        Molecules that are isomorphic under the default (strictest) options of
+        ``are_isomorphic`` have equal invariants, so comparing them is a cheap way to rule
+        out isomorphism before matching the molecular graphs.
+        """
+        degrees = np.bincount(
+            self._get_bond_atom_index_array().ravel(), minlength=self.n_atoms
+        ).tolist()
+        return tuple(
+            sorted(
+                (
+                    atom.atomic_number,
+                    atom.formal_charge.m,
+                    atom.is_aromatic,
+                    degree,
+                )
+                for atom, degree in zip(self.atoms, degrees)
+            )
+        )
+
     @staticmethod
     def are_isomorphic(
         mol1: Union["FrozenMolecule", nx.Graph],
@@ -1920,95 +1949,74 @@ class FrozenMolecule(Serializable):
             if mol1._is_exactly_the_same_as(mol2):
                 return True, {i: i for i in range(mol1.n_atoms)}
 
-        # Build the user defined matching functions
-        def node_match_func(x, y):
-            # always match by atleast atomic number
-            is_equal = x["atomic_number"] == y["atomic_number"]
-            if aromatic_matching:
-                is_equal &= x["is_aromatic"] == y["is_aromatic"]
-            if formal_charge_matching:
-                is_equal &= x["formal_charge"] == y["formal_charge"]
-            if atom_stereochemistry_matching:
-                is_equal &= x["stereochemistry"] == y["stereochemistry"]
-            return is_equal
-
-        # check if we want to do any bond matching if not the function is None
-        if aromatic_matching or bond_order_matching or bond_stereochemistry_matching:
+        # Get the user defined matching functions, which are built once per set of
+        # options and only compare the attributes those options ask for
+        node_match_func, edge_match_func = _get_isomorphism_match_funcs(
+            aromatic_matching,
+            formal_charge_matching,
+            bond_order_matching,
+            atom_stereochemistry_matching,
+            bond_stereochemistry_matching,
+        )
 
-            def edge_match_func(x, y):
-                # We don't need to check the exact bond order (which is 1 or 2)
-                # if the bond is aromatic. This way we avoid missing a match only
-                # if the alternate bond orders 1 and 2 are assigned differently.
-                if aromatic_matching and bond_order_matching:
-                    is_equal = (x["is_aromatic"] == y["is_aromatic"]) or (
-                        x["bond_order"] == y["bond_order"]
-                    )
-                elif aromatic_matching:
-                    is_equal = x["is_aromatic"] == y["is_aromatic"]
-                elif bond_order_matching:
-                    is_equal = x["bond_order"] == y["bond_order"]
-                else:
-                    is_equal = None
-                if bond_stereochemistry_matching:
-                    if is_equal is None:
-                        is_equal = x["stereochemistry"] == y["stereochemistry"]
-                    else:
-                        is_equal &= x["stereochemistry"] == y["stereochemistry"]
+        mol1_netx = FrozenMolecule._to_isomorphism_graph(
+            mol1, strip_pyrimidal_n_atom_stereo, toolkit_registry
+        )
+        mol2_netx = FrozenMolecule._to_isomorphism_graph(
+            mol2, strip_pyrimidal_n_atom_stereo, toolkit_registry
+        )
 
-                return is_equal
+        atom_map = _find_isomorphism_atom_map(
+            mol1_netx, mol2_netx, node_match_func, edge_match_func
+        )
 
+        if atom_map is None:
+            return False, None
+        elif return_atom_map:
+            return True, atom_map
         else:
-            edge_match_func = None  # type: ignore
-
-        # Here we should work out what data type we have, also deal with lists?
-        def to_networkx(data):
-            """For the given data type, return the networkx graph"""
-            import networkx as nx
+            return True, None
 
-            if strip_pyrimidal_n_atom_stereo:
-                SMARTS = "[N+0X3:1](-[*])(-[*])(-[*])"
+    @staticmethod
+    def _to_isomorphism_graph(
+        data: Union["FrozenMolecule", nx.Graph],
+        strip_pyrimidal_n_atom_stereo: bool = True,
+        toolkit_registry=GLOBAL_TOOLKIT_REGISTRY,
+    ) -> nx.Graph:
+        """
+        Return the graph ``are_isomorphic`` compares for a molecule or graph.
 
-            if isinstance(data, FrozenMolecule):
-                # Molecule class instance
-                if strip_pyrimidal_n_atom_stereo:
-                    # Make a copy of the molecule so we don't modify the original
-                    data: FrozenMolecule = deepcopy(data)
-                    data.strip_atom_stereochemistry(
-                        SMARTS, toolkit_registry=toolkit_registry
-                    )
-                return data.to_networkx()
+        Callers that compare one molecule against many others can build its graph
+        once with this method and pass the graph to ``are_isomorphic`` instead.
+        """
+        import networkx as nx
 
-            elif isinstance(data, nx.Graph):
-                return data
+        if strip_pyrimidal_n_atom_stereo:
+            SMARTS = "[N+0X3:1](-[*])(-[*])(-[*])"
 
-            else:
-                raise NotImplementedError(
-                    f"The input type {type(data)} is not supported,"
-                    f"please supply an openff.toolkit.topology.molecule.Molecule "
-                    f"or networkx.Graph representation of the molecule."
+        if isinstance(data, FrozenMolecule):
+            # Molecule class instance. Only nitrogens with defined stereochemistry can be
+            # stripped, so most molecules skip the copy and the substructure search.
+            if strip_pyrimidal_n_atom_stereo and any(
+                atom.atomic_number == 7 and atom.stereochemistry is not None
+                for atom in data.atoms
+            ):
+                # Make a copy of the molecule so we don't modify the original
+                data = deepcopy(data)
+                data.strip_atom_stereochemistry(
+                    SMARTS, toolkit_registry=toolkit_registry
                 )
+            return data.to_networkx()
 
-        mol1_netx = to_networkx(mol1)
-        mol2_netx = to_networkx(mol2)
-        from networkx.algorithms.isomorphism import GraphMatcher  # type: ignore
-
-        GM = GraphMatcher(
-            mol1_netx, mol2_netx, node_match=node_match_func, edge_match=edge_match_func
-        )
-        isomorphic = GM.is_isomorphic()
-
-        if isomorphic and return_atom_map:
-            topology_atom_map = GM.mapping
-
-            # reorder the mapping by keys
-            sorted_mapping = {}
-            for key in sorted(topology_atom_map.keys()):
-                sorted_mapping[key] = topology_atom_map[key]
-
-            return isomorphic, sorted_mapping
+        elif isinstance(data, nx.Graph):
+            return data
 
         else:
-            return isomorphic, None
+            raise NotImplementedError(
+                f"The input type {type(data)} is not supported,"
+                f"please supply an openff.toolkit.topology.molecule.Molecule "
+                f"or networkx.Graph representation of the molecule."
+            )
 
     def is_isomorphic_with(self, other: Union["FrozenMolecule", nx.Graph], **kwargs):
         """
@@ -2566,6 +2574,8 @@ class FrozenMolecule(Serializable):
         self._cached_smiles = None
         # TODO: Clear fractional bond orders
         self._ordered_connection_table_hash = None
+        self._bonds_by_atom_index_pair = None
+        self._bond_atom_index_array = None
         for atom in self.atoms:
             if "_molecule_atom_index" in atom.__dict__:
                 del atom.__dict__["_molecule_atom_index"]
@@ -2832,6 +2842,10 @@ class FrozenMolecule(Serializable):
             fractional_bond_order=fractional_bond_order,
         )
         self._bonds.append(bond)
+        # The bonds by atom index pair are out of date even if the rest of the
+        # cache is not invalidated.
+        self._bonds_by_atom_index_pair = None
+        self._bond_atom_index_array = None
         if invalidate_cache:
             self._invalidate_cached_properties()
 
@@ -2951,6 +2965,33 @@ class FrozenMolecule(Serializable):
                     if converted.units in unit.elementary_charge.compatible_units():
                         self._partial_charges = converted
 
+    @property
+    def _partial_charges_e(self) -> Optional[np.ndarray]:
+        """
+        The partial charges as a plain float64 array in elementary charges, or None.
+
+        Callers that only shuffle charges between molecules can copy this array with
+        ``np.copy`` instead of deep copying ``partial_charges`` and its units.
+        """
+        if self._partial_charges is None:
+            return None
+        return np.asarray(
+            self._partial_charges.m_as(unit.elementary_charge), dtype=np.float64
+        )
+
+    @_partial_charges_e.setter
+    def _partial_charges_e(self, charges: Optional[np.ndarray]):
+        if charges is None:
+            self._partial_charges = None
+            return
+        charges = np.asarray(charges, dtype=np.float64)
+        if charges.shape != (self.n_atoms,):
+            raise ValueError(
+                f"Expected {self.n_atoms} partial charges, found array of shape "
+                f"{charges.shape}."
+            )
+        self._partial_charges = unit.Quantity(charges, unit.elementary_charge)
+
     @property
     def n_particles(self) -> int:
         """
@@ -3434,6 +3475,101 @@ class FrozenMolecule(Serializable):
 
         return matches
 
+    def chemical_environment_matches_batch(
+        self,
+        queries: List[str],
+        unique: bool = False,
+        toolkit_registry=GLOBAL_TOOLKIT_REGISTRY,
+    ) -> List[List[Tuple[int, ...]]]:
+        """Find matches in the molecule for each of several SMARTS strings
+
+        This is equivalent to calling :meth:`chemical_environment_matches` once per
+        query, but lets the toolkit convert the molecule only once for all queries.
+
+        Parameters
+        ----------
+        queries : list of str
+            SMARTS strings (each with one or more tagged atoms).
+        unique : bool, default=False
+        toolkit_registry : openff.toolkit.utils.toolkits.ToolkitRegistry
+            or openff.toolkit.utils.toolkits.ToolkitWrapper, optional, default=GLOBAL_TOOLKIT_REGISTRY
+            :class:`ToolkitRegistry` or :class:`ToolkitWrapper` to use for chemical environment matches
+
+        Returns
+        -------
+        matches : list of lists of atom index tuples
+            ``matches[i]`` contains the matches of ``queries[i]``.
+
+        """
+        queries = list(queries)
+        for query in queries:
+            if not isinstance(query, str):
+                raise ValueError("'query' must be a SMARTS/SMIRKS string")
+
+        if not isinstance(toolkit_registry, (ToolkitRegistry, ToolkitWrapper)):
+            raise InvalidToolkitRegistryError(
+                "'toolkit_registry' must be either a ToolkitRegistry or a ToolkitWrapper"
+            )
+
+        # A query that requires an element this molecule does not contain cannot
+        # match, so only the other queries are handed to the toolkit.
+        atomic_numbers = frozenset(atom.atomic_number for atom in self.atoms)
+        matchable_query_indices = [
+            index
+            for index, query in enumerate(queries)
+            if _smarts_required_atomic_numbers(query) <= atomic_numbers
+        ]
+
+        matches: List[List[Tuple[int, ...]]] = [list() for _ in queries]
+        for index, query_matches in zip(
+            matchable_query_indices,
+            self._find_smarts_matches_batch(
+                [queries[index] for index in matchable_query_indices],
+                unique,
+                toolkit_registry,
+            ),
+        ):
+            matches[index] = query_matches
+
+        return matches
+
+    def _find_smarts_matches_batch(
+        self,
+        queries: List[str],
+        unique: bool,
+        toolkit_registry,
+    ) -> List[List[Tuple[int, ...]]]:
+        """Hand several SMARTS strings to the toolkit, in one batch if it supports that."""
+        if len(queries) == 0:
+            return []
+
+        if isinstance(toolkit_registry, ToolkitRegistry):
+            if any(
+                hasattr(toolkit, "find_smarts_matches_batch")
+                for toolkit in toolkit_registry.registered_toolkits
+            ):
+                return toolkit_registry.call(
+                    "find_smarts_matches_batch",
+                    self,
+                    queries,
+                    unique=unique,
+                )
+        elif isinstance(toolkit_registry, ToolkitWrapper):
+            if hasattr(toolkit_registry, "find_smarts_matches_batch"):
+                return toolkit_registry.find_smarts_matches_batch(  # type: ignore[attr-defined]
+                    self,
+                    queries,
+                    unique=unique,
+                )
+
+        # Toolkits without a batch implementation are queried one SMARTS at a time
+        return [
+            self.chemical_environment_matches(
+                query, unique=unique, toolkit_registry=toolkit_registry
+            )
+            for query in queries
+        ]
+
     @classmethod
     def from_iupac(
         cls,
@@ -3839,8 +3975,8 @@ class FrozenMolecule(Serializable):
         import networkx as nx
 
         graph = self.to_networkx()
-        num_disconnected_subgraphs = sum(1 for _ in nx.connected_components(graph))
-        return num_disconnected_subgraphs > 1
+        # is_connected stops after one traversal, rather than finding every component
+        return graph.number_of_nodes() > 0 and not nx.is_connected(graph)
 
     def _to_xyz_file(self, file_path):
         """
@@ -4661,22 +4797,23 @@ class FrozenMolecule(Serializable):
         )
         new_molecule._bonds = sorted_bonds
 
+        # the current index of each new atom, for remapping per-atom arrays in one step
+        new_to_cur_indices = np.array([new_to_cur[i] for i in range(self.n_atoms)])
+
         # remap the charges
         if self.partial_charges is not None:
-            new_charges = np.zeros(self.n_atoms)
-            for i in range(self.n_atoms):
-                new_charges[i] = self.partial_charges[new_to_cur[i]].m_as(
-                    unit.elementary_charge
-                )
-            new_molecule.partial_charges = new_charges * unit.elementary_charge
+            new_charges = self.partial_charges.m_as(unit.elementary_charge)[
+                new_to_cur_indices
+            ]
+            new_molecule.partial_charges = unit.Quantity(
+                new_charges, unit.elementary_charge
+            )
 
         # remap the conformers there can be more than one
         if self.conformers is not None:
             for conformer in self.conformers:
-                new_conformer = np.zeros((self.n_atoms, 3))
-                for i in range(self.n_atoms):
-                    new_conformer[i] = conformer[new_to_cur[i]].m_as(unit.angstrom)
-                new_molecule._add_conformer(new_conformer * unit.angstrom)
+                new_conformer = conformer.m_as(unit.angstrom)[new_to_cur_indices]
+                new_molecule._add_conformer(unit.Quantity(new_conformer, unit.angstrom))
 
         # move any properties across
         new_molecule._properties = deepcopy(self._properties)
@@ -4824,6 +4961,37 @@ class FrozenMolecule(Serializable):
         atom2 = self._atoms[atom_index_2]
         return atom2 in self._bondedAtoms[atom1]
 
+    def _get_bonds_by_atom_index_pair(self) -> Dict[Tuple[int, int], Bond]:
+        """
+        Return the bonds of this molecule keyed by the pairs of molecule atom indices they
+        connect, in both orders.
+
+        The dict is cached until the molecule is modified, so checking whether many pairs of
+        atoms are bonded, or looking up the bonds between them, only costs a hash lookup each.
+        """
+        if self._bonds_by_atom_index_pair is None:
+            atom_indices = {id(atom): index for index, atom in enumerate(self._atoms)}
+            bonds_by_atom_index_pair = dict()
+            for bond in self._bonds:
+                i, j = atom_indices[id(bond.atom1)], atom_indices[id(bond.atom2)]
+                bonds_by_atom_index_pair[(i, j)] = bond
+                bonds_by_atom_index_pair[(j, i)] = bond
+            self._bonds_by_atom_index_pair = bonds_by_atom_index_pair
+        return self._bonds_by_atom_index_pair
+
+    def _get_bond_atom_index_array(self) -> NDArray:
+        """
+        Return the molecule atom indices of each bond as an int32 array of shape (n_bonds, 2).
+
+        The array is cached until the molecule is modified and must not be modified in place.
+        """
+        if self._bond_atom_index_array is None:
+            self._bond_atom_index_array = np.array(
+                [(bond.atom1_index, bond.atom2_index) for bond in self._bonds],
+                dtype=np.int32,
+            ).reshape(-1, 2)
+        return self._bond_atom_index_array
+
     def get_bond_between(self, i, j):
         """Returns the bond between two atoms
 
@@ -4839,6 +5007,9 @@ class FrozenMolecule(Serializable):
 
         """
         if isinstance(i, int) and isinstance(j, int):
+            bond = self._get_bonds_by_atom_index_pair().get((i, j))
+            if bond is not None:
+                return bond
             atom_i = self._atoms[i]
             atom_j = self._atoms[j]
         elif isinstance(i, Atom) and isinstance(j, Atom):
@@ -5369,6 +5540,220 @@ class Molecule(FrozenMolecule):
             pass
 
 
+_SMARTS_ATOM_ELEMENT_REGEX = re.compile(r"#([0-9]+)([^;]*)")
+
+
+def _smarts_bracket_atoms(smarts: str) -> Generator[str, None, None]:
+    """Yield the expression inside each top-level bracket atom of a SMARTS pattern."""
+    depth = 0
+    for index, char in enumerate(smarts):
+        if char == "[":
+            if depth == 0:
+                start = index + 1
+            depth += 1
+        elif char == "]":
+            depth -= 1
+            if depth == 0:
+                yield smarts[start:index]
+
+
+@functools.lru_cache(maxsize=4096)
+def _smarts_required_atomic_numbers(smarts: str) -> FrozenSet[int]:
+    """
+    Return the atomic numbers a molecule must contain for a SMARTS pattern to match.
+
+    Every atom of a pattern has to match a different atom of the molecule, so each atom
+    written as ``[#N...]`` requires element ``N``, unless ``#N`` is part of an "or"
+    (``,``) or a recursive SMARTS (``$(...)``) before the first low-precedence "and"
+    (``;``). Atoms written in any other way are ignored, so the result may be a subset
+    of the elements that are actually required.
+
+    Examples
+    --------
+    >>> sorted(_smarts_required_atomic_numbers("[#6X4:1]-[#1:2]"))
+    [1, 6]
+    >>> sorted(_smarts_required_atomic_numbers("[#6;$([#6]=[#8]):1]-[#7,#8:2]"))
+    [6]
+    """
+    atomic_numbers = set()
+    for expression in _smarts_bracket_atoms(smarts):
+        match = _SMARTS_ATOM_ELEMENT_REGEX.match(expression)
+        if match is not None and not any(char in match.group(2) for char in ",$"):
+            atomic_numbers.add(int(match.group(1)))
+    return frozenset(atomic_numbers)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_attribute_match_func(
+    attr_names: Tuple[str, ...]
+) -> Callable[[Dict[str, Any], Dict[str, Any]], bool]:
+    """
+    Return a function that checks whether two node or edge attribute dicts agree on
+    all of the given attributes.
+
+    The attributes are looked up with one ``operator.itemgetter`` call per dict and
+    compared at once, which keeps the comparison ``GraphMatcher`` runs for every
+    candidate pair cheap.
+    """
+    get_attributes = operator.itemgetter(*attr_names)
+
+    def match_func(x, y):
+        return get_attributes(x) == get_attributes(y)
+
+    return match_func
+
+
+@functools.lru_cache(maxsize=None)
+def _get_isomorphism_edge_match_func(
+    aromatic_matching: bool,
+    bond_order_matching: bool,
+    bond_stereochemistry_matching: bool,
+) -> Optional[Callable[[Dict[str, Any], Dict[str, Any]], bool]]:
+    """
+    Return the edge match function ``are_isomorphic`` uses for the given options, or
+    None if edges need not be compared.
+    """
+    if aromatic_matching and bond_order_matching:
+        # We don't need to check the exact bond order (which is 1 or 2)
+        # if the bond is aromatic. This way we avoid missing a match only
+        # if the alternate bond orders 1 and 2 are assigned differently.
+        if bond_stereochemistry_matching:
+
+            def edge_match_func(x, y):
+                return (
+                    x["is_aromatic"] == y["is_aromatic"]
+                    or x["bond_order"] == y["bond_order"]
+                ) and x["stereochemistry"] == y["stereochemistry"]
+
+        else:
+
+            def edge_match_func(x, y):
+                return (
+                    x["is_aromatic"] == y["is_aromatic"]
+                    or x["bond_order"] == y["bond_order"]
+                )
+
+        return edge_match_func
+
+    attr_names = tuple(
+        attr_name
+        for attr_name, matching in (
+            ("is_aromatic", aromatic_matching),
+            ("bond_order", bond_order_matching),
+            ("stereochemistry", bond_stereochemistry_matching),
+        )
+        if matching
+    )
+    if not attr_names:
+        return None
+    return _get_attribute_match_func(attr_names)
+
+
+def _get_isomorphism_match_funcs(
+    aromatic_matching: bool = True,
+    formal_charge_matching: bool = True,
+    bond_order_matching: bool = True,
+    atom_stereochemistry_matching: bool = True,
+    bond_stereochemistry_matching: bool = True,
+) -> Tuple[Callable, Optional[Callable]]:
+    """
+    Return the node and edge match functions ``are_isomorphic`` uses for the given
+    options. The edge match function is None if edges need not be compared.
+    """
+    # always match by atleast atomic number
+    node_attr_names: Tuple[str, ...] = ("atomic_number",)
+    if aromatic_matching:
+        node_attr_names += ("is_aromatic",)
+    if formal_charge_matching:
+        node_attr_names += ("formal_charge",)
+    if atom_stereochemistry_matching:
+        node_attr_names += ("stereochemistry",)
+    return _get_attribute_match_func(node_attr_names), _get_isomorphism_edge_match_func(
+        aromatic_matching, bond_order_matching, bond_stereochemistry_matching
+    )
+
+
+def _to_rdkit_for_atom_mapping(molecule: "FrozenMolecule") -> Optional[Any]:
+    """
+    Return a molecule as an RDKit molecule that can propose atom maps for
+    ``_find_isomorphism_atom_map``, or None if RDKit is not installed or cannot
+    represent the molecule.
+    """
+    if not RDKitToolkitWrapper.is_available():
+        return None
+    try:
+        return RDKitToolkitWrapper().to_rdkit(molecule)
+    except Exception:
+        return None
+
+
+def _is_isomorphism_atom_map(
+    graph1: "nx.Graph",
+    graph2: "nx.Graph",
+    atom_map: Dict[int, int],
+    node_match_func: Callable,
+    edge_match_func: Optional[Callable],
+) -> bool:
+    """
+    Check that a one-to-one map between the nodes of two graphs with the same number of
+    nodes maps edges onto edges and passes the match functions, i.e. that it is one of
+    the maps ``networkx``'s ``GraphMatcher`` would accept.
+    """
+    if graph1.number_of_edges() != graph2.number_of_edges():
+        return False
+    nodes1 = graph1.nodes
+    nodes2 = graph2.nodes
+    for node1, node2 in atom_map.items():
+        if not node_match_func(nodes1[node1], nodes2[node2]):
+            return False
+    for node1, other_node1, edge1 in graph1.edges(data=True):
+        edge2 = graph2.get_edge_data(atom_map[node1], atom_map[other_node1])
+        if edge2 is None:
+            return False
+        if edge_match_func is not None and not edge_match_func(edge1, edge2):
+            return False
+    return True
+
+
+def _find_isomorphism_atom_map(
+    graph1: "nx.Graph",
+    graph2: "nx.Graph",
+    node_match_func: Callable,
+    edge_match_func: Optional[Callable],
+    rdmols: Optional[Tuple[Any, Any]] = None,
+) -> Optional[Dict[int, int]]:
+    """
+    Return a map from the nodes of ``graph1`` to the nodes of ``graph2``, ordered by the
+    nodes of ``graph1``, under which the graphs are isomorphic, or None if they are not.
+
+    ``networkx``'s VF2 matcher is pure Python, and it dominates the cost of comparing
+    larger molecules. If ``rdmols`` holds RDKit versions of both molecules, with the
+    same atom order as the graphs, RDKit's substructure matcher (written in C++) first
+    proposes a map, which is kept if it passes ``_is_isomorphism_atom_map``. RDKit does
+    not compare exactly the same attributes, so if it finds no map, or one that fails
+    the check, VF2 is used instead.
+    """
+    if rdmols is not None and None not in rdmols:
+        rdmol1, rdmol2 = rdmols
+        match = rdmol2.GetSubstructMatch(rdmol1, useChirality=True)
+        if len(match) == graph1.number_of_nodes() == graph2.number_of_nodes():
+            atom_map = dict(enumerate(match))
+            if _is_isomorphism_atom_map(
+                graph1, graph2, atom_map, node_match_func, edge_match_func
+            ):
+                return atom_map
+
+    from networkx.algorithms.isomorphism import GraphMatcher  # type: ignore
+
+    GM = GraphMatcher(
+        graph1, graph2, node_match=node_match_func, edge_match=edge_match_func
+    )
+    if not GM.is_isomorphic():
+        return None
+    # reorder the mapping by keys
+    return dict(sorted(GM.mapping.items()))
+
+
 def _networkx_graph_to_hill_formula(graph: "nx.Graph") -> str:
     """
     Convert a NetworkX graph to a Hill formula.
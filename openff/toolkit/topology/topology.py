@@ -11,15 +11,17 @@ Class definitions to represent a molecular system and its chemical components
    * Use `attrs <http://www.attrs.org/>`_ for object setter boilerplate?
 
 """
+import bisect
 import itertools
 import warnings
 from collections import defaultdict
-from collections.abc import MutableMapping
+from collections.abc import ItemsView, MutableMapping, ValuesView
 from contextlib import nullcontext
 from copy import deepcopy
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
+    Any,
     Dict,
     Generator,
     Iterable,
@@ -40,7 +42,14 @@ from openff.utilities import requires_package
 
 from openff.toolkit.topology import Molecule
 from openff.toolkit.topology._mm_molecule import _SimpleBond, _SimpleMolecule
-from openff.toolkit.topology.molecule import FrozenMolecule, HierarchyElement
+from openff.toolkit.topology.molecule import (
+    Atom,
+    FrozenMolecule,
+    HierarchyElement,
+    _find_isomorphism_atom_map,
+    _get_isomorphism_match_funcs,
+    _to_rdkit_for_atom_mapping,
+)
 from openff.toolkit.utils import quantity_to_string, string_to_quantity
 from openff.toolkit.utils.exceptions import (
     AtomNotInTopologyError,
@@ -66,8 +75,6 @@ if TYPE_CHECKING:
     import openmm.app
     from openmm.unit import Quantity as OMMQuantity
 
-    from openff.toolkit.topology.molecule import Atom
-
 
 def _topology_deprecation(old_method, new_method):
     warnings.warn(
@@ -80,6 +87,26 @@ class TopologyDeprecationWarning(UserWarning):
     """Warning for deprecated portions of the Topology API."""
 
 
+def _match_molecule_batch(molecule, smarts_list, unique, toolkit_registry):
+    """
+    Match several SMARTS against one molecule, returning plain tuples of atom indices.
+
+    This is a module-level function so that it can be run in a worker process of
+    ``Topology.chemical_environment_matches_batch``. If ``toolkit_registry`` is ``None``,
+    the worker's own ``GLOBAL_TOOLKIT_REGISTRY`` is used.
+    """
+    if toolkit_registry is None:
+        toolkit_registry = GLOBAL_TOOLKIT_REGISTRY
+    return [
+        [tuple(match) for match in mol_matches]
+        for mol_matches in molecule.chemical_environment_matches_batch(
+            smarts_list,
+            unique=unique,
+            toolkit_registry=toolkit_registry,
+        )
+    ]
+
+
 class _TransformedDict(MutableMapping):
     """A dictionary that transform and sort keys.
 
@@ -117,6 +144,12 @@ class _TransformedDict(MutableMapping):
     def __sortfunc__(key):
         return key
 
+    def items(self):
+        return _TransformedItemsView(self)
+
+    def values(self):
+        return _TransformedValuesView(self)
+
     @classmethod
     def _return_possible_index_of(cls, key, possible=[], permutations={}):
         """
@@ -144,6 +177,29 @@ class _TransformedDict(MutableMapping):
         raise ValueError(f"key {key} not in possible {possible}")
 
 
+class _TransformedItemsView(ItemsView):
+    """Items view of a ``_TransformedDict`` that reads its stored keys directly.
+
+    The keys yielded by iterating over the dict are already transformed, so the
+    values are looked up in the underlying store rather than through
+    ``__getitem__``, which would transform each key again.
+    """
+
+    def __iter__(self):
+        store = self._mapping.store
+        for key in self._mapping:
+            yield key, store[key]
+
+
+class _TransformedValuesView(ValuesView):
+    """Values view of a ``_TransformedDict``, see ``_TransformedItemsView``."""
+
+    def __iter__(self):
+        store = self._mapping.store
+        for key in self._mapping:
+            yield store[key]
+
+
 # TODO: Encapsulate this atom ordering logic directly into Atom/Bond/Angle/Torsion classes?
 class ValenceDict(_TransformedDict):
     """Enforce uniqueness in atom indices."""
@@ -312,13 +368,16 @@ class ImproperDict(_TransformedDict):
         # Ensure key is a tuple
         key = tuple(key)
         assert len(key) == 4, "Improper keys must be 4 atoms"
-        # Retrieve connected atoms
-        connectedatoms = [key[0], key[2], key[3]]
-        # Sort connected atoms
-        connectedatoms.sort()
-        # Re-store connected atoms
-        key = tuple([connectedatoms[0], key[1], connectedatoms[1], connectedatoms[2]])
-        return key
+        # Sort the three connected atoms in place with a sorting network, which is
+        # cheaper than building and sorting a list for every key.
+        atom0, central_atom, atom2, atom3 = key
+        if atom0 > atom2:
+            atom0, atom2 = atom2, atom0
+        if atom2 > atom3:
+            atom2, atom3 = atom3, atom2
+        if atom0 > atom2:
+            atom0, atom2 = atom2, atom0
+        return (atom0, central_atom, atom2, atom3)
 
     @classmethod
     def index_of(cls, key, possible=None):
@@ -416,8 +475,6 @@ class Topology(Serializable):
             or serialized Topology object.
 
         """
-        from openff.toolkit.topology.molecule import FrozenMolecule
-
         # Assign cheminformatics models
         model = DEFAULT_AROMATICITY_MODEL
         self._aromaticity_model = model
@@ -442,6 +499,7 @@ class Topology(Serializable):
         self._box_vectors = None
         self._molecules = list()
         self._cached_chemically_identical_molecules = None
+        self._cached_molecule_start_indices = None
 
     def __iadd__(self, other):
         """Add two Topology objects in-place.
@@ -703,10 +761,7 @@ class Topology(Serializable):
         -------
         n_atoms : int
         """
-        n_atoms = 0
-        for molecule in self.molecules:
-            n_atoms += molecule.n_atoms
-        return n_atoms
+        return sum(molecule.n_atoms for molecule in self._molecules)
 
     @property
     def atoms(self) -> Generator["Atom", None, None]:
@@ -795,10 +850,7 @@ class Topology(Serializable):
         -------
         n_bonds : int
         """
-        n_bonds = 0
-        for molecule in self.molecules:
-            n_bonds += molecule.n_bonds
-        return n_bonds
+        return sum(molecule.n_bonds for molecule in self._molecules)
 
     @property
     def bonds(self):
@@ -1018,50 +1070,126 @@ class Topology(Serializable):
 
         """
 
-        # Render the query to a SMARTS string
-        if isinstance(query, str):
-            smarts = query
-        else:
-            raise ValueError(
-                f"Don't know how to convert query '{query}' into SMARTS string"
-            )
+        return self.chemical_environment_matches_batch(
+            [query],
+            aromaticity_model=aromaticity_model,
+            unique=unique,
+            toolkit_registry=toolkit_registry,
+        )[0]
+
+    def chemical_environment_matches_batch(
+        self,
+        queries: List[str],
+        aromaticity_model: str = "MDL",
+        unique: bool = False,
+        toolkit_registry=GLOBAL_TOOLKIT_REGISTRY,
+        n_jobs: Optional[int] = None,
+    ) -> List[List["Topology._ChemicalEnvironmentMatch"]]:
+        """
+        Retrieve all matches for each of several chemical environment queries.
+
+        This is equivalent to calling :meth:`chemical_environment_matches` once per query, but each unique
+        molecule is handed to the toolkit only once, and the mapping from molecule atoms to topology atoms is
+        computed only once per molecule instance.
+
+        Parameters
+        ----------
+        queries : list of str
+            SMARTS strings (with one or more tagged atoms)
+        aromaticity_model : str
+            Override the default aromaticity model for this topology and use the specified aromaticity model instead.
+            Allowed values: ['MDL']
+        n_jobs : int, optional, default=None
+            The number of worker processes across which the unique molecules are matched. If ``None``
+            or 1, all molecules are matched in this process.
+
+            .. warning :: This argument is experimental. Each worker receives a pickled copy of the
+               molecules it matches, and uses its own ``GLOBAL_TOOLKIT_REGISTRY`` unless another
+               registry is given, so it only pays off for topologies with many unique molecules.
+
+        Returns
+        -------
+        matches : list of lists of Topology._ChemicalEnvironmentMatch
+            ``matches[i]`` contains the matches of ``queries[i]``, in the same order as returned by
+            :meth:`chemical_environment_matches`.
+
+        """
+
+        # Render the queries to SMARTS strings
+        smarts_list = list()
+        for query in queries:
+            if isinstance(query, str):
+                smarts_list.append(query)
+            else:
+                raise ValueError(
+                    f"Don't know how to convert query '{query}' into SMARTS string"
+                )
 
         # Perform matching on each unique molecule, unrolling the matches to all matching copies
         # of that molecule in the Topology object.
-        matches = list()
+        matches: List[List[Topology._ChemicalEnvironmentMatch]] = [
+            list() for _ in smarts_list
+        ]
 
         groupings = self.identical_molecule_groups
+        unique_mols = [self.molecule(unique_mol_idx) for unique_mol_idx in groupings]
+        atom_start_indices, _ = self._get_molecule_start_indices()
+
+        # Find all atomsets that match each definition in the reference molecules
+        # This will automatically attempt to match chemically identical atoms in
+        # a canonical order within the Topology
+        if n_jobs is None or n_jobs == 1:
+            mol_matches_batches = [
+                _match_molecule_batch(unique_mol, smarts_list, unique, toolkit_registry)
+                for unique_mol in unique_mols
+            ]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
 
-        for unique_mol_idx, group in groupings.items():
-            unique_mol = self.molecule(unique_mol_idx)
-            # Find all atomsets that match this definition in the reference molecule
-            # This will automatically attempt to match chemically identical atoms in
-            # a canonical order within the Topology
-            mol_matches = unique_mol.chemical_environment_matches(
-                smarts,
-                unique=unique,
-                toolkit_registry=toolkit_registry,
+            worker_registry = (
+                None
+                if toolkit_registry is GLOBAL_TOOLKIT_REGISTRY
+                else toolkit_registry
             )
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                mol_matches_batches = list(
+                    executor.map(
+                        _match_molecule_batch,
+                        unique_mols,
+                        itertools.repeat(smarts_list),
+                        itertools.repeat(unique),
+                        itertools.repeat(worker_registry),
+                    )
+                )
 
-            if len(mol_matches) == 0:
+        for unique_mol, group, mol_matches_batch in zip(
+            unique_mols, groupings.values(), mol_matches_batches
+        ):
+            if not any(mol_matches_batch):
                 continue
 
+            # Map each atom of the reference molecule to a topology atom index, once per copy.
+            # The atoms of each copy are numbered contiguously from the copy's first atom.
+            instance_atom_indices = list()
             for mol_instance_idx, atom_map in group:
-                mol_instance = self.molecule(mol_instance_idx)
-                # Loop over matches
-                for match in mol_matches:
-
-                    # Collect indices of matching TopologyAtoms.
-                    topology_atom_indices = []
-                    for molecule_atom_index in match:
-                        atom = mol_instance.atom(atom_map[molecule_atom_index])
-                        topology_atom_indices.append(self.atom_index(atom))
-
-                    environment_match = Topology._ChemicalEnvironmentMatch(
-                        tuple(match), unique_mol, tuple(topology_atom_indices)
-                    )
+                atom_start_index = atom_start_indices[mol_instance_idx]
+                instance_atom_indices.append(
+                    [
+                        atom_start_index + atom_map[molecule_atom_index]
+                        for molecule_atom_index in range(unique_mol.n_atoms)
+                    ]
+                )
+
+            for query_matches, mol_matches in zip(matches, mol_matches_batch):
+                for topology_indices in instance_atom_indices:
+                    for match in mol_matches:
+                        environment_match = Topology._ChemicalEnvironmentMatch(
+                            match,
+                            unique_mol,
+                            tuple(topology_indices[i] for i in match),
+                        )
+                        query_matches.append(environment_match)
 
-                    matches.append(environment_match)
         return matches
 
     @property
@@ -1153,6 +1281,28 @@ class Topology(Serializable):
         identity_maps: Dict[int, Tuple[int, Dict[int, int]]] = dict()
         already_matched_mols = set()
 
+        # The atom invariants, graph and RDKit molecule of each molecule are built at
+        # most once, the first time they are needed, and reused for later comparisons.
+        atom_invariants: Dict[int, tuple] = dict()
+        isomorphism_graphs: Dict[int, Graph] = dict()
+        rdkit_molecules: Dict[int, Any] = dict()
+        node_match_func, edge_match_func = _get_isomorphism_match_funcs()
+
+        def get_atom_invariants(mol_idx, mol):
+            if mol_idx not in atom_invariants:
+                atom_invariants[mol_idx] = mol._get_atom_invariants()
+            return atom_invariants[mol_idx]
+
+        def get_isomorphism_graph(mol_idx, mol):
+            if mol_idx not in isomorphism_graphs:
+                isomorphism_graphs[mol_idx] = Molecule._to_isomorphism_graph(mol)
+            return isomorphism_graphs[mol_idx]
+
+        def get_rdkit_molecule(mol_idx, mol):
+            if mol_idx not in rdkit_molecules:
+                rdkit_molecules[mol_idx] = _to_rdkit_for_atom_mapping(mol)
+            return rdkit_molecules[mol_idx]
+
         for mol1_idx in range(self.n_molecules):
             if mol1_idx in already_matched_mols:
                 continue
@@ -1165,9 +1315,34 @@ class Topology(Serializable):
                 if mol2_idx in already_matched_mols:
                     continue
                 mol2 = self.molecule(mol2_idx)
-                are_isomorphic, atom_map = Molecule.are_isomorphic(
-                    mol1, mol2, return_atom_map=True
-                )
+                if isinstance(mol1, FrozenMolecule) and isinstance(
+                    mol2, FrozenMolecule
+                ):
+                    # Most pairs of different molecules are told apart by their atom
+                    # invariants, without matching their graphs.
+                    if get_atom_invariants(mol1_idx, mol1) != get_atom_invariants(
+                        mol2_idx, mol2
+                    ):
+                        continue
+                    if mol1._is_exactly_the_same_as(mol2):
+                        are_isomorphic = True
+                        atom_map = {i: i for i in range(mol1.n_atoms)}
+                    else:
+                        atom_map = _find_isomorphism_atom_map(
+                            get_isomorphism_graph(mol1_idx, mol1),
+                            get_isomorphism_graph(mol2_idx, mol2),
+                            node_match_func,
+                            edge_match_func,
+                            (
+                                get_rdkit_molecule(mol1_idx, mol1),
+                                get_rdkit_molecule(mol2_idx, mol2),
+                            ),
+                        )
+                        are_isomorphic = atom_map is not None
+                else:
+                    are_isomorphic, atom_map = Molecule.are_isomorphic(
+                        mol1, mol2, return_atom_map=True
+                    )
                 if are_isomorphic:
                     identity_maps[mol2_idx] = (
                         mol1_idx,
@@ -1178,16 +1353,44 @@ class Topology(Serializable):
         return identity_maps
 
     def _build_atom_index_cache(self):
-        topology_molecule_atom_start_index = 0
-        for molecule in self.molecules:
-            for at in molecule.atoms:
-                at._topology_atom_index = (
-                    topology_molecule_atom_start_index + at.molecule_atom_index
-                )
-            topology_molecule_atom_start_index += molecule.n_atoms
+        # Number the atoms by position, rather than looking up each atom's
+        # molecule_atom_index, which is found with a linear search if not yet cached
+        atom_start_indices, _ = self._get_molecule_start_indices()
+        for atom_start_index, molecule in zip(atom_start_indices, self._molecules):
+            for topology_atom_index, atom in enumerate(
+                molecule.atoms, atom_start_index
+            ):
+                atom._topology_atom_index = topology_atom_index
+
+    def _get_molecule_start_indices(self) -> Tuple[List[int], List[int]]:
+        """
+        Return the topology indices of the first atom and of the first bond of each molecule,
+        each followed by the total number of atoms or bonds.
+
+        These are cached so that looking up an atom or bond by its topology index does not
+        need to walk over all the molecules before it. Molecules can be modified in place,
+        so the cache is rebuilt if the number of atoms or bonds of any molecule changed.
+        """
+        molecule_sizes = [
+            (molecule.n_atoms, molecule.n_bonds) for molecule in self._molecules
+        ]
+        cached = self._cached_molecule_start_indices
+        if cached is None or cached[0] != molecule_sizes:
+            atom_start_indices = [0]
+            bond_start_indices = [0]
+            for n_atoms, n_bonds in molecule_sizes:
+                atom_start_indices.append(atom_start_indices[-1] + n_atoms)
+                bond_start_indices.append(bond_start_indices[-1] + n_bonds)
+            cached = self._cached_molecule_start_indices = (
+                molecule_sizes,
+                atom_start_indices,
+                bond_start_indices,
+            )
+        return cached[1], cached[2]
 
     def _invalidate_cached_properties(self):
         self._cached_chemically_identical_molecules = None
+        self._cached_molecule_start_indices = None
         for atom in self.atoms:
             if "_topology_atom_index" in atom.__dict__:
                 del atom.__dict__["_topology_atom_index"]
@@ -2228,8 +2431,6 @@ class Topology(Serializable):
             The bond between i and j.
 
         """
-        from openff.toolkit.topology import Atom
-
         if (type(i) is int) and (type(j) is int):
             atomi = self.atom(i)
             atomj = self.atom(j)
@@ -2285,27 +2486,16 @@ class Topology(Serializable):
         An openff.toolkit.topology.TopologyAtom
         """
         assert type(atom_topology_index) is int
-        assert 0 <= atom_topology_index < self.n_atoms
-        this_molecule_start_index = 0
-        next_molecule_start_index = 0
-        for molecule in self.molecules:
-            next_molecule_start_index += molecule.n_atoms
-            if next_molecule_start_index > atom_topology_index:
-                atom_molecule_index = atom_topology_index - this_molecule_start_index
-                # NOTE: the index here should still be in the topology index order, NOT the reference molecule's
-                return molecule.atom(atom_molecule_index)
-            this_molecule_start_index += molecule.n_atoms
-
-        # Potentially more computationally efficient lookup ( O(largest_molecule_natoms)? )
-        # start_index_2_top_mol is an ordered dict of [starting_atom_index] --> [topology_molecule]
-        # search_range = range(atom_topology_index - largest_molecule_natoms, atom_topology_index)
-        # search_index = atom_topology_index
-        # Only efficient if start_index_2_top_mol.keys() is a set (constant time lookups)
-        # while not(search_index in start_index_2_top_mol.keys()):
-        #     search_index -= 1
-        # topology_molecule = start_index_2_top_mol(search_index)
-        # atom_molecule_index = atom_topology_index - search_index
-        # return topology_molecule.atom(atom_molecule_index)
+        atom_start_indices, _ = self._get_molecule_start_indices()
+        assert 0 <= atom_topology_index < atom_start_indices[-1]
+        # Find the molecule containing this atom with a binary search of the
+        # (cached) index of the first atom of each molecule.
+        molecule_index = (
+            bisect.bisect_right(atom_start_indices, atom_topology_index) - 1
+        )
+        atom_molecule_index = atom_topology_index - atom_start_indices[molecule_index]
+        # NOTE: the index here should still be in the topology index order, NOT the reference molecule's
+        return self._molecules[molecule_index].atom(atom_molecule_index)
 
     def bond(self, bond_topology_index):
         """
@@ -2321,15 +2511,13 @@ class Topology(Serializable):
         An openff.toolkit.topology.TopologyBond
         """
         assert type(bond_topology_index) is int
-        assert 0 <= bond_topology_index < self.n_bonds
-        this_molecule_start_index = 0
-        next_molecule_start_index = 0
-        for molecule in self._molecules:
-            next_molecule_start_index += molecule.n_bonds
-            if next_molecule_start_index > bond_topology_index:
-                bond_molecule_index = bond_topology_index - this_molecule_start_index
-                return molecule.bond(bond_molecule_index)
-            this_molecule_start_index += molecule.n_bonds
+        _, bond_start_indices = self._get_molecule_start_indices()
+        assert 0 <= bond_topology_index < bond_start_indices[-1]
+        molecule_index = (
+            bisect.bisect_right(bond_start_indices, bond_topology_index) - 1
+        )
+        bond_molecule_index = bond_topology_index - bond_start_indices[molecule_index]
+        return self._molecules[molecule_index].bond(bond_molecule_index)
 
     def add_molecule(self, molecule: Union[Molecule, _SimpleMolecule]) -> int:
         """Add a copy of the molecule to the topology"""
@@ -2398,10 +2586,49 @@ class Topology(Serializable):
             Distance if constraint has already been added to Topology
 
         """
-        if (iatom, jatom) in self._constrained_atom_pairs:
-            return self._constrained_atom_pairs[(iatom, jatom)]
-        else:
-            return False
+        return self._constrained_atom_pairs.get((iatom, jatom), False)
+
+    def _get_bond_atom_indices(self) -> NDArray:
+        """
+        Return the topology atom indices of every bond as an integer array of shape (n_bonds, 2).
+
+        Bonds are in the same order as :py:attr:`bonds`. This lets consumers add all bonds to a
+        force in a single vectorized call instead of looking up the atoms of each bond in Python.
+        """
+        return self._stack_molecule_atom_indices(
+            lambda molecule: molecule._get_bond_atom_index_array(),
+            n_atoms_per_term=2,
+        )
+
+    def _get_angle_atom_indices(self) -> NDArray:
+        """
+        Return the topology atom indices of every angle as an integer array of shape (n_angles, 3).
+
+        Angles are in the same order as :py:attr:`angles`.
+        """
+        return self._stack_molecule_atom_indices(
+            lambda molecule: [
+                [atom.molecule_atom_index for atom in angle]
+                for angle in molecule.angles
+            ],
+            n_atoms_per_term=3,
+        )
+
+    def _stack_molecule_atom_indices(
+        self, get_molecule_indices, n_atoms_per_term: int
+    ) -> NDArray:
+        """Offset per-molecule atom indices of some terms by each molecule's first atom index."""
+        atom_start_indices, _ = self._get_molecule_start_indices()
+        blocks = [
+            np.asarray(get_molecule_indices(molecule), dtype=np.int32).reshape(
+                -1, n_atoms_per_term
+            )
+            + atom_start_index
+            for molecule, atom_start_index in zip(self._molecules, atom_start_indices)
+        ]
+        if not blocks:
+            return np.empty((0, n_atoms_per_term), dtype=np.int32)
+        return np.concatenate(blocks)
 
     def hierarchy_iterator(
         self,
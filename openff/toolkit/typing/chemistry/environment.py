@@ -23,17 +23,75 @@ __all__ = [
     "ImproperChemicalEnvironment",
 ]
 
+import functools
+import re
 import warnings
 from typing import Optional
 
 from openff.toolkit.utils.exceptions import SMIRKSMismatchError, SMIRKSParsingError
 from openff.toolkit.utils.toolkits import GLOBAL_TOOLKIT_REGISTRY, ToolkitWrapper
 
+# Matches the atom map index at the end of a bracket atom, e.g. the "2" in "[#6X4:2]".
+_ATOM_TAG_REGEX = re.compile(r":(\d+)\]")
+
+
+def _get_atom_tags(smirks):
+    """
+    Return the set of atom map indices of a SMIRKS, ignoring those inside recursive SMARTS.
+
+    Atoms tagged inside ``$(...)`` are not atoms of the environment, and the toolkits
+    do not count them when perceiving its valence type.
+    """
+    tags = set()
+    start = 0
+    depth = 0
+    i = 0
+    while i < len(smirks):
+        if depth == 0 and smirks.startswith("$(", i):
+            tags.update(int(tag) for tag in _ATOM_TAG_REGEX.findall(smirks, start, i))
+            depth = 1
+            i += 2
+            continue
+        if depth > 0:
+            if smirks[i] == "(":
+                depth += 1
+            elif smirks[i] == ")":
+                depth -= 1
+                if depth == 0:
+                    start = i + 1
+        i += 1
+    tags.update(int(tag) for tag in _ATOM_TAG_REGEX.findall(smirks, start))
+    return tags
+
+
+# The set of tagged atom indices implied by each valence type.
+_VALENCE_TYPE_TAGS = {
+    "Atom": frozenset({1}),
+    "Bond": frozenset({1, 2}),
+    "Angle": frozenset({1, 2, 3}),
+    "ProperTorsion": frozenset({1, 2, 3, 4}),
+    "ImproperTorsion": frozenset({1, 2, 3, 4}),
+}
+
 
 class ChemicalEnvironmentDeprecationWarning(UserWarning):
     """Warning for deprecated portions of the Molecule API."""
 
 
+@functools.lru_cache(maxsize=None)
+def _get_named_toolkit_wrapper(toolkit_name):
+    """Return a shared ToolkitWrapper for the legacy toolkit names 'openeye' and 'rdkit'."""
+    if toolkit_name == "openeye":
+        from openff.toolkit.utils.toolkits import OpenEyeToolkitWrapper
+
+        return OpenEyeToolkitWrapper()
+    elif toolkit_name == "rdkit":
+        from openff.toolkit.utils.toolkits import RDKitToolkitWrapper
+
+        return RDKitToolkitWrapper()
+    raise ValueError(f"Unknown toolkit name {toolkit_name}")
+
+
 class ChemicalEnvironment:
     """Chemical environment abstract base class used for validating SMIRKS"""
 
@@ -81,14 +139,8 @@ class ChemicalEnvironment:
         )
 
         # Support string input for toolkit names for legacy reasons
-        if toolkit_registry == "openeye":
-            from openff.toolkit.utils.toolkits import OpenEyeToolkitWrapper
-
-            toolkit_registry = OpenEyeToolkitWrapper()
-        elif toolkit_registry == "rdkit":
-            from openff.toolkit.utils.toolkits import RDKitToolkitWrapper
-
-            toolkit_registry = RDKitToolkitWrapper()
+        if toolkit_registry in ("openeye", "rdkit"):
+            toolkit_registry = _get_named_toolkit_wrapper(toolkit_registry)
 
         self.smirks = smirks
         self.label = label
@@ -119,6 +171,16 @@ class ChemicalEnvironment:
             if smirks did not have expected connectivity between tagged atoms
             and validate_valence_type=True
         """
+        if validate_valence_type and self._expected_type is not None:
+            # Cheap precheck that rejects SMIRKS with the wrong atom tags before
+            # handing them to the (much more expensive) toolkit SMARTS parser.
+            tags = _get_atom_tags(self.smirks)
+            if tags != _VALENCE_TYPE_TAGS[self._expected_type]:
+                raise SMIRKSMismatchError(
+                    f"{self.__class__} expected '{self._expected_type}' chemical environment, but "
+                    f"smirks was set to '{self.smirks}', which has tagged atoms {sorted(tags)}"
+                )
+
         perceived_type = self.get_type(toolkit_registry=toolkit_registry)
         if validate_valence_type and self._expected_type is not None:
             if perceived_type != self._expected_type:
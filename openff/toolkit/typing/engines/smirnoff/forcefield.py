@@ -23,13 +23,17 @@ __all__ = [
 ]
 
 import copy
+import functools
+import hashlib
+import json
 import logging
 import os
 import pathlib
+import sys
 import warnings
 from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
-from packaging.version import Version
+from packaging.version import Version, parse
 
 from openff.toolkit.topology.molecule import DEFAULT_AROMATICITY_MODEL
 from openff.toolkit.typing.engines.smirnoff.io import ParameterIOHandler
@@ -64,6 +68,24 @@ logger = logging.getLogger(__name__)
 # Directory paths used by ForceField to discover offxml files.
 _installed_offxml_dir_paths: List[str] = []
 
+# Part of the key of every entry in a parameter cache directory. Bump this whenever the
+# pickled layout of ParameterList or ParameterType changes, so that entries written by
+# earlier code are never loaded.
+_PARAMETER_CACHE_FORMAT_VERSION = 1
+
+
+@functools.lru_cache(maxsize=None)
+def _get_module_source_digest(module_name: str) -> str:
+    """Return a hash of the source file of an imported module, or "" if it has none."""
+    source_path = getattr(sys.modules.get(module_name), "__file__", None)
+    if source_path is None:
+        return ""
+    try:
+        with open(source_path, "rb") as source_file:
+            return hashlib.sha256(source_file.read()).hexdigest()
+    except OSError:
+        return ""
+
 
 def _get_installed_offxml_dir_paths() -> List[str]:
     """Return the list of directory paths where to search for offxml files.
@@ -131,6 +153,43 @@ MAX_SUPPORTED_VERSION = (
 )
 
 
+def _match_parameter_indices(parameter_handler, topology):
+    """
+    Find the parameters of ``parameter_handler`` matched to the terms of ``topology``.
+
+    The matched parameters are returned by their index in the handler's ``ParameterList``
+    rather than as objects, so that matches found in a worker process of
+    ``ForceField.label_molecules`` can be mapped back to the caller's parameters.
+
+    Returns
+    -------
+    matches_cls : type
+        The class of the dict returned by ``parameter_handler.find_matches``.
+    parameter_indices : list of (tuple, int or list of int)
+        The matched terms and the indices of the parameters assigned to them.
+    """
+    from openff.toolkit.typing.engines.smirnoff.parameters import VirtualSiteHandler
+
+    matches = parameter_handler.find_matches(topology)
+    index_by_id = {
+        id(parameter): index
+        for index, parameter in enumerate(parameter_handler._parameters)
+    }
+
+    # Remove the chemical environment matches from the matched results.
+    if type(parameter_handler) == VirtualSiteHandler:
+        parameter_indices = [
+            (match, [index_by_id[id(m.parameter_type)] for m in matches[match]])
+            for match in matches
+        ]
+    else:
+        parameter_indices = [
+            (match, index_by_id[id(matches[match].parameter_type)]) for match in matches
+        ]
+
+    return matches.__class__, parameter_indices
+
+
 class ForceField:
     """A factory that assigns SMIRNOFF parameters to a molecular system
 
@@ -221,6 +280,7 @@ class ForceField:
         disable_version_check=False,
         allow_cosmetic_attributes=False,
         load_plugins=False,
+        parameter_cache_directory=None,
     ):
         """Create a new :class:`ForceField` object from one or more SMIRNOFF parameter definition files.
 
@@ -251,6 +311,18 @@ class ForceField:
         load_plugins: bool, optional. Default = False
             Whether to load ``ParameterHandler`` classes which have been registered
             by installed plugins.
+        parameter_cache_directory: str or pathlib.Path, optional. Default = None
+            If specified, the parameters of each section that is loaded are pickled to this directory,
+            and reused the next time an identical section is loaded by the same version of the toolkit.
+            This skips the construction and validation of the parameters when the same force field is
+            loaded repeatedly. Cache entries that cannot be read or do not match the current code are
+            ignored, and the section is parsed from source instead.
+
+            .. warning :: The cached parameters are loaded with ``pickle``, and unpickling data can
+               execute arbitrary code. Only point this at a directory that you trust and that
+               nobody else can write to.
+
+            .. warning :: This feature is experimental and may be removed / altered in future versions.
 
         Examples
         --------
@@ -273,6 +345,8 @@ class ForceField:
         # Clear all object fields
         self._initialize()
 
+        self._parameter_cache_directory = parameter_cache_directory
+
         self.aromaticity_model = aromaticity_model
         # Store initialization options
         self.disable_version_check = disable_version_check
@@ -284,6 +358,10 @@ class ForceField:
         # since both will try to register themselves for the same XML tag and an Exception will be raised.
         if parameter_handler_classes is None:
             parameter_handler_classes = all_subclasses(ParameterHandler)
+        else:
+            # Plugins are appended below; don't modify the caller's list, which may
+            # be reused to construct other force fields.
+            parameter_handler_classes = list(parameter_handler_classes)
         if load_plugins:
 
             plugin_classes = load_handler_plugins()
@@ -326,6 +404,8 @@ class ForceField:
         self._parameter_io_handlers = dict()
         self._author = None
         self._date = None
+        # Directory in which parameters are cached between loads (disabled if None)
+        self._parameter_cache_directory = None
 
     def _check_smirnoff_version_compatibility(self, version):
         """
@@ -342,16 +422,15 @@ class ForceField:
             If an incompatible version is passed in.
 
         """
-        from packaging.version import parse
-
         # Use PEP-440 compliant version number comparison, if requested
         if self.disable_version_check:
             pass
         else:
-            if (
-                parse(str(version)) > parse(str(self._MAX_SUPPORTED_SMIRNOFF_VERSION))
-            ) or (
-                parse(str(version)) < parse(str(self._MIN_SUPPORTED_SMIRNOFF_VERSION))
+            # The supported versions are already Version objects, so only the
+            # incoming version needs to be parsed (once).
+            parsed_version = parse(str(version))
+            if (parsed_version > self._MAX_SUPPORTED_SMIRNOFF_VERSION) or (
+                parsed_version < self._MIN_SUPPORTED_SMIRNOFF_VERSION
             ):
                 raise SMIRNOFFVersionError(
                     "SMIRNOFF offxml file was written with version {}, but this version of ForceField only supports "
@@ -823,8 +902,6 @@ class ForceField:
         allow_cosmetic_attributes : bool, optional. Default = False
             Whether to permit non-spec kwargs in smirnoff_data.
         """
-        import packaging.version
-
         # Check that the SMIRNOFF version of this data structure is supported by this ForceField implementation
 
         if "SMIRNOFF" in smirnoff_data:
@@ -840,14 +917,15 @@ class ForceField:
 
         # Convert 0.1 spec files to 0.3 SMIRNOFF data format by converting
         # from 0.1 spec to 0.2, then 0.2 to 0.3
-        if packaging.version.parse(str(version)) == packaging.version.parse("0.1"):
+        parsed_version = parse(str(version))
+        if parsed_version == Version("0.1"):
             # NOTE: This will convert the top-level "SMIRFF" tag to "SMIRNOFF"
             smirnoff_data = convert_0_1_smirnoff_to_0_2(smirnoff_data)
             smirnoff_data = convert_0_2_smirnoff_to_0_3(smirnoff_data)
 
         # Convert 0.2 spec files to 0.3 SMIRNOFF data format by removing units
         # from section headers and adding them to quantity strings at all levels.
-        elif packaging.version.parse(str(version)) == packaging.version.parse("0.2"):
+        elif parsed_version == Version("0.2"):
             smirnoff_data = convert_0_2_smirnoff_to_0_3(smirnoff_data)
 
         # Ensure that SMIRNOFF is a top-level key of the dict
@@ -874,18 +952,15 @@ class ForceField:
         if "Date" in smirnoff_data["SMIRNOFF"]:
             self._add_date(smirnoff_data["SMIRNOFF"]["Date"])
 
-        # Go through the whole SMIRNOFF data structure, trying to convert all strings to Quantity
-        smirnoff_data = convert_all_strings_to_quantity(
-            smirnoff_data,
-            ignore_keys=["smirks", "name"],
-        )
-
         # Go through the subsections, delegating each to the proper ParameterHandler
 
         # Define keys which are expected from the spec, but are not parameter sections
         l1_spec_keys = ["Author", "Date", "version", "aromaticity_model"]
         # TODO: Throw SMIRNOFFSpecError for unrecognized keywords
 
+        # Keys whose values are never converted to Quantity objects
+        quantity_ignore_keys = ["smirks", "name"]
+
         for parameter_name in smirnoff_data["SMIRNOFF"]:
             # Skip (for now) cosmetic l1 items. They're handled above
             if parameter_name in l1_spec_keys:
@@ -899,6 +974,14 @@ class ForceField:
             # Otherwise, we expect this l1_key to correspond to a ParameterHandler
             section_dict = smirnoff_data["SMIRNOFF"][parameter_name]
 
+            # Fingerprint the section while it is still made of plain strings, so that its
+            # parameters can be looked up in the parameter cache (if one is in use).
+            section_fingerprint = None
+            if self._parameter_cache_directory is not None and isinstance(
+                section_dict, dict
+            ):
+                section_fingerprint = json.dumps(section_dict, default=str)
+
             # TODO: Implement a ParameterHandler.from_dict() that knows how to deserialize itself for extensibility.
             #       We could let it load the ParameterTypes from the dict and append them to the existing handler
             #       after verifying that they are compatible.
@@ -914,6 +997,13 @@ class ForceField:
             else:
                 parameter_list_dict = section_dict.pop(parameter_list_tagname, {})
 
+            # Try converting all strings in the section header to Quantity objects. The
+            # parameters themselves are converted below, unless they are read from the cache.
+            section_dict = convert_all_strings_to_quantity(
+                section_dict,
+                ignore_keys=quantity_ignore_keys,
+            )
+
             # Must be wrapped into its own tag.
             # Assumes that parameter_list_dict is always a list
 
@@ -930,9 +1020,63 @@ class ForceField:
                 section_dict,
                 allow_cosmetic_attributes=allow_cosmetic_attributes,
             )
+
+            cache_path = None
+            if parameter_list_dict != {} and section_fingerprint is not None:
+                cache_path = self._get_parameter_cache_path(
+                    ph_class, section_fingerprint, allow_cosmetic_attributes
+                )
+                if handler._load_cached_parameters(cache_path):
+                    continue
+
+            parameter_list_dict = convert_all_strings_to_quantity(
+                parameter_list_dict,
+                ignore_keys=quantity_ignore_keys,
+            )
+            n_parameters = len(handler._parameters)
             handler._add_parameters(
-                parameter_list_dict, allow_cosmetic_attributes=allow_cosmetic_attributes
+                parameter_list_dict,
+                allow_cosmetic_attributes=allow_cosmetic_attributes,
             )
+            if cache_path is not None:
+                handler._write_parameter_cache(
+                    cache_path, handler._parameters[n_parameters:]
+                )
+
+    def _get_parameter_cache_path(
+        self, handler_class, section_fingerprint, allow_cosmetic_attributes
+    ) -> str:
+        """
+        Return the path in the parameter cache directory of the parameters of a section.
+
+        The file name depends on everything that determines the resulting parameters: the
+        section contents, the handler class, whether cosmetic attributes are allowed, and the
+        code that defines the pickled objects. The version of the toolkit does not change in
+        a source checkout, so the source of the modules defining the handler and parameter
+        classes is hashed as well.
+        """
+        import openff.toolkit
+
+        defining_modules = sorted(
+            {
+                cls.__module__
+                for cls in handler_class.__mro__ + handler_class._INFOTYPE.__mro__
+            }
+        )
+        key = "\n".join(
+            [
+                openff.toolkit.__version__,
+                str(_PARAMETER_CACHE_FORMAT_VERSION),
+                *(_get_module_source_digest(module) for module in defining_modules),
+                f"{handler_class.__module__}.{handler_class.__qualname__}",
+                str(allow_cosmetic_attributes),
+                section_fingerprint,
+            ]
+        )
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(
+            self._parameter_cache_directory, f"{handler_class._TAGNAME}-{digest}.pkl"
+        )
 
     def parse_smirnoff_from_source(self, source) -> dict:
         """
@@ -1202,7 +1346,7 @@ class ForceField:
                 allow_nonintegral_charges=allow_nonintegral_charges,
             )
 
-    def label_molecules(self, topology):
+    def label_molecules(self, topology, n_jobs: Optional[int] = None):
         """Return labels for a list of molecules corresponding to parameters from this force field.
         For each molecule, a dictionary of force types is returned, and for each force type,
         each force term is provided with the atoms involved, the parameter id assigned, and the corresponding SMIRKS.
@@ -1211,6 +1355,13 @@ class ForceField:
         ----------
         topology : openff.toolkit.topology.Topology
             A Topology object containing one or more unique molecules to be labeled
+        n_jobs : int, optional, default=None
+            The number of worker processes used to match the parameters of the different
+            handlers and molecules. If ``None`` or 1, everything is matched in this process.
+
+            .. warning :: This argument is experimental. The worker processes use their
+               own ``GLOBAL_TOOLKIT_REGISTRY`` and each receives a pickled copy of the
+               handlers and molecules it matches, so it only pays off for expensive matches.
 
         Returns
         -------
@@ -1231,46 +1382,51 @@ class ForceField:
 
         """
         from openff.toolkit import Topology
-        from openff.toolkit.typing.engines.smirnoff.parameters import VirtualSiteHandler
-
-        # Loop over molecules and label
-        molecule_labels = list()
 
         # TODO: This was previously ... enumerate(topology.reference_molecules). It's currently
         # unclear if this should be topology.unique_molecules instead, since that might be faster
         # (if also modifying this to label _all_ duplicates of each unique molecule)
-        for molecule_idx, molecule in enumerate(topology.molecules):
-            top_mol = Topology.from_molecules([molecule])
-            current_molecule_labels = dict()
-            for tag, parameter_handler in self._parameter_handlers.items():
-                param_is_list = False
+        molecule_topologies = [
+            Topology.from_molecules([molecule]) for molecule in topology.molecules
+        ]
+        handler_items = list(self._parameter_handlers.items())
 
-                if type(parameter_handler) == VirtualSiteHandler:
-                    param_is_list = True
+        # Every (molecule, handler) pair is matched independently.
+        tasks = [
+            (parameter_handler, top_mol)
+            for top_mol in molecule_topologies
+            for _, parameter_handler in handler_items
+        ]
+        if n_jobs is None or n_jobs == 1:
+            results = [_match_parameter_indices(*task) for task in tasks]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
 
-                matches = parameter_handler.find_matches(top_mol)
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                results = list(executor.map(_match_parameter_indices, *zip(*tasks)))
 
-                # Remove the chemical environment matches from the
-                # matched results.
+        # Loop over molecules and label
+        molecule_labels = list()
+        results_iter = iter(results)
+        for _ in molecule_topologies:
+            current_molecule_labels = dict()
+            for tag, parameter_handler in handler_items:
+                matches_cls, parameter_indices = next(results_iter)
+                parameters = parameter_handler._parameters
 
                 # Because we sometimes need to enforce atom ordering,
-                # `matches` here is not a normal `dict`, but rather
+                # the matches are not kept in a normal `dict`, but rather
                 # one that transforms keys in arbitrary ways. Thus,
                 # we need to make a copy of its specific class here.
-
-                parameter_matches = matches.__class__()
+                parameter_matches = matches_cls()
 
                 # Now make parameter_matches into a dict mapping
                 # match objects to ParameterTypes
-
-                if param_is_list:
-                    for match in matches:
-                        parameter_matches[match] = [
-                            m.parameter_type for m in matches[match]
-                        ]
-                else:
-                    for match in matches:
-                        parameter_matches[match] = matches[match].parameter_type
+                for match, index in parameter_indices:
+                    if isinstance(index, list):
+                        parameter_matches[match] = [parameters[i] for i in index]
+                    else:
+                        parameter_matches[match] = parameters[index]
 
                 current_molecule_labels[tag] = parameter_matches
 
@@ -1380,24 +1536,24 @@ class ForceField:
           * `author` and `date` are stripped from the ForceField
           * `id` and `parent_id` are stripped from each ParameterType"""
 
-        # Completely re-constructing the force field may be overkill
-        # compared to deepcopying and modifying, but is not currently slow
-        ff_copy = ForceField()
-        ff_copy.date = None
-        ff_copy.author = None
+        # Work on the serialized data directly rather than deep-copying every
+        # handler (and re-running it through the ParameterAttribute machinery)
+        # just to strip a few attributes before serializing it anyway.
+        smirnoff_data = self._to_smirnoff_data(discard_cosmetic_attributes=True)
+        l1_dict = smirnoff_data["SMIRNOFF"]
+        l1_dict.pop("Author", None)
+        l1_dict.pop("Date", None)
 
-        param_attrs_to_strip = ["_id", "_parent_id"]
+        param_attrs_to_strip = ["id", "parent_id"]
 
-        for handler_name in self.registered_parameter_handlers:
-            handler = copy.deepcopy(self.get_parameter_handler(handler_name))
-
-            for param in handler._parameters:
+        for parameter_handler in self._parameter_handlers.values():
+            if parameter_handler._INFOTYPE is None:
+                continue
+            handler_dict = l1_dict[parameter_handler._TAGNAME]
+            element_name = parameter_handler._INFOTYPE._ELEMENT_NAME
+            for param_dict in handler_dict.get(element_name, []):
                 for attr in param_attrs_to_strip:
-                    # param.__dict__.pop(attr, None) may be faster
-                    # https://stackoverflow.com/a/42303681/4248961
-                    if hasattr(param, attr):
-                        delattr(param, attr)
-
-            ff_copy.register_parameter_handler(handler)
+                    param_dict.pop(attr, None)
 
-        return hash(ff_copy.to_string(discard_cosmetic_attributes=True))
+        io_handler = self.get_parameter_io_handler("XML")
+        return hash(io_handler.to_string(smirnoff_data))
@@ -16,6 +16,9 @@ import logging
 from typing import Optional
 
 import xmltodict
+from pyexpat import ExpatError
+
+from openff.toolkit.utils.exceptions import SMIRNOFFParseError
 
 logger = logging.getLogger(__name__)
 
@@ -143,13 +146,10 @@ class XMLParameterIOHandler(ParameterIOHandler):
             <https://openforcefield.github.io/standards/standards/smirnoff/#xml-representation>`_.
 
         """
-        from pyexpat import ExpatError
-
-        from openff.toolkit.utils.exceptions import SMIRNOFFParseError
-
-        # Parse XML file
+        # Parse XML file. Older versions of xmltodict default to OrderedDict,
+        # but plain dicts preserve insertion order and are cheaper to build.
         try:
-            smirnoff_data = xmltodict.parse(data, attr_prefix="")
+            smirnoff_data = xmltodict.parse(data, attr_prefix="", dict_constructor=dict)
             return smirnoff_data
         except ExpatError as e:
             raise SMIRNOFFParseError(str(e))
@@ -51,16 +51,21 @@ __all__ = [
     "ChargeIncrementType",
     "VirtualSiteType",
 ]
-import copy
+import bisect
 import functools
-import inspect
 import logging
+import operator
+import os
+import pickle
 import re
+import sys
+import tempfile
 from collections import defaultdict
 from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     List,
     Literal,
     Optional,
@@ -71,6 +76,7 @@ from typing import (
 )
 
 import numpy as np
+from numpy.typing import NDArray
 from openff.units import unit
 from packaging.version import Version
 
@@ -85,10 +91,12 @@ from openff.toolkit.utils.exceptions import (
     IncompatibleUnitError,
     MissingIndexedAttributeError,
     MissingPartialChargesError,
+    NotBondedError,
     NotEnoughPointsForInterpolationError,
     ParameterLookupError,
     SMIRNOFFSpecError,
     SMIRNOFFSpecUnimplementedError,
+    SMIRNOFFVersionError,
     UnassignedAngleParameterException,
     UnassignedBondParameterException,
     UnassignedMoleculeChargeException,
@@ -96,7 +104,7 @@ from openff.toolkit.utils.exceptions import (
     UnassignedValenceParameterException,
 )
 from openff.toolkit.utils.toolkits import GLOBAL_TOOLKIT_REGISTRY
-from openff.toolkit.utils.utils import object_to_quantity
+from openff.toolkit.utils.utils import _parse_quantity_string, object_to_quantity
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +112,44 @@ logger = logging.getLogger(__name__)
 _cal_mol_a2 = unit.calorie / unit.mole / unit.angstrom**2
 
 
+def _reorder_smirks_fragments(smirks):
+    """
+    Reorder the disconnected fragments of a SMIRKS pattern from longest to shortest.
+
+    Substructure searches can be very slow when a short fragment is searched for before
+    the larger one that anchors the match. The order of the fragments does not affect
+    which atoms are matched, nor the order in which tagged atoms are reported.
+
+    Only ``.`` separators outside of brackets and parentheses split fragments, so
+    recursive SMARTS and component-level grouping are left intact.
+
+    Parameters
+    ----------
+    smirks : str
+
+    Returns
+    -------
+    reordered_smirks : str
+    """
+    if "." not in smirks:
+        return smirks
+
+    fragments = list()
+    depth = 0
+    fragment_start = 0
+    for index, char in enumerate(smirks):
+        if char in "[(":
+            depth += 1
+        elif char in "])":
+            depth -= 1
+        elif char == "." and depth == 0:
+            fragments.append(smirks[fragment_start:index])
+            fragment_start = index + 1
+    fragments.append(smirks[fragment_start:])
+
+    return ".".join(sorted(fragments, key=len, reverse=True))
+
+
 def _linear_inter_or_extrapolate(points_dict, x_query):
     """
     Linearly interpolate or extrapolate based on a piecewise linear function
@@ -134,48 +180,67 @@ def _linear_inter_or_extrapolate(points_dict, x_query):
         )
     # TODO: error out for nonsensical fractional bond orders
 
-    # find the nearest point beneath our queried x value
-    try:
-        below = max(bo for bo in points_dict if bo < x_query)
-    except ValueError:
+    # Find the nearest points beneath and above our queried x value with a
+    # binary search of the sorted x values. The comparisons guard against
+    # queries that do not compare with them (i.e. NaN).
+    bond_orders = sorted(points_dict)
+    position = bisect.bisect_left(bond_orders, x_query)
+    below = bond_orders[position - 1] if position > 0 else None
+    if below is not None and not below < x_query:
         below = None
-    # find the nearest point above our queried x value
-    try:
-        above = min(bo for bo in points_dict if bo > x_query)
-    except ValueError:
+    above = bond_orders[position] if position < len(bond_orders) else None
+    if above is not None and not above > x_query:
         above = None
 
-    # handle case where we can clearly interpolate
-    if (above is not None) and (below is not None):
-        return points_dict[below] + (points_dict[above] - points_dict[below]) * (
-            (x_query - below) / (above - below)
-        )
-
     # error if we can't hope to interpolate at all
-    elif (above is None) and (below is None):
+    if (above is None) and (below is None):
         raise NotImplementedError(
             f"Failed to find interpolation references for "
             f"`x_query` '{x_query}', "
             f"with `points_dict` '{points_dict}'"
         )
 
+    # The result has the units of the point it is computed from (the first
+    # operand below). Do the arithmetic on plain magnitudes in those units and
+    # attach them once, rather than going through unit-aware arithmetic.
+    def _strip_units(anchor, *points):
+        if not isinstance(anchor, unit.Quantity):
+            return None, points
+        units = anchor.units
+        return units, [point.m_as(units) for point in points]
+
+    # handle case where we can clearly interpolate
+    if (above is not None) and (below is not None):
+        units, (y_below, y_above) = _strip_units(
+            points_dict[below], points_dict[below], points_dict[above]
+        )
+        y = y_below + (y_above - y_below) * ((x_query - below) / (above - below))
+
     # extrapolate for fractional bond orders below our lowest defined bond order
     elif below is None:
-        bond_orders = sorted(points_dict)
-        k = points_dict[bond_orders[0]] - (
-            (points_dict[bond_orders[1]] - points_dict[bond_orders[0]])
-            / (bond_orders[1] - bond_orders[0])
-        ) * (bond_orders[0] - x_query)
-        return k
+        units, (y_0, y_1) = _strip_units(
+            points_dict[bond_orders[0]],
+            points_dict[bond_orders[0]],
+            points_dict[bond_orders[1]],
+        )
+        y = y_0 - ((y_1 - y_0) / (bond_orders[1] - bond_orders[0])) * (
+            bond_orders[0] - x_query
+        )
 
     # extrapolate for fractional bond orders above our highest defined bond order
-    elif above is None:
-        bond_orders = sorted(points_dict)
-        k = points_dict[bond_orders[-1]] + (
-            (points_dict[bond_orders[-1]] - points_dict[bond_orders[-2]])
-            / (bond_orders[-1] - bond_orders[-2])
+    else:
+        units, (y_last, y_second_last) = _strip_units(
+            points_dict[bond_orders[-1]],
+            points_dict[bond_orders[-1]],
+            points_dict[bond_orders[-2]],
+        )
+        y = y_last + (
+            (y_last - y_second_last) / (bond_orders[-1] - bond_orders[-2])
         ) * (x_query - bond_orders[-1])
-        return k
+
+    if units is None:
+        return y
+    return unit.Quantity(y, units)
 
 
 # TODO: This is technically a validator, not a converter, but ParameterAttribute doesn't support them yet
@@ -204,11 +269,98 @@ def _allow_only(allowed_values):
     return _value_checker
 
 
+def _auto_or_float(instance, attr, new_value):
+    """A converter for settings that are either ``"auto"`` or a number.
+
+    The value is validated when it is set, but kept as given (e.g. the string ``"1"``
+    read from an OFFXML file) so that it is written out unchanged.
+    """
+    if new_value == "auto":
+        return new_value
+    try:
+        float(new_value)
+    except (TypeError, ValueError):
+        raise SMIRNOFFSpecError(
+            f"Attempted to set {instance.__class__.__name__}.{attr.name} "
+            f"to {new_value}. Only 'auto' or a number is supported."
+        )
+    return new_value
+
+
+def _intern_smirks(smirks):
+    """A converter that interns SMIRKS strings.
+
+    The same SMIRKS are used as keys over and over (e.g. in the ParameterList
+    SMIRKS -> index map), and interned strings compare by identity first.
+    """
+    if type(smirks) is str:
+        return sys.intern(smirks)
+    return smirks
+
+
+def _to_quantity(value):
+    """Like ``object_to_quantity``, but parsing strings through a cache."""
+    if isinstance(value, str):
+        magnitude, units = _parse_quantity_string(value)
+        if units is None:
+            return magnitude
+        return unit.Quantity(magnitude, units)
+    return object_to_quantity(value)
+
+
+@functools.lru_cache(maxsize=1024)
+def _units_are_compatible(units: unit.Unit, other_units) -> bool:
+    """Cached version of ``units.is_compatible_with(other_units)``.
+
+    ``other_units`` may also be the ``UnitsContainer`` of a Quantity (``quantity._units``),
+    which, unlike ``quantity.units``, does not construct a new ``Unit`` on every access.
+    """
+    if not isinstance(other_units, unit.Unit):
+        other_units = unit.Unit(other_units)
+    return units.is_compatible_with(other_units)
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_tagged_smarts_connectivity(smirks: str) -> Tuple[tuple, tuple]:
+    """Cached version of the toolkit ``get_tagged_smarts_connectivity`` call.
+
+    The tagged atoms and their connectivity are a property of the SMIRKS pattern
+    alone, so the (expensive) toolkit call is made only once per pattern. Patterns
+    that fail to parse raise on every call since exceptions are not cached.
+    """
+    return GLOBAL_TOOLKIT_REGISTRY.call("get_tagged_smarts_connectivity", smirks)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_attributes_getter(attr_names: Tuple[str, ...]) -> Callable[[Any], tuple]:
+    """Cached ``operator.attrgetter`` that always returns a tuple of the attributes.
+
+    Handlers compare the same few attribute names on every compatibility check, so the
+    getter is built once per set of names rather than calling ``getattr`` per attribute.
+    """
+    if len(attr_names) == 0:
+        return lambda obj: ()
+    if len(attr_names) == 1:
+        getter = operator.attrgetter(attr_names[0])
+        return lambda obj: (getter(obj),)
+    return operator.attrgetter(*attr_names)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_version(version: Union[str, float, int]) -> Version:
+    """Cached ``Version`` constructor.
+
+    Section versions are a handful of short strings or numbers (e.g. ``"0.3"``
+    or ``0.3``) that are parsed again by every ParameterHandler that is created.
+    """
+    return Version(str(version))
+
+
 def _validate_units(attr, value: Union[str, unit.Quantity], units: unit.Unit):
-    value = object_to_quantity(value)
+    value = _to_quantity(value)
 
     try:
-        if not units.is_compatible_with(value.units):
+        if not _units_are_compatible(units, value._units):
             raise IncompatibleUnitError(
                 f"{attr.name}={value} should have units of {units}"
             )
@@ -349,30 +501,48 @@ class ParameterAttribute:
         self.__doc__ = docstring
 
     def __set_name__(self, owner, name):
-        self._name = "_" + name
+        # Interned names are compared by identity when looked up in the
+        # instance __dict__.
+        self._public_name = sys.intern(name)
+        self._name = sys.intern("_" + name)
+
+        # Register this descriptor in the registry of the attributes declared
+        # by the owner class (not by its parents), in declaration order.
+        if "_own_parameter_attributes" not in owner.__dict__:
+            owner._own_parameter_attributes = dict()
+        owner._own_parameter_attributes[name] = self
 
     @property
     def name(self):
-        # Get rid of the initial underscore.
-        return self._name[1:]
-
-    def __get__(self, instance, owner):
-        if instance is None:
-            # This is called from the class. Return the descriptor object.
-            return self
+        return self._public_name
 
+    def __get__(self, instance: Optional[Any], owner: Optional[type] = None) -> Any:
+        # Attributes are read far more often than they are missing, so try the
+        # instance __dict__ first and only handle the rare cases on failure.
         try:
-            return getattr(instance, self._name)
+            return instance.__dict__[self._name]
         except AttributeError:
-            # The attribute has not initialized. Check if there's a default.
-            if self.default is ParameterAttribute.UNDEFINED:
-                raise
-            return self.default
+            # This is called from the class. Return the descriptor object.
+            if instance is None:
+                return self
+            raise
+        except KeyError:
+            pass
+
+        # The attribute has not initialized. Check if there's a default.
+        if self.default is ParameterAttribute.UNDEFINED:
+            raise AttributeError(
+                f"'{type(instance).__name__}' object has no attribute '{self._name}'"
+            )
+        return self.default
 
     def __set__(self, instance, value):
         # Convert and validate the value.
         value = self._convert_and_validate(instance, value)
-        setattr(instance, self._name, value)
+        # Store the value directly in the instance __dict__ (where __get__ reads
+        # it from) rather than through setattr(), which would go through the
+        # indexed/mapped attribute parsing of _ParameterAttributeHandler.__setattr__.
+        instance.__dict__[self._name] = value
 
     def converter(self, converter):
         """Create a new ParameterAttribute with an associated converter.
@@ -394,26 +564,29 @@ class ParameterAttribute:
 
     def _is_valid_default(self, value):
         """Return True if this is a defined default value."""
-        return (
-            self.default is not ParameterAttribute.UNDEFINED and value == self.default
-        )
+        default = self.default
+        if default is ParameterAttribute.UNDEFINED:
+            return False
+        # Check the identity first to avoid comparing Quantity objects for the
+        # common case of None defaults.
+        return value is default or value == default
 
     def _validate_units(self, value):
         """Convert strings expressions to Quantity and validate the units if requested."""
         if self._unit is not None:
             # Convert eventual strings to Quantity objects.
-            value = object_to_quantity(value)
+            value = _to_quantity(value)
 
             # Check if units are compatible.
             try:
-                if not self._unit.is_compatible_with(value.units):
+                if not _units_are_compatible(self._unit, value._units):
                     raise IncompatibleUnitError(
-                        f"{self.name}={value} should have units of {self._unit}"
+                        f"{self._public_name}={value} should have units of {self._unit}"
                     )
             except AttributeError:
                 # This is not a Quantity object.
                 raise IncompatibleUnitError(
-                    f"{self.name}={value} should have units of {self._unit}"
+                    f"{self._public_name}={value} should have units of {self._unit}"
                 )
         return value
 
@@ -504,13 +677,26 @@ class IndexedParameterAttribute(ParameterAttribute):
         if self._is_valid_default(value):
             return value
 
+        # Convert and validate the whole sequence at once here, skipping the
+        # steps that are no-ops for this attribute (i.e., no unit or converter).
+        if self._unit is not None:
+            validate_units = self._validate_units
+            value = [validate_units(element) for element in value]
+        if self._converter is not None:
+            call_converter = self._call_converter
+            value = [call_converter(element, instance) for element in value]
+
         # We push the converters into a ValidatedList so that we can make
         # sure that elements are validated correctly when they are modified
         # after their initialization.
         # ValidatedList expects converters that take the value as a single
         # argument so we create a partial function with the instance assigned.
         static_converter = functools.partial(self._call_converter, instance=instance)
-        value = ValidatedList(value, converter=[self._validate_units, static_converter])
+        value = ValidatedList(
+            value,
+            converter=[self._validate_units, static_converter],
+            already_validated=True,
+        )
 
         return value
 
@@ -679,6 +865,24 @@ class IndexedMappedParameterAttribute(ParameterAttribute):
         return ValidatedDict(x)
 
 
+# Match the name and (1-based) index of indexed attributes (e.g. 'k2' -> 'k', '2').
+_INDEXED_ATTRIBUTE_REGEX = re.compile(r"^(.*?)([1-9][0-9]*)$")
+
+# Precomputed (1-based) suffixes of the serialized indexed attributes.
+_INDEX_SUFFIXES = tuple(str(index) for index in range(1, 33))
+
+_NO_DUPLICATE_ATTRIBUTES: FrozenSet[str] = frozenset()
+
+
+def _index_suffixes(n_terms: int) -> Tuple[str, ...]:
+    """Return the suffixes '1', '2', ... of an indexed attribute with ``n_terms`` terms."""
+    if n_terms <= len(_INDEX_SUFFIXES):
+        return _INDEX_SUFFIXES[:n_terms]
+    return _INDEX_SUFFIXES + tuple(
+        str(index) for index in range(len(_INDEX_SUFFIXES) + 1, n_terms + 1)
+    )
+
+
 class _ParameterAttributeHandler:
     """A base class for ``ParameterType`` and ``ParameterHandler`` objects.
 
@@ -807,6 +1011,73 @@ class _ParameterAttributeHandler:
 
     """
 
+    # Per-class caches of the ParameterAttribute descriptors, in declaration
+    # order. These are populated in __init_subclass__ for every subclass.
+    _cls_all_attrs: Dict[str, ParameterAttribute] = dict()
+    _cls_indexed_attrs: Dict[str, ParameterAttribute] = dict()
+    _cls_mapped_attrs: Dict[str, ParameterAttribute] = dict()
+    _cls_indexed_mapped_attrs: Dict[str, ParameterAttribute] = dict()
+    _cls_required_attrs: Dict[str, ParameterAttribute] = dict()
+    _cls_optional_attrs: Dict[str, ParameterAttribute] = dict()
+    # (name, storage name, default, kind, omit_if_none) for each attribute in
+    # the order used by to_dict().
+    _cls_serialization_order: Tuple[Tuple[str, str, Any, str, bool], ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """Collect the ParameterAttribute descriptors of the new class once."""
+        super().__init_subclass__(**kwargs)
+
+        # Go through MRO and merge also parents descriptors, which are
+        # registered on each class by ParameterAttribute.__set_name__. Here
+        # we want the order to be the same as the declaration order, which is
+        # guaranteed by PEP 520, starting from the parent class.
+        all_attrs = dict()
+        for c in reversed(cls.__mro__):
+            all_attrs.update(c.__dict__.get("_own_parameter_attributes", {}))
+
+        def _select(condition):
+            return {name: attr for name, attr in all_attrs.items() if condition(attr)}
+
+        cls._cls_all_attrs = all_attrs
+        cls._cls_indexed_attrs = _select(
+            lambda x: isinstance(x, IndexedParameterAttribute)
+        )
+        cls._cls_mapped_attrs = _select(
+            lambda x: isinstance(x, MappedParameterAttribute)
+        )
+        cls._cls_indexed_mapped_attrs = _select(
+            lambda x: isinstance(x, IndexedMappedParameterAttribute)
+        )
+        cls._cls_required_attrs = _select(lambda x: x.default is x.UNDEFINED)
+        cls._cls_optional_attrs = _select(lambda x: x.default is not x.UNDEFINED)
+
+        def _serialization_kind(name):
+            if name in cls._cls_indexed_mapped_attrs:
+                return "indexed_mapped"
+            elif name in cls._cls_indexed_attrs:
+                return "indexed"
+            elif name in cls._cls_mapped_attrs:
+                return "mapped"
+            elif name == "version":
+                return "version"
+            return "plain"
+
+        # Required attributes come first, then the optional ones. Optional
+        # attributes with a None default are omitted when they are None.
+        cls._cls_serialization_order = tuple(
+            (
+                name,
+                attr._name,
+                attr.default,
+                _serialization_kind(name),
+                attr.default is None,
+            )
+            for name, attr in [
+                *cls._cls_required_attrs.items(),
+                *cls._cls_optional_attrs.items(),
+            ]
+        )
+
     def __init__(self, allow_cosmetic_attributes=False, **kwargs):
         """
         Initialize parameter and cosmetic attributes.
@@ -820,12 +1091,15 @@ class _ParameterAttributeHandler:
             an exception will be raised.
 
         """
-        # A list that may be populated to record the cosmetic attributes
-        # read from a SMIRNOFF data source.
-        self._cosmetic_attribs = []
+        # Maps the names of the cosmetic attributes read from a SMIRNOFF data source
+        # to the names they are stored under. A dict keeps them in insertion order for
+        # serialization while making membership checks, additions and deletions O(1).
+        self._cosmetic_attribs = {}
 
-        # Do not modify the original data.
-        smirnoff_data = copy.deepcopy(kwargs)
+        # Do not modify the original data. Only the top-level dictionary is
+        # modified below (indexed and mapped attributes are collected into new
+        # containers), so a shallow copy is sufficient.
+        smirnoff_data = dict(kwargs)
 
         (
             smirnoff_data,
@@ -838,9 +1112,11 @@ class _ParameterAttributeHandler:
         smirnoff_data = self._process_mapped_attributes(smirnoff_data)
 
         # Check for missing required arguments.
-        given_attributes = set(smirnoff_data.keys())
-        required_attributes = set(self._get_required_parameter_attributes().keys())
-        missing_attributes = required_attributes.difference(given_attributes)
+        missing_attributes = [
+            name
+            for name in self._get_required_parameter_attributes()
+            if name not in smirnoff_data
+        ]
         if len(missing_attributes) != 0:
             msg = (
                 f"{self.__class__} require the following missing parameters: {sorted(missing_attributes)}."
@@ -849,7 +1125,9 @@ class _ParameterAttributeHandler:
             raise SMIRNOFFSpecError(msg)
 
         # Finally, set attributes of this ParameterType and handle cosmetic attributes.
-        allowed_attributes = set(self._get_parameter_attributes().keys())
+        # The cached descriptor dictionary of the class supports hashed membership
+        # tests, so there is no need to build a new set for every instance.
+        allowed_attributes = self._get_parameter_attributes()
         for key, val in smirnoff_data.items():
             if key in allowed_attributes:
                 setattr(self, key, val)
@@ -865,12 +1143,17 @@ class _ParameterAttributeHandler:
                 raise SMIRNOFFSpecError(msg)
 
     def _process_mapped_attributes(self, smirnoff_data):
+        mapped_attributes = self._get_mapped_parameter_attributes()
+        # Most parameter types have no mapped attributes, so skip the per-kwarg scan.
+        if len(mapped_attributes) == 0:
+            return smirnoff_data
+
         kwargs = list(smirnoff_data.keys())
         for kwarg in kwargs:
             attr_name, key = self._split_attribute_mapping(kwarg)
 
             # Check if this is a mapped attribute
-            if key is not None and attr_name in self._get_mapped_parameter_attributes():
+            if key is not None and attr_name in mapped_attributes:
                 if attr_name not in smirnoff_data:
                     smirnoff_data[attr_name] = dict()
 
@@ -883,6 +1166,11 @@ class _ParameterAttributeHandler:
         # TODO: construct data structure for holding indexed_mapped attrs, which
         # will get fed into setattr
         indexed_mapped_attr_lengths = {}
+        indexed_mapped_attributes = self._get_indexed_mapped_parameter_attributes()
+        # Most parameter types have no indexed mapped attributes, so skip the per-kwarg scan.
+        if len(indexed_mapped_attributes) == 0:
+            return smirnoff_data, indexed_mapped_attr_lengths
+
         reindex = set()
         reverse = defaultdict(dict)
 
@@ -894,7 +1182,7 @@ class _ParameterAttributeHandler:
             if (
                 (key is not None)
                 and (index is not None)
-                and attr_name in self._get_indexed_mapped_parameter_attributes()
+                and attr_name in indexed_mapped_attributes
             ):
 
                 # we start with a dict because have no guarantee of order
@@ -950,50 +1238,48 @@ class _ParameterAttributeHandler:
         # Check for indexed attributes and stack them into a list.
         # Keep track of how many indexed attribute we find to make sure they all have the same length.
 
-        # TODO: REFACTOR ME; try looping over contents of `smirnoff_data`, using
-        # `split_attribute_index` to extract values
-
         if indexed_attr_lengths is None:
             indexed_attr_lengths = {}
 
-        for attrib_basename in self._get_indexed_parameter_attributes().keys():
-            index = 1
-            while True:
-                attrib_w_index = f"{attrib_basename}{index}"
+        indexed_attributes = self._get_indexed_parameter_attributes()
 
-                # Exit the while loop if the indexed attribute is not given.
-                # this is the stop condition
-                try:
-                    attrib_w_index_value = smirnoff_data[attrib_w_index]
-                except KeyError:
-                    break
-
-                # Check if this is the first iteration.
-                if index == 1:
-                    # Check if this attribute has been specified with and without index.
-                    if attrib_basename in smirnoff_data:
-                        err_msg = (
-                            f"The attribute '{attrib_basename}' has been specified "
-                            f"with and without index: '{attrib_w_index}'"
-                        )
-                        raise TypeError(err_msg)
+        # Classify all the given kwargs in a single pass, collecting the
+        # keys of each indexed attribute by their (1-based) index. Parameter
+        # types without indexed attributes need no scan at all.
+        indexed_keys = defaultdict(dict)
+        if len(indexed_attributes) != 0:
+            for key in smirnoff_data:
+                match = _INDEXED_ATTRIBUTE_REGEX.match(key)
+                if match is not None and match.group(1) in indexed_attributes:
+                    indexed_keys[match.group(1)][int(match.group(2))] = key
 
-                    # Otherwise create the list object.
-                    smirnoff_data[attrib_basename] = list()
+        for attrib_basename in indexed_attributes:
+            keys_by_index = indexed_keys.get(attrib_basename, {})
 
-                # Append the new value to the list.
-                smirnoff_data[attrib_basename].append(attrib_w_index_value)
+            # The indexed attribute is not given.
+            if 1 not in keys_by_index:
+                continue
+
+            # Check if this attribute has been specified with and without index.
+            if attrib_basename in smirnoff_data:
+                err_msg = (
+                    f"The attribute '{attrib_basename}' has been specified "
+                    f"with and without index: '{keys_by_index[1]}'"
+                )
+                raise TypeError(err_msg)
 
-                # Remove the indexed attribute from the kwargs as it will
-                # be exposed only as an element of the list.
-                del smirnoff_data[attrib_w_index]
+            # Stack the values of contiguous indices into a list. The indexed
+            # attributes are removed from the kwargs as they will be exposed
+            # only as an element of the list.
+            attrib_values = list()
+            index = 1
+            while index in keys_by_index:
+                attrib_values.append(smirnoff_data.pop(keys_by_index[index]))
                 index += 1
+            smirnoff_data[attrib_basename] = attrib_values
 
-            # Update the lengths with this attribute (if it was found).
-            if index > 1:
-                indexed_attr_lengths[attrib_basename] = len(
-                    smirnoff_data[attrib_basename]
-                )
+            # Update the lengths with this attribute.
+            indexed_attr_lengths[attrib_basename] = len(attrib_values)
 
         # Raise an error if we there are different indexed
         # attributes with a different number of terms.
@@ -1027,55 +1313,67 @@ class _ParameterAttributeHandler:
             The SMIRNOFF-compliant dict representation of this object.
 
         """
-        # Make a list of all attribs that should be included in the
-        # returned dict (call list() to make a copy). We discard
-        # optional attributes that are set to None defaults.
-        attribs_to_return = list(self._get_defined_parameter_attributes().keys())
-
-        if duplicate_attributes is not None:
-            for duplicate in duplicate_attributes:
-                try:
-                    attribs_to_return.pop(attribs_to_return.index(duplicate))
-                except ValueError:
-                    # The attribute was not in the list
-                    continue
+        return dict(
+            self._iter_smirnoff_items(
+                discard_cosmetic_attributes=discard_cosmetic_attributes,
+                duplicate_attributes=duplicate_attributes,
+            )
+        )
 
-        # Start populating a dict of the attribs.
-        indexed_attribs = set(self._get_indexed_parameter_attributes().keys())
-        mapped_attribs = set(self._get_mapped_parameter_attributes().keys())
-        indexed_mapped_attribs = set(
-            self._get_indexed_mapped_parameter_attributes().keys()
+    def _iter_smirnoff_items(
+        self, discard_cosmetic_attributes=False, duplicate_attributes=None
+    ):
+        """Yield the (key, value) pairs of the dict returned by ``to_dict()``, in order."""
+        duplicate_attributes = (
+            frozenset(duplicate_attributes)
+            if duplicate_attributes
+            else _NO_DUPLICATE_ATTRIBUTES
         )
-        smirnoff_dict = dict()
 
-        # If attribs_to_return is ordered here, that will effectively be an informal output ordering
-        for attrib_name in attribs_to_return:
-            attrib_value = getattr(self, attrib_name)
+        # The order of _cls_serialization_order is effectively an informal output ordering.
+        # Read the values stored by the ParameterAttribute descriptors directly
+        # rather than calling each descriptor's __get__().
+        instance_dict = self.__dict__
+        for (
+            attrib_name,
+            storage_name,
+            default,
+            kind,
+            omit_if_none,
+        ) in self._cls_serialization_order:
+            if attrib_name in duplicate_attributes:
+                continue
+            attrib_value = instance_dict.get(storage_name, default)
+            if attrib_value is ParameterAttribute.UNDEFINED:
+                # Let the descriptor raise the usual AttributeError.
+                attrib_value = getattr(self, attrib_name)
+            # We discard optional attributes that are set to None defaults.
+            if omit_if_none and attrib_value is None:
+                continue
 
-            if attrib_name in indexed_mapped_attribs:
-                for idx, mapping in enumerate(attrib_value):
+            if kind == "plain":
+                yield attrib_name, attrib_value
+            elif kind == "indexed_mapped":
+                attrib_name_indexed, attrib_name_mapped = attrib_name.split("_")
+                suffixes = _index_suffixes(len(attrib_value))
+                for suffix, mapping in zip(suffixes, attrib_value):
+                    prefix = f"{attrib_name_indexed}{suffix}_{attrib_name_mapped}"
                     for key, val in mapping.items():
-                        attrib_name_indexed, attrib_name_mapped = attrib_name.split("_")
-                        smirnoff_dict[
-                            f"{attrib_name_indexed}{str(idx+1)}_{attrib_name_mapped}{key}"
-                        ] = val
-            elif attrib_name in indexed_attribs:
-                for idx, val in enumerate(attrib_value):
-                    smirnoff_dict[attrib_name + str(idx + 1)] = val
-            elif attrib_name in mapped_attribs:
+                        yield f"{prefix}{key}", val
+            elif kind == "indexed":
+                suffixes = _index_suffixes(len(attrib_value))
+                for suffix, val in zip(suffixes, attrib_value):
+                    yield attrib_name + suffix, val
+            elif kind == "mapped":
                 for key, val in attrib_value.items():
-                    smirnoff_dict[f"{attrib_name}{str(key)}"] = val
-            elif attrib_name == "version":
-                smirnoff_dict[attrib_name] = str(attrib_value)
+                    yield f"{attrib_name}{str(key)}", val
             else:
-                smirnoff_dict[attrib_name] = attrib_value
+                yield attrib_name, str(attrib_value)
 
         # Serialize cosmetic attributes.
         if not (discard_cosmetic_attributes):
-            for cosmetic_attrib in self._cosmetic_attribs:
-                smirnoff_dict[cosmetic_attrib] = getattr(self, "_" + cosmetic_attrib)
-
-        return smirnoff_dict
+            for cosmetic_attrib, storage_name in self._cosmetic_attribs.items():
+                yield cosmetic_attrib, getattr(self, storage_name)
 
     def __getattr__(self, item):
         """Take care of mapping indexed attributes to their respective list elements."""
@@ -1128,6 +1426,12 @@ class _ParameterAttributeHandler:
     def __setattr__(self, key, value):
         """Take care of mapping indexed attributes to their respective list elements."""
 
+        # Declared attributes are handled by their descriptors, so there is no
+        # need to check whether the name refers to an indexed/mapped element.
+        if key in self._cls_all_attrs:
+            super().__setattr__(key, value)
+            return
+
         # Try matching the case where there are two indices
         # this indicates a index_mapped parameter
         attr_name, index, mapkey = self._split_attribute_index_mapping(key)
@@ -1188,8 +1492,9 @@ class _ParameterAttributeHandler:
             The value of the attribute to define for this object.
 
         """
-        setattr(self, "_" + attr_name, attr_value)
-        self._cosmetic_attribs.append(attr_name)
+        storage_name = sys.intern("_" + attr_name)
+        setattr(self, storage_name, attr_value)
+        self._cosmetic_attribs[attr_name] = storage_name
 
     def delete_cosmetic_attribute(self, attr_name):
         """
@@ -1205,8 +1510,7 @@ class _ParameterAttributeHandler:
         """
         # TODO: Can we handle this by overriding __delattr__ instead?
         #  Would we also need to override __del__ as well to cover both deletation methods?
-        delattr(self, "_" + attr_name)
-        self._cosmetic_attribs.remove(attr_name)
+        delattr(self, self._cosmetic_attribs.pop(attr_name))
 
     def attribute_is_cosmetic(self, attr_name):
         """
@@ -1303,9 +1607,10 @@ class _ParameterAttributeHandler:
     def _get_parameter_attributes(cls, filter=None):
         """Return all the attributes of the parameters.
 
-        This is constructed dynamically by introspection gathering all
-        the descriptors that are instances of the ParameterAttribute class.
-        Parent classes of the parameter types are inspected as well.
+        This is constructed by introspection gathering all the descriptors
+        that are instances of the ParameterAttribute class. Parent classes
+        of the parameter types are inspected as well. The introspection is
+        performed only once per class, when the class is created.
 
         Note that since Python 3.6 the order of the class attribute definition
         is preserved (see PEP 520) so this function will return the attribute
@@ -1322,7 +1627,9 @@ class _ParameterAttributeHandler:
         -------
         parameter_attributes : Dict[str, ParameterAttribute]
             A map from the name of the controlled parameter to the
-            ParameterAttribute descriptor handling it.
+            ParameterAttribute descriptor handling it. When ``filter`` is
+            not specified, this is the cached dictionary of the class and
+            must not be modified.
 
         Examples
         --------
@@ -1333,57 +1640,38 @@ class _ParameterAttributeHandler:
         True
 
         """
-        # If no filter is specified, get all the parameters.
         if filter is None:
-
-            def filter(x):
-                return True
-
-        # Go through MRO and retrieve also parents descriptors. The function
-        # inspect.getmembers() automatically resolves the MRO, but it also
-        # sorts the attribute alphabetically by name. Here we want the order
-        # to be the same as the declaration order, which is guaranteed by PEP 520,
-        # starting from the parent class.
-        parameter_attributes = dict(
-            (name, descriptor)
-            for c in reversed(inspect.getmro(cls))
-            for name, descriptor in c.__dict__.items()
-            if isinstance(descriptor, ParameterAttribute) and filter(descriptor)
-        )
-        return parameter_attributes
+            return cls._cls_all_attrs
+        return {
+            name: descriptor
+            for name, descriptor in cls._cls_all_attrs.items()
+            if filter(descriptor)
+        }
 
     @classmethod
     def _get_indexed_mapped_parameter_attributes(cls):
         """Shortcut to retrieve only IndexedMappedParameterAttributes."""
-        return cls._get_parameter_attributes(
-            filter=lambda x: isinstance(x, IndexedMappedParameterAttribute)
-        )
+        return cls._cls_indexed_mapped_attrs
 
     @classmethod
     def _get_indexed_parameter_attributes(cls):
         """Shortcut to retrieve only IndexedParameterAttributes."""
-        return cls._get_parameter_attributes(
-            filter=lambda x: isinstance(x, IndexedParameterAttribute)
-        )
+        return cls._cls_indexed_attrs
 
     @classmethod
     def _get_mapped_parameter_attributes(cls):
         """Shortcut to retrieve only IndexedParameterAttributes."""
-        return cls._get_parameter_attributes(
-            filter=lambda x: isinstance(x, MappedParameterAttribute)
-        )
+        return cls._cls_mapped_attrs
 
     @classmethod
     def _get_required_parameter_attributes(cls):
         """Shortcut to retrieve only required ParameterAttributes."""
-        return cls._get_parameter_attributes(filter=lambda x: x.default is x.UNDEFINED)
+        return cls._cls_required_attrs
 
     @classmethod
     def _get_optional_parameter_attributes(cls):
         """Shortcut to retrieve only required ParameterAttributes."""
-        return cls._get_parameter_attributes(
-            filter=lambda x: x.default is not x.UNDEFINED
-        )
+        return cls._cls_optional_attrs
 
     def _get_defined_parameter_attributes(self):
         """Returns all the attributes except for the optional attributes that have None default value.
@@ -1391,18 +1679,13 @@ class _ParameterAttributeHandler:
         This returns first the required attributes and then the defined optional
         attribute in their respective declaration order.
         """
-        required = self._get_required_parameter_attributes()
-        optional = self._get_optional_parameter_attributes()
+        defined = dict(self._get_required_parameter_attributes())
         # Filter the optional parameters that are set to their default.
-        optional = dict(
-            (name, descriptor)
-            for name, descriptor in optional.items()
-            if not (
-                descriptor.default is None and getattr(self, name) == descriptor.default
-            )
-        )
-        required.update(optional)
-        return required
+        for name, descriptor in self._get_optional_parameter_attributes().items():
+            if descriptor.default is None and getattr(self, name) is None:
+                continue
+            defined[name] = descriptor
+        return defined
 
 
 # We can't actually make this derive from dict, because it's possible for the user to change SMIRKS
@@ -1416,7 +1699,11 @@ class ParameterList(list):
 
     """
 
-    # TODO: Make this faster by caching SMARTS -> index lookup?
+    __slots__ = ("_smirks_to_index", "_smirks_to_index_generation")
+
+    # Incremented whenever the SMIRKS of an existing ParameterType is reassigned.
+    # The SMIRKS -> index maps built before that are then out of date.
+    _smirks_generation = 0
 
     # TODO: Override __del__ to make sure we don't remove root atom type
 
@@ -1433,12 +1720,14 @@ class ParameterList(list):
             A pre-existing list of ParameterType-based objects. If None, this ParameterList
             will be initialized empty.
         """
-        super().__init__()
-
-        input_parameter_list = input_parameter_list or []
         # TODO: Should a ParameterList only contain a single kind of ParameterType?
-        for input_parameter in input_parameter_list:
-            self.append(input_parameter)
+        super().__init__(input_parameter_list or ())
+
+        # Lazily built map of SMIRKS -> index of its first occurrence. It is
+        # invalidated on any structural change to the list, and rebuilt if the
+        # SMIRKS of a parameter was reassigned since it was built.
+        self._smirks_to_index = None
+        self._smirks_to_index_generation = None
 
     def append(self, parameter):
         """
@@ -1451,24 +1740,36 @@ class ParameterList(list):
         """
         # TODO: Ensure that newly added parameter is the same type as existing?
         super().append(parameter)
+        index_map = self._smirks_to_index
+        if index_map is not None:
+            index_map.setdefault(parameter.smirks, len(self) - 1)
 
     def extend(self, other):
         """
-        Add a ParameterList object to the end of the ParameterList
+        Add the ParameterType objects of a ParameterList (or any other iterable
+        of ParameterType objects) to the end of the ParameterList
 
         Parameters
         ----------
-        other : a ParameterList
+        other : a ParameterList or iterable of ParameterType objects
 
         """
         if not isinstance(other, ParameterList):
-            msg = (
-                "ParameterList.extend(other) expected instance of ParameterList, "
-                f"but received {other} (type {type(other)}) instead"
-            )
-            raise TypeError(msg)
+            other = list(other)
+            for parameter in other:
+                if not isinstance(parameter, ParameterType):
+                    msg = (
+                        "ParameterList.extend(other) expected an iterable of ParameterType objects, "
+                        f"but received {parameter} (type {type(parameter)}) in it instead"
+                    )
+                    raise TypeError(msg)
         # TODO: Check if other ParameterList contains the same ParameterTypes?
+        offset = len(self)
         super().extend(other)
+        index_map = self._smirks_to_index
+        if index_map is not None:
+            for index in range(offset, len(self)):
+                index_map.setdefault(list.__getitem__(self, index).smirks, index)
 
     def index(self, item):
         """
@@ -1493,10 +1794,26 @@ class ParameterList(list):
         if isinstance(item, ParameterType):
             return super().index(item)
         else:
-            for parameter in self:
-                if parameter.smirks == item:
-                    return self.index(parameter)
-            raise ParameterLookupError(f"SMIRKS {item} not found in ParameterList")
+            index = self._index_of_smirks(item)
+            if index is None:
+                raise ParameterLookupError(f"SMIRKS {item} not found in ParameterList")
+            return index
+
+    def _index_of_smirks(self, smirks):
+        """Return the index of the first parameter with the given SMIRKS, or None."""
+        index_map = self._smirks_to_index
+        if (
+            index_map is None
+            or self._smirks_to_index_generation != ParameterList._smirks_generation
+        ):
+            index_map = self._smirks_to_index = {}
+            self._smirks_to_index_generation = ParameterList._smirks_generation
+            for index, parameter in enumerate(list.__iter__(self)):
+                index_map.setdefault(parameter.smirks, index)
+        return index_map.get(smirks)
+
+    def _invalidate_smirks_index(self):
+        self._smirks_to_index = None
 
     def insert(self, index, parameter):
         """
@@ -1511,6 +1828,7 @@ class ParameterList(list):
         """
         # TODO: Ensure that newly added parameter is the same type as existing?
         super().insert(index, parameter)
+        self._invalidate_smirks_index()
 
     def __delitem__(self, item):
         """
@@ -1521,12 +1839,43 @@ class ParameterList(list):
         item : str or int
             SMIRKS or numerical index of item in this ParameterList
         """
-        if type(item) is int:
+        if isinstance(item, (int, slice)):
             index = item
         else:
             # Try to find by SMIRKS
             index = self.index(item)
         super().__delitem__(index)
+        self._invalidate_smirks_index()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._invalidate_smirks_index()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._invalidate_smirks_index()
+        return result
+
+    def pop(self, index=-1):
+        parameter = super().pop(index)
+        self._invalidate_smirks_index()
+        return parameter
+
+    def remove(self, parameter):
+        super().remove(parameter)
+        self._invalidate_smirks_index()
+
+    def clear(self):
+        super().clear()
+        self._invalidate_smirks_index()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._invalidate_smirks_index()
+
+    def reverse(self):
+        super().reverse()
+        self._invalidate_smirks_index()
 
     def __getitem__(self, item):
         """
@@ -1537,15 +1886,31 @@ class ParameterList(list):
         item : str or int
             SMIRKS or numerical index of item in this ParameterList
         """
-        if type(item) is int:
-            index = item
-        elif type(item) is slice:
-            index = item
+        if isinstance(item, (int, slice)):
+            return list.__getitem__(self, item)
         elif isinstance(item, str):
             index = self.index(item)
         elif isinstance(item, ParameterType) or issubclass(item, ParameterType):
             raise ParameterLookupError("Lookup by instance is not supported")
-        return super().__getitem__(index)
+        return list.__getitem__(self, index)
+
+    def get_by_smirks(self, smirks):
+        """
+        Retrieve item by SMIRKS, without the type dispatch of ``__getitem__``.
+
+        Parameters
+        ----------
+        smirks : str
+            SMIRKS of item in this ParameterList
+
+        Raises
+        ------
+        ParameterLookupError if SMIRKS pattern is not found
+        """
+        index = self._index_of_smirks(smirks)
+        if index is None:
+            raise ParameterLookupError(f"SMIRKS {smirks} not found in ParameterList")
+        return list.__getitem__(self, index)
 
     # TODO: Override __setitem__ and __del__ to ensure we can slice by SMIRKS as well
     # This is needed for pickling. See https://github.com/openforcefield/openff-toolkit/issues/411
@@ -1553,7 +1918,8 @@ class ParameterList(list):
     # TODO: Is there a cleaner way (getstate/setstate perhaps?) to allow FFs to be
     #       pickled?
     def __reduce__(self):
-        return (__class__, (list(self),), self.__dict__)
+        # The SMIRKS -> index map is the only instance state and is rebuilt lazily.
+        return (__class__, (list(self),))
 
     def __contains__(self, item):
         """Check to see if either Parameter or SMIRKS is contained in parameter list.
@@ -1564,9 +1930,10 @@ class ParameterList(list):
             SMIRKS of item in this ParameterList
         """
         if isinstance(item, str):
-            # Special case for SMIRKS strings
-            if item in [result.smirks for result in self]:
-                return True
+            # Special case for SMIRKS strings. A ParameterType never compares
+            # equal to a string, so there is no need to scan the list again
+            # when the SMIRKS is not found.
+            return self._index_of_smirks(item) is not None
         # Fall back to traditional access
         return list.__contains__(self, item)
 
@@ -1585,15 +1952,23 @@ class ParameterList(list):
         parameter_list : List[dict]
             A serialized representation of a ParameterList, with each ParameterType it contains converted to dict.
         """
-        parameter_list = list()
+        return [
+            parameter.to_dict(discard_cosmetic_attributes=discard_cosmetic_attributes)
+            for parameter in self
+        ]
 
-        for parameter in self:
-            parameter_dict = parameter.to_dict(
-                discard_cosmetic_attributes=discard_cosmetic_attributes
-            )
-            parameter_list.append(parameter_dict)
 
-        return parameter_list
+class _SmirksParameterAttribute(ParameterAttribute):
+    """A ``ParameterAttribute`` that lets ``ParameterList`` know when a SMIRKS is reassigned."""
+
+    def __set__(self, instance, value):
+        previous = instance.__dict__.get(self._name, ParameterAttribute.UNDEFINED)
+        super().__set__(instance, value)
+        # The SMIRKS set while creating a parameter cannot be in any map yet.
+        if previous is not ParameterAttribute.UNDEFINED and (
+            instance.__dict__[self._name] != previous
+        ):
+            ParameterList._smirks_generation += 1
 
 
 # TODO: Rename to better reflect role as parameter base class?
@@ -1725,7 +2100,7 @@ class ParameterType(_ParameterAttributeHandler):
     _ELEMENT_NAME: Optional[str] = None
 
     # Parameter attributes shared among all parameter types.
-    smirks = ParameterAttribute()
+    smirks = _SmirksParameterAttribute(converter=_intern_smirks)
     id = ParameterAttribute(default=None)
     parent_id = ParameterAttribute(default=None)
 
@@ -1748,11 +2123,9 @@ class ParameterType(_ParameterAttributeHandler):
         super().__init__(allow_cosmetic_attributes=allow_cosmetic_attributes, **kwargs)
 
     def __repr__(self):
-        ret_str = f"<{self.__class__.__name__} with "
-        for attr, val in self.to_dict().items():
-            ret_str += f"{attr}: {val}  "
-        ret_str += ">"
-        return ret_str
+        # Stream the attributes rather than building the full to_dict() output.
+        attrs = "".join(f"{attr}: {val}  " for attr, val in self._iter_smirnoff_items())
+        return f"<{self.__class__.__name__} with {attrs}>"
 
 
 # TODO: Should we have a parameter handler registry?
@@ -1806,20 +2179,18 @@ class ParameterHandler(_ParameterAttributeHandler):
         SMIRNOFFVersionError if an incompatible version is passed in.
 
         """
-        from openff.toolkit.utils.exceptions import SMIRNOFFVersionError
-
         if isinstance(new_version, Version):
             pass
-        elif isinstance(new_version, str):
-            new_version = Version(new_version)
-        elif isinstance(new_version, (float, int)):
-            new_version = Version(str(new_version))
+        elif isinstance(new_version, (str, float, int)):
+            new_version = _parse_version(new_version)
         else:
             raise Exception(f"Could not convert type {type(new_version)}")
 
         # Use PEP-440 compliant version number comparison, if requested
-        if (new_version > self._MAX_SUPPORTED_SECTION_VERSION) or (
-            new_version < self._MIN_SUPPORTED_SECTION_VERSION
+        if not (
+            self._MIN_SUPPORTED_SECTION_VERSION
+            <= new_version
+            <= self._MAX_SUPPORTED_SECTION_VERSION
         ):
             raise SMIRNOFFVersionError(
                 f"SMIRNOFF offxml file was written with version {new_version}, but this version "
@@ -1856,7 +2227,7 @@ class ParameterHandler(_ParameterAttributeHandler):
                     f"0.3 SMIRNOFF spec requires each parameter section to have its own version."
                 )
 
-        # List of ParameterType objects (also behaves like an OrderedDict where keys are SMARTS).
+        # List of ParameterType objects (also behaves like a dict where keys are SMARTS).
         self._parameters = ParameterList()
 
         # Initialize ParameterAttributes and cosmetic attributes.
@@ -1875,12 +2246,15 @@ class ParameterHandler(_ParameterAttributeHandler):
             attribute of the parameter. If False, non-spec kwargs will raise an exception.
 
         """
+        # Look these up once rather than for every key and parameter
+        infotype = self._INFOTYPE
+        if infotype is not None:
+            element_name = infotype._ELEMENT_NAME
+
         for key, val in section_dict.items():
-            if self._INFOTYPE is not None:
-                element_name = self._INFOTYPE._ELEMENT_NAME
-                # Skip sections that aren't the parameter list
-                if key != element_name:
-                    break
+            # Skip sections that aren't the parameter list
+            if infotype is not None and key != element_name:
+                break
             # If there are multiple parameters, this will be a list. If there's just one, make it a list
             if not (isinstance(val, list)):
                 val = [val]
@@ -1889,11 +2263,89 @@ class ParameterHandler(_ParameterAttributeHandler):
             # each parameter_dict, then use it to initialize a ParameterType
             for param_dict in val:
 
-                new_parameter = self._INFOTYPE(
+                new_parameter = infotype(
                     **param_dict, allow_cosmetic_attributes=allow_cosmetic_attributes
                 )
                 self._parameters.append(new_parameter)
 
+    def _load_cached_parameters(self, cache_path) -> bool:
+        """
+        Extend the ParameterList in this ParameterHandler with the parameters pickled at
+        ``cache_path`` by ``_write_parameter_cache``, if possible.
+
+        .. warning :: This API is experimental and subject to change.
+
+        Parameters
+        ----------
+        cache_path : str or pathlib.Path
+            The file storing the pickled parameters. Only point this at trusted locations, since
+            unpickling can execute arbitrary code.
+
+        Returns
+        -------
+        loaded : bool
+            Whether the parameters were loaded. If False, this ParameterHandler is unchanged.
+
+        """
+        try:
+            with open(cache_path, "rb") as cache_file:
+                cached_parameters = pickle.load(cache_file)
+        except FileNotFoundError:
+            return False
+        except Exception:
+            # A corrupt or incompatible pickle can fail in many ways (e.g. a TypeError
+            # when a class changed its constructor); parse the section instead.
+            logger.warning(f"Ignoring unreadable parameter cache {cache_path}")
+            return False
+
+        if not isinstance(cached_parameters, ParameterList) or not all(
+            type(parameter) is self._INFOTYPE for parameter in cached_parameters
+        ):
+            logger.warning(f"Ignoring unexpected parameter cache {cache_path}")
+            return False
+
+        self._parameters.extend(cached_parameters)
+        return True
+
+    def _write_parameter_cache(self, cache_path, parameters):
+        """
+        Pickle ``parameters`` to ``cache_path`` for ``_load_cached_parameters`` to reuse.
+
+        The caller is responsible for choosing a ``cache_path`` that uniquely identifies
+        the data the parameters were created from. Failures to write are logged and
+        otherwise ignored.
+
+        .. warning :: This API is experimental and subject to change.
+
+        Parameters
+        ----------
+        cache_path : str or pathlib.Path
+            The file to write the pickled parameters to.
+        parameters : iterable of ParameterType
+            The parameters to cache, usually the ones just added by ``_add_parameters``.
+
+        """
+        # Write to a temporary file first so that concurrent readers never see
+        # a partially written cache.
+        cache_directory = os.path.dirname(os.path.abspath(cache_path))
+        temporary_path = None
+        try:
+            os.makedirs(cache_directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=cache_directory, delete=False
+            ) as cache_file:
+                temporary_path = cache_file.name
+                pickle.dump(
+                    ParameterList(parameters),
+                    cache_file,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(temporary_path, cache_path)
+        except (OSError, pickle.PicklingError, AttributeError, TypeError):
+            logger.warning(f"Could not write parameter cache {cache_path}")
+            if temporary_path is not None and os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
     @property
     def parameters(self):
         """The ParameterList that holds this ParameterHandler's parameter objects"""
@@ -1964,14 +2416,7 @@ class ParameterHandler(_ParameterAttributeHandler):
 
         key = key if parameter is None else parameter.smirks
 
-        for index, existing_parameter in enumerate(self._parameters):
-
-            if existing_parameter.smirks != key:
-                continue
-
-            return index
-
-        return None
+        return self._parameters._index_of_smirks(key)
 
     # TODO: Can we ensure SMIRKS and other parameters remain valid after manipulation?
     def add_parameter(
@@ -2106,17 +2551,20 @@ class ParameterHandler(_ParameterAttributeHandler):
 
         """
         params = list()
+        # Track the matches in a set as well so that skipping parameters which
+        # already matched a previous attribute doesn't need a scan of params.
+        matched = set()
         for attr, value in parameter_attrs.items():
             for param in self.parameters:
-                if param in params:
+                if param in matched:
                     continue
                 # TODO: Cleaner accessing of cosmetic attributes
                 # See issue #338
-                if param.attribute_is_cosmetic(attr):
-                    attr = "_" + attr
-                if hasattr(param, attr):
-                    if getattr(param, attr) == value:
+                storage_name = param._cosmetic_attribs.get(attr, attr)
+                if hasattr(param, storage_name):
+                    if getattr(param, storage_name) == value:
                         params.append(param)
+                        matched.add(param)
         return params
 
     class _Match:
@@ -2124,6 +2572,9 @@ class ParameterHandler(_ParameterAttributeHandler):
         a given chemical environment.
         """
 
+        # One of these is created per matched term, so avoid a per-instance __dict__.
+        __slots__ = ("_parameter_type", "_environment_match")
+
         @property
         def parameter_type(self):
             """ParameterType: The matched parameter type."""
@@ -2147,7 +2598,18 @@ class ParameterHandler(_ParameterAttributeHandler):
             self._parameter_type = parameter_type
             self._environment_match = environment_match
 
-    def find_matches(self, entity, unique=False):
+    def _valence_terms(self, entity) -> Optional[Union[List[Tuple[int, ...]], NDArray]]:
+        """
+        Return the atom indices of every term in ``entity`` that this handler could
+        assign a parameter to, either as a sequence of tuples or as an integer array
+        with one row per term, or None if that set is not known in advance.
+
+        When this is known, ``_find_matches`` can stop looking at less specific
+        parameters once every term has been assigned.
+        """
+        return None
+
+    def find_matches(self, entity, unique=False, expected_connectivity=None):
         """Find the elements of the topology/molecule matched by a parameter type.
 
         Parameters
@@ -2157,21 +2619,33 @@ class ParameterHandler(_ParameterAttributeHandler):
         unique : bool, default=False
             If False, SMARTS matching will enumerate every valid permutation of matching atoms.
             If True, only one order of each unique match will be returned.
+        expected_connectivity : list of tuple of int, optional
+            If given, check that every returned match has this connectivity (see
+            ``_assert_all_correct_connectivity``), checking matches of identical molecules
+            only once.
 
         Returns
         ---------
         matches : ValenceDict[Tuple[int], ParameterHandler._Match]
             ``matches[atom_indices]`` is the ``ParameterType`` object
             matching the tuple of atom indices in ``entity``.
+
+        Raises
+        ------
+        NotBondedError
+            If ``expected_connectivity`` is given and a match does not have that connectivity.
         """
 
-        return self._find_matches(entity, unique=unique)
+        return self._find_matches(
+            entity, unique=unique, expected_connectivity=expected_connectivity
+        )
 
     def _find_matches(
         self,
         entity,
         transformed_dict_cls=ValenceDict,
         unique=False,
+        expected_connectivity=None,
     ):
         """Implement find_matches() and allow using a difference valence dictionary.
         Parameters
@@ -2186,6 +2660,8 @@ class ParameterHandler(_ParameterAttributeHandler):
         unique : bool, default=False
             If False, SMARTS matching will enumerate every valid permutation of matching atoms.
             If True, only one order of each unique match will be returned.
+        expected_connectivity : list of tuple of int, optional
+            If given, check that every returned match has this connectivity.
 
         Returns
         ---------
@@ -2197,31 +2673,71 @@ class ParameterHandler(_ParameterAttributeHandler):
 
         matches = transformed_dict_cls()
 
-        # TODO: There are probably performance gains to be had here
-        #       by performing this loop in reverse order, and breaking early once
-        #       all environments have been matched.
-        for parameter_type in self._parameters:
+        # Match every SMIRKS in one batch so that the toolkit only has to build
+        # its representation of each unique molecule once.
+        parameters = list(self._parameters)
+        environment_matches_batch = entity.chemical_environment_matches_batch(
+            [
+                _reorder_smirks_fragments(parameter_type.smirks)
+                for parameter_type in parameters
+            ],
+            unique=unique,
+        )
+
+        # Later parameters take precedence over earlier ones. If the handler knows every
+        # term it could be applied to, visit the parameters in reverse order, never
+        # overwrite a term once it has been assigned, and stop as soon as every term
+        # has been assigned.
+        valence_terms = self._valence_terms(entity)
+        if valence_terms is None:
+            parameter_matches = zip(parameters, environment_matches_batch)
+        else:
+            parameter_matches = zip(
+                reversed(parameters), reversed(environment_matches_batch)
+            )
+            # Canonicalize the terms the same way ``matches`` does, but straight
+            # into a set rather than by inserting them into a throwaway dict.
+            key_transform = getattr(transformed_dict_cls(), "key_transform", tuple)
+            if isinstance(valence_terms, np.ndarray):
+                valence_terms = valence_terms.tolist()
+            unassigned_terms = {key_transform(term) for term in valence_terms}
+
+        for parameter_type, environment_matches in parameter_matches:
             matches_for_this_type = {}
 
-            for environment_match in entity.chemical_environment_matches(
-                parameter_type.smirks,
-                unique=unique,
-            ):
+            for environment_match in environment_matches:
                 # Update the matches for this parameter type.
                 handler_match = self._Match(parameter_type, environment_match)
                 matches_for_this_type[
                     environment_match.topology_atom_indices
                 ] = handler_match
 
-            # Update matches of all parameter types.
-            matches.update(matches_for_this_type)
-
             logger.debug(
                 "{:64} : {:8} matches".format(
                     parameter_type.smirks, len(matches_for_this_type)
                 )
             )
 
+            if valence_terms is None:
+                # Update matches of all parameter types.
+                matches.update(matches_for_this_type)
+                continue
+
+            # Only assign terms not already claimed by a later parameter.
+            matches_for_this_type = transformed_dict_cls(matches_for_this_type)
+            for key in matches_for_this_type:
+                if key not in matches:
+                    matches[key] = matches_for_this_type[key]
+                    unassigned_terms.discard(key)
+
+            if not unassigned_terms:
+                break
+
+        # Matches may have been overwritten by later parameters in the loop above,
+        # so only the final ones are checked.
+        if expected_connectivity is not None:
+            self._assert_all_correct_connectivity(matches, expected_connectivity)
+
         logger.debug(f"{len(matches)} matches identified")
         return matches
 
@@ -2250,14 +2766,63 @@ class ParameterHandler(_ParameterAttributeHandler):
         if expected_connectivity is None:
             return
 
-        reference_molecule = match.environment_match.reference_molecule
+        ParameterHandler._assert_environment_match_connectivity(
+            match.environment_match, expected_connectivity
+        )
+
+    @staticmethod
+    def _assert_all_correct_connectivity(matches, expected_connectivity):
+        """Check the connectivity of all ``matches`` in one sweep.
+
+        Matches of copies of the same molecule share their reference molecule and
+        reference atom indices, so each distinct combination is only checked once.
+
+        Parameters
+        ----------
+        matches: dict of ParameterHandler._Match
+            The matches found by `_find_matches`
+        expected_connectivity: list of tuple of int
+            The expected connectivity of each match (e.g. for a torsion
+            expected_connectivity=[(0, 1), (1, 2), (2, 3)]).
+
+        Raises
+        ------
+        NotBondedError
+            If any match does not have the expected connectivity.
+        """
+        checked = set()
+        for match in matches.values():
+            environment_match = match.environment_match
+            key = (
+                id(environment_match.reference_molecule),
+                environment_match.reference_atom_indices,
+            )
+            if key in checked:
+                continue
+            checked.add(key)
+            ParameterHandler._assert_environment_match_connectivity(
+                environment_match, expected_connectivity
+            )
+
+    @staticmethod
+    def _assert_environment_match_connectivity(
+        environment_match, expected_connectivity
+    ):
+        """Implement ``_assert_correct_connectivity`` for a ``Topology._ChemicalEnvironmentMatch``."""
+        reference_atom_indices = environment_match.reference_atom_indices
+        # Look the pairs up in the (cached) bonds of the reference molecule
+        # rather than searching the bonds of each atom.
+        bonded_atom_index_pairs = (
+            environment_match.reference_molecule._get_bonds_by_atom_index_pair()
+        )
 
         for connectivity in expected_connectivity:
 
-            atom_i = match.environment_match.reference_atom_indices[connectivity[0]]
-            atom_j = match.environment_match.reference_atom_indices[connectivity[1]]
+            atom_i = reference_atom_indices[connectivity[0]]
+            atom_j = reference_atom_indices[connectivity[1]]
 
-            reference_molecule.get_bond_between(atom_i, atom_j)
+            if (atom_i, atom_j) not in bonded_atom_index_pairs:
+                raise NotBondedError(f"No bond between atom {atom_i} and {atom_j}")
 
     def create_force(self, *args, **kwarsg):
         """
@@ -2298,11 +2863,12 @@ class ParameterHandler(_ParameterAttributeHandler):
             # smirnoff_data[self._INFOTYPE._ELEMENT_NAME] = unitless_parameter_list
             smirnoff_data[self._INFOTYPE._ELEMENT_NAME] = parameter_list
 
-        # Collect parameter and cosmetic attributes.
-        header_attribute_dict = super().to_dict(
-            discard_cosmetic_attributes=discard_cosmetic_attributes
+        # Collect parameter and cosmetic attributes without building an intermediate dict.
+        smirnoff_data.update(
+            self._iter_smirnoff_items(
+                discard_cosmetic_attributes=discard_cosmetic_attributes
+            )
         )
-        smirnoff_data.update(header_attribute_dict)
 
         return smirnoff_data
 
@@ -2320,17 +2886,28 @@ class ParameterHandler(_ParameterAttributeHandler):
         tolerance : float
             The absolute tolerance used to compare the parameters.
         """
+        if other is self:
+            return
 
         def get_unitless_values(attr):
             this_val = getattr(self, attr)
             other_val = getattr(other, attr)
-            # Strip quantities of their units before comparison.
+            # Strip quantities of their units before comparison, so the tolerance check
+            # compares plain floats instead of doing arithmetic on quantities.
             try:
-                this_val.units
+                this_units = this_val.units
             except AttributeError:
                 return this_val, other_val
-            assert this_val.units == other_val.units
-            return this_val.m, other_val.m
+            if other_val.units == this_units:
+                return this_val.m, other_val.m
+            return this_val.m, other_val.m_as(this_units)
+
+        # Compatible handlers are the common case, so compare all the attributes at once
+        # and only look for the one that differs to build the error message. Values that
+        # are exactly equal are also within any tolerance.
+        get_attributes = _get_attributes_getter((*identical_attrs, *tolerance_attrs))
+        if get_attributes(self) == get_attributes(other):
+            return
 
         for attr in identical_attrs:
             this_val, other_val = get_unitless_values(attr)
@@ -2359,6 +2936,15 @@ class ParameterHandler(_ParameterAttributeHandler):
                     f"Mismatch found with attr={attr}, this_val={this_val}, "
                     f"other_val={other_val}"
                 )
+            if isinstance(this_val, str) or isinstance(other_val, str):
+                # Numbers read from OFFXML (e.g. default_idivf="2") are kept as strings.
+                try:
+                    this_val, other_val = float(this_val), float(other_val)
+                except ValueError:
+                    raise IncompatibleParameterError(
+                        f"{attr} values are not compatible. (handler value: "
+                        f"'{this_val}', incompatible value: '{other_val}')."
+                    )
             if abs(this_val - other_val) > tolerance:
                 raise IncompatibleParameterError(
                     "Difference between '{}' values is beyond allowed tolerance {}. "
@@ -2372,6 +2958,8 @@ class ParameterHandler(_ParameterAttributeHandler):
         Syntax sugar for lookikng up a ParameterType in a ParameterHandler
         based on its SMIRKS.
         """
+        if isinstance(val, str):
+            return self._parameters.get_by_smirks(val)
         return self.parameters[val]
 
 
@@ -2426,11 +3014,15 @@ class BondHandler(ParameterHandler):
 
         def __init__(self, **kwargs):
             # these checks enforce mutually-exclusive parameterattribute specifications
-            has_k = "k" in kwargs.keys()
-            has_k_bondorder = any(["k_bondorder" in key for key in kwargs.keys()])
-            has_length = "length" in kwargs.keys()
+            has_k = "k" in kwargs
+            has_length = "length" in kwargs
+            # Bond types rarely mix fractional bond order parameters with fixed ones, so
+            # scan the keys once and only look for the specific attributes among the
+            # (usually zero) keys that refer to bond orders at all.
+            bondorder_keys = [key for key in kwargs if "bondorder" in key]
+            has_k_bondorder = any("k_bondorder" in key for key in bondorder_keys)
             has_length_bondorder = any(
-                ["length_bondorder" in key for key in kwargs.keys()]
+                "length_bondorder" in key for key in bondorder_keys
             )
 
             # Are these errors too general? What about ParametersMissingError/ParametersOverspecifiedError?
@@ -2483,20 +3075,20 @@ class BondHandler(ParameterHandler):
         super().__init__(**kwargs)
         # Default value for fractional_bondorder_interpolation depends on section version
         if (
-            self.version == Version("0.3")
+            self.version == _parse_version("0.3")
             and "fractional_bondorder_method" not in kwargs
         ):
             self.fractional_bondorder_method = "none"
         elif (
-            self.version == Version("0.4")
+            self.version == _parse_version("0.4")
             and "fractional_bondorder_method" not in kwargs
         ):
             self.fractional_bondorder_method = "AM1-Wiberg"
 
         # Default value for potential depends on section version
-        if self.version == Version("0.3") and "potential" not in kwargs:
+        if self.version == _parse_version("0.3") and "potential" not in kwargs:
             self.potential = "harmonic"
-        elif self.version == Version("0.4") and "potential" not in kwargs:
+        elif self.version == _parse_version("0.4") and "potential" not in kwargs:
             self.potential = "(k/2)*(r-length)^2"
 
     def check_handler_compatibility(self, other_handler):
@@ -2536,6 +3128,9 @@ class BondHandler(ParameterHandler):
                     f"(handler value: {self.potential}, incompatible value: {other_handler.potential}"
                 )
 
+    def _valence_terms(self, entity) -> NDArray:
+        return entity._get_bond_atom_indices()
+
 
 class AngleHandler(ParameterHandler):
     """Handle SMIRNOFF ``<AngleForce>`` tags
@@ -2580,6 +3175,9 @@ class AngleHandler(ParameterHandler):
             other_handler, identical_attrs=string_attrs_to_compare
         )
 
+    def _valence_terms(self, entity) -> NDArray:
+        return entity._get_angle_atom_indices()
+
 
 # TODO: There's a lot of duplicated code in ProperTorsionHandler and ImproperTorsionHandler
 class ProperTorsionHandler(ParameterHandler):
@@ -2616,7 +3214,7 @@ class ProperTorsionHandler(ParameterHandler):
         default="k*(1+cos(periodicity*theta-phase))",
         converter=_allow_only(["k*(1+cos(periodicity*theta-phase))"]),
     )
-    default_idivf = ParameterAttribute(default="auto")
+    default_idivf = ParameterAttribute(default="auto", converter=_auto_or_float)
     fractional_bondorder_method = ParameterAttribute(default="AM1-Wiberg")
     fractional_bondorder_interpolation = ParameterAttribute(
         default="linear", converter=_allow_only(["linear"])
@@ -2654,6 +3252,12 @@ class ProperTorsionHandler(ParameterHandler):
             tolerance_attrs=float_attrs_to_compare,
         )
 
+    def _valence_terms(self, entity) -> List[Tuple[int, ...]]:
+        return [
+            tuple(entity.atom_index(atom) for atom in proper)
+            for proper in entity.propers
+        ]
+
 
 # TODO: There's a lot of duplicated code in ProperTorsionHandler and ImproperTorsionHandler
 class ImproperTorsionHandler(ParameterHandler):
@@ -2683,7 +3287,7 @@ class ImproperTorsionHandler(ParameterHandler):
         default="k*(1+cos(periodicity*theta-phase))",
         converter=_allow_only(["k*(1+cos(periodicity*theta-phase))"]),
     )
-    default_idivf = ParameterAttribute(default="auto")
+    default_idivf = ParameterAttribute(default="auto", converter=_auto_or_float)
 
     def check_handler_compatibility(self, other_handler):
         """
@@ -2713,13 +3317,16 @@ class ImproperTorsionHandler(ParameterHandler):
             tolerance_attrs=float_attrs_to_compare,
         )
 
-    def find_matches(self, entity, unique=False):
+    def find_matches(self, entity, unique=False, expected_connectivity=None):
         """Find the improper torsions in the topology/molecule matched by a parameter type.
 
         Parameters
         ----------
         entity : openff.toolkit.topology.Topology
             Topology to search.
+        expected_connectivity : list of tuple of int, optional
+            If given, check that every returned match has this connectivity
+            (e.g. ``[(0, 1), (1, 2), (1, 3)]``).
 
         Returns
         ---------
@@ -2729,7 +3336,10 @@ class ImproperTorsionHandler(ParameterHandler):
 
         """
         return self._find_matches(
-            entity, transformed_dict_cls=ImproperDict, unique=unique
+            entity,
+            transformed_dict_cls=ImproperDict,
+            unique=unique,
+            expected_connectivity=expected_connectivity,
         )
 
 
@@ -2788,12 +3398,12 @@ class vdWHandler(_NonbondedHandler):
                 super().__setattr__("rmin_half", value * 2 ** (1 / 6) / 2.0)
                 self._extra_nb_var = "rmin_half"
 
-        def to_dict(
+        def _iter_smirnoff_items(
             self,
             discard_cosmetic_attributes=False,
             duplicate_attributes=None,
         ):
-            return super().to_dict(
+            return super()._iter_smirnoff_items(
                 discard_cosmetic_attributes=discard_cosmetic_attributes,
                 duplicate_attributes=[
                     *([] if duplicate_attributes is None else duplicate_attributes),
@@ -2898,13 +3508,34 @@ class ElectrostaticsHandler(_NonbondedHandler):
         "k_rf=(cutoff^(-3))*(solvent_dielectric-1)/(2*solvent_dielectric+1);"
         "c_rf=cutoff^(-1)*(3*solvent_dielectric)/(2*solvent_dielectric+1)"
     )
+    # The 0.4 potentials each 0.3 ``method`` is split into (see OFF-EP-0005), looked up
+    # instead of branching on the method when up-converting.
+    _POTENTIALS_FROM_0_3_METHOD = {
+        "PME": {
+            "periodic_potential": "Ewald3D-ConductingBoundary",
+            "nonperiodic_potential": "Coulomb",
+            "exception_potential": "Coulomb",
+        },
+        "Coulomb": {
+            "periodic_potential": "Coulomb",
+            "nonperiodic_potential": "Coulomb",
+            "exception_potential": "Coulomb",
+        },
+        "reaction-field": {
+            "periodic_potential": _DEFAULT_REACTION_FIELD_EXPRESSION,
+            "nonperiodic_potential": "Coulomb",
+            "exception_potential": "Coulomb",
+        },
+    }
 
     scale12 = ParameterAttribute(default=0.0, converter=float)
     scale13 = ParameterAttribute(default=0.0, converter=float)
     scale14 = ParameterAttribute(default=0.833333, converter=float)
     scale15 = ParameterAttribute(default=1.0, converter=float)
     cutoff = ParameterAttribute(default=9.0 * unit.angstrom, unit=unit.angstrom)
-    switch_width = ParameterAttribute(default=0.0 * unit.angstrom, unit=unit.angstrom)
+    # The only supported switch width, built once instead of on every assignment
+    _ZERO_SWITCH_WIDTH = 0.0 * unit.angstrom
+    switch_width = ParameterAttribute(default=_ZERO_SWITCH_WIDTH, unit=unit.angstrom)
     solvent_dielectric = ParameterAttribute(default=None)
 
     # TODO: How to validate arbitrary algebra in a converter?
@@ -2956,7 +3587,7 @@ class ElectrostaticsHandler(_NonbondedHandler):
 
     @switch_width.converter
     def switch_width(self, attr, new_switch_width):
-        if new_switch_width not in [0.0 * unit.angstrom, None, "None", "none"]:
+        if new_switch_width not in (self._ZERO_SWITCH_WIDTH, None, "None", "none"):
             raise SMIRNOFFSpecUnimplementedError(
                 "The current implementation of the OpenFF Toolkit does not support an electrostatic "
                 f"switch width (passed a value of {new_switch_width}). Currently only `0.0 angstroms` is supported "
@@ -2998,45 +3629,25 @@ class ElectrostaticsHandler(_NonbondedHandler):
             logger.info(
                 "Attempting to up-convert Electrostatics section from 0.3 to 0.4"
             )
+            method = kwargs.pop("method", None)
             # Default value in 0.3 is "PME", so we have to handle these cases identically
-            if kwargs.get("method") in ["PME", None]:
-                kwargs["periodic_potential"] = "Ewald3D-ConductingBoundary"
-                kwargs["nonperiodic_potential"] = "Coulomb"
-                kwargs["exception_potential"] = "Coulomb"
-                kwargs["version"] = 0.4
-                kwargs.pop("method", None)
-                logger.info(
-                    'Successfully up-converted Electrostatics section from 0.3 to 0.4. `method="PME"` '
-                    'is now split into `periodic_potential="Ewald3D-ConductingBoundary"`, '
-                    '`nonperiodic_potential="Coulomb"`, and `exception_potential="Coulomb"`.'
-                )
-            elif kwargs["method"] == "Coulomb":
-                kwargs["periodic_potential"] = "Coulomb"
-                kwargs["nonperiodic_potential"] = "Coulomb"
-                kwargs["exception_potential"] = "Coulomb"
-                kwargs["version"] = 0.4
-                kwargs.pop("method", None)
-                logger.info(
-                    'Successfully up-converted Electrostatics section from 0.3 to 0.4. `method="Coulomb"` '
-                    'is now split into `periodic_potential="Coulob"`, '
-                    '`nonperiodic_potential="Coulomb"`, and `exception_potential="Coulomb"`.'
-                )
-            elif kwargs["method"] == "reaction-field":
-                kwargs["periodic_potential"] = self._DEFAULT_REACTION_FIELD_EXPRESSION
-                kwargs["nonperiodic_potential"] = "Coulomb"
-                kwargs["exception_potential"] = "Coulomb"
-                kwargs["version"] = 0.4
-                kwargs.pop("method", None)
-                logger.info(
-                    'Successfully up-converted Electrostatics section from 0.3 to 0.4. `method="Coulomb"` '
-                    f'is now split into `periodic_potential="{self._DEFAULT_REACTION_FIELD_EXPRESSION}"` '
-                    '`nonperiodic_potential="Coulomb"`, and `exception_potential="Coulomb"`.'
-                )
-            else:
+            if method is None:
+                method = "PME"
+            try:
+                potentials = self._POTENTIALS_FROM_0_3_METHOD[method]
+            except KeyError:
                 raise NotImplementedError(
                     "Failed to up-convert Electrostatics section from 0.3 to 0.4. Did not know "
-                    f"how to up-convert `method={kwargs['method']}`."
+                    f"how to up-convert `method={method}`."
                 )
+            kwargs.update(potentials)
+            kwargs["version"] = 0.4
+            logger.info(
+                f'Successfully up-converted Electrostatics section from 0.3 to 0.4. `method="{method}"` '
+                "is now split into "
+                + ", ".join(f'`{name}="{value}"`' for name, value in potentials.items())
+                + "."
+            )
         super().__init__(**kwargs)
 
     def check_handler_compatibility(self, other_handler):
@@ -3086,11 +3697,13 @@ class LibraryChargeHandler(_NonbondedHandler):
         name = ParameterAttribute(default=None)
         charge = IndexedParameterAttribute(unit=unit.elementary_charge)
 
-        def __init__(self, **kwargs):
+        def __init__(self, _skip_smirks_validation=False, **kwargs):
             super().__init__(**kwargs)
-            unique_tags, connectivity = GLOBAL_TOOLKIT_REGISTRY.call(
-                "get_tagged_smarts_connectivity", self.smirks
-            )
+            # Callers that built the SMIRKS and charges together (see from_molecule())
+            # can skip the toolkit call that parses the SMIRKS to count its tagged atoms.
+            if _skip_smirks_validation:
+                return
+            unique_tags, connectivity = _get_tagged_smarts_connectivity(self.smirks)
             if len(self.charge) != len(unique_tags):
                 raise SMIRNOFFSpecError(
                     f"LibraryCharge {self} was initialized with unequal number of "
@@ -3125,7 +3738,11 @@ class LibraryChargeHandler(_NonbondedHandler):
             smirks = molecule.to_smiles(mapped=True)
             charges = molecule.partial_charges
 
-            library_charge_type = cls(smirks=smirks, charge=charges)
+            # A mapped SMILES tags every atom once, so the number of tagged atoms
+            # matches the number of charges by construction.
+            library_charge_type = cls(
+                smirks=smirks, charge=charges, _skip_smirks_validation=True
+            )
 
             return library_charge_type
 
@@ -3202,9 +3819,7 @@ class ChargeIncrementModelHandler(_NonbondedHandler):
 
         def __init__(self, **kwargs):
             super().__init__(**kwargs)
-            unique_tags, connectivity = GLOBAL_TOOLKIT_REGISTRY.call(
-                "get_tagged_smarts_connectivity", self.smirks
-            )
+            unique_tags, connectivity = _get_tagged_smarts_connectivity(self.smirks)
 
             n_tags = len(unique_tags)
             n_increments = len(self.charge_increment)
@@ -3664,8 +4279,6 @@ class VirtualSiteHandler(_NonbondedHandler):
 
     def _find_matches_by_parent(self, entity: Topology) -> Dict[int, list]:
 
-        from collections import defaultdict
-
         topology_atoms = {
             i: topology_atom for i, topology_atom in enumerate(entity.atoms)
         }
@@ -3675,9 +4288,16 @@ class VirtualSiteHandler(_NonbondedHandler):
         # v-site with a given 'name', whereby the last parameter to be matched wins.
         matches_by_parent: Dict = defaultdict(lambda: defaultdict(list))
 
-        for parameter in self._parameters:
+        parameters = list(self._parameters)
+        environment_matches_batch = entity.chemical_environment_matches_batch(
+            [parameter.smirks for parameter in parameters]
+        )
+
+        for parameter, environment_matches in zip(
+            parameters, environment_matches_batch
+        ):
 
-            for match in entity.chemical_environment_matches(parameter.smirks):
+            for match in environment_matches:
                 parent_index = match.topology_atom_indices[parameter.parent_index]
 
                 matches_by_parent[parent_index][parameter.name].append(
@@ -3731,6 +4351,7 @@ class VirtualSiteHandler(_NonbondedHandler):
         entity: Topology,
         transformed_dict_cls=dict,
         unique=False,
+        expected_connectivity=None,
     ) -> Dict[Tuple[int], List[ParameterHandler._Match]]:
 
         assigned_matches_by_parent = self._find_matches_by_parent(entity)
@@ -3741,6 +4362,11 @@ class VirtualSiteHandler(_NonbondedHandler):
 
                 for match in match_orientations:
 
+                    if expected_connectivity is not None:
+                        self._assert_environment_match_connectivity(
+                            match, expected_connectivity
+                        )
+
                     assigned_matches.append(
                         ParameterHandler._Match(assigned_parameter, match)
                     )
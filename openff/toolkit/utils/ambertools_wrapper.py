@@ -383,7 +383,10 @@ class AmberToolsToolkitWrapper(base_wrapper.ToolkitWrapper):
 
             # To make lookup easier, we identify bonds as integer tuples with the lowest atom index
             # first and the highest second.
-            index_tuple = tuple(sorted([atom_index_1, atom_index_2]))
+            if atom_index_1 < atom_index_2:
+                index_tuple = (atom_index_1, atom_index_2)
+            else:
+                index_tuple = (atom_index_2, atom_index_1)
             bond_orders[index_tuple] = bond_order
         return bond_orders
 
@@ -517,9 +520,10 @@ class AmberToolsToolkitWrapper(base_wrapper.ToolkitWrapper):
             # The atom index tuples that act as bond indices are ordered from lowest to highest by
             # _get_fractional_bond_orders_from_sqm_out, so here we make sure that we look them up in
             # sorted order as well
-            sorted_atom_indices = sorted(
-                tuple([bond.atom1_index + 1, bond.atom2_index + 1])
-            )
-            bond.fractional_bond_order = np.mean(
-                bond_orders[tuple(sorted_atom_indices)]
-            )
+            index_1 = bond.atom1_index + 1
+            index_2 = bond.atom2_index + 1
+            if index_1 < index_2:
+                sorted_atom_indices = (index_1, index_2)
+            else:
+                sorted_atom_indices = (index_2, index_1)
+            bond.fractional_bond_order = np.mean(bond_orders[sorted_atom_indices])
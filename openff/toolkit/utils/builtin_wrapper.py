@@ -3,6 +3,7 @@ Built-in ToolkitWrapper for very basic functionality. Intended for testing and n
 """
 __all__ = ("BuiltInToolkitWrapper",)
 
+import numpy as np
 from openff.units import unit
 
 from openff.toolkit.utils import base_wrapper
@@ -123,10 +124,14 @@ class BuiltInToolkitWrapper(base_wrapper.ToolkitWrapper):
             )
 
         if partial_charge_method == "zeros":
-            partial_charges = [0.0] * molecule.n_atoms
+            partial_charges = np.zeros(molecule.n_atoms)
 
         elif partial_charge_method == "formal_charge":
-            partial_charges = [float(atom.formal_charge.m) for atom in molecule.atoms]
+            partial_charges = np.fromiter(
+                (atom.formal_charge.m for atom in molecule.atoms),
+                dtype=np.float64,
+                count=molecule.n_atoms,
+            )
 
         molecule.partial_charges = unit.Quantity(
             partial_charges, unit.elementary_charge
@@ -51,7 +51,7 @@ class ValidatedList(list):
 
     """
 
-    def __init__(self, seq=(), converter=None, validator=None):
+    def __init__(self, seq=(), converter=None, validator=None, already_validated=False):
         """
         Initialize the list.
 
@@ -65,6 +65,10 @@ class ValidatedList(list):
         validator : callable or List[callable]
             Functions that will be used to convert each new element of
             the list.
+        already_validated : bool, optional. Default = False
+            If True, the elements of ``seq`` are assumed to have already
+            been converted and validated, and the converters and validators
+            are run only on elements added after initialization.
 
         """
         # Make sure converter and validator are always iterables.
@@ -76,7 +80,8 @@ class ValidatedList(list):
         self._validators = validator
 
         # Validate and convert the whole sequence.
-        seq = self._convert_and_validate(seq)
+        if not already_validated:
+            seq = self._convert_and_validate(seq)
         super().__init__(seq)
 
     def extend(self, iterable):
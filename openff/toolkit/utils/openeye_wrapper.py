@@ -1492,18 +1492,17 @@ class OpenEyeToolkitWrapper(base_wrapper.ToolkitWrapper):
         oemol.SetTitle(molecule.name)
         # Make lists of OE atoms and OE bonds in the same order as the OFF atoms and OFF bonds
         oemol_atoms = [None] * molecule.n_atoms  # list of corresponding oemol atoms
+        partial_charges = molecule._partial_charges_e
         for oe_atom in oemol.GetAtoms():
             oe_idx = oe_atom.GetIdx()
             oemol_atoms[oe_to_off_idx[oe_idx]] = oe_atom
             off_atom = molecule.atoms[oe_to_off_idx[oe_idx]]
             oe_atom.SetName(off_atom.name)
 
-            if off_atom.partial_charge is None:
+            if partial_charges is None:
                 oe_atom.SetPartialCharge(float("nan"))
             else:
-                oe_atom.SetPartialCharge(
-                    off_atom.partial_charge.m_as(unit.elementary_charge)
-                )
+                oe_atom.SetPartialCharge(float(partial_charges[oe_to_off_idx[oe_idx]]))
             res = oechem.OEAtomGetResidue(oe_atom)
             # If we add residue info without updating the serial number, all of the atom
             # serial numbers in a written PDB will be 0. Note two things:
@@ -1567,13 +1566,10 @@ class OpenEyeToolkitWrapper(base_wrapper.ToolkitWrapper):
                 oemol.NewConf(oecoords)
 
         # Retain charges, if present. All atoms are initialized above with a partial charge of NaN.
-        if molecule.partial_charges is not None:
+        if partial_charges is not None:
             oe_indexed_charges = np.zeros(shape=molecule.n_atoms, dtype=np.float64)
-            assert hasattr(molecule.partial_charges, "units")
-            for off_idx, charge in enumerate(molecule.partial_charges):
-                oe_idx = off_to_oe_idx[off_idx]
-                charge_unitless = charge.m_as(unit.elementary_charge)
-                oe_indexed_charges[oe_idx] = charge_unitless
+            for off_idx, charge in enumerate(partial_charges):
+                oe_indexed_charges[off_to_oe_idx[off_idx]] = charge
             # TODO: This loop below fails if we try to use an "enumerate"-style loop.
             #  It's worth investigating whether we make this assumption elsewhere in the codebase, since
             #  the OE docs may indicate that this sort of usage is a very bad thing to do.
@@ -2750,6 +2746,50 @@ class OpenEyeToolkitWrapper(base_wrapper.ToolkitWrapper):
             unique=unique,
         )
 
+    def find_smarts_matches_batch(
+        self,
+        molecule: "Molecule",
+        smarts_list: List[str],
+        aromaticity_model="OEAroModel_MDL",
+        unique=False,
+    ) -> List[List[Tuple[int, ...]]]:
+        """
+        Find all matches of each of several SMARTS for the specified molecule.
+
+        This is equivalent to calling ``find_smarts_matches`` once per SMARTS, but
+        the molecule is converted to an OpenEye molecule only once.
+
+        .. warning :: This API is experimental and subject to change.
+
+        Parameters
+        ----------
+        molecule : openff.toolkit.topology.Molecule
+            The molecule for which all specified SMARTS matches are to be located
+        smarts_list : list of str
+            SMARTS strings with optional SMIRKS-style atom tagging
+        aromaticity_model : str, optional, default='OEAroModel_MDL'
+            Molecule is prepared with this aromaticity model prior to querying.
+        unique : bool, default=False
+            If True, only return unique matches. If False, return all matches.
+
+        Returns
+        -------
+        matches : list of list of tuples of atom indices
+            ``matches[i]`` are the matches of ``smarts_list[i]``, as returned by
+            ``find_smarts_matches``.
+
+        """
+        oemol, _ = self._connection_table_to_openeye(molecule)
+        return [
+            self._find_smarts_matches(
+                oemol,
+                smarts,
+                aromaticity_model=aromaticity_model,
+                unique=unique,
+            )
+            for smarts in smarts_list
+        ]
+
 
 def requires_openeye_module(module_name):
     def inner_decorator(function):
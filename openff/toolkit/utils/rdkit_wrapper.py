@@ -53,6 +53,32 @@ def _require_text_file_obj(file_obj):
         ) from None
 
 
+@functools.lru_cache(maxsize=4096)
+def _compile_smarts(smarts: str):
+    """
+    Parse a SMARTS string into an RDKit query molecule, along with the indices of
+    its tagged atoms in tag order.
+
+    The same SMIRKS are matched against every molecule a force field is applied to,
+    so the parsed queries are cached. Callers must not modify the returned query.
+    """
+    from rdkit import Chem
+
+    qmol = Chem.MolFromSmarts(smarts)  # cannot catch the error
+    if qmol is None:
+        raise ValueError('RDKit could not parse the SMIRKS string "{}"'.format(smarts))
+
+    # Create atom mapping for query molecule
+    idx_map = dict()
+    for atom in qmol.GetAtoms():
+        smirks_index = atom.GetAtomMapNum()
+        if smirks_index != 0:
+            idx_map[smirks_index - 1] = atom.GetIdx()
+    map_list = tuple(idx_map[x] for x in sorted(idx_map))
+
+    return qmol, map_list
+
+
 class RDKitToolkitWrapper(base_wrapper.ToolkitWrapper):
     """
     RDKit toolkit wrapper
@@ -334,17 +360,16 @@ class RDKitToolkitWrapper(base_wrapper.ToolkitWrapper):
                         y = match[b.GetEndAtomIdx()]
                         b2 = mol.GetBondBetweenAtoms(x, y)
                         b2.SetBondType(b.GetBondType())
-                        already_assigned_edges.add(tuple(sorted([x, y])))
+                        already_assigned_edges.add((x, y) if x < y else (y, x))
 
         unassigned_atoms = sorted(
             set(range(rdkit_mol.GetNumAtoms())) - already_assigned_nodes
         )
-        all_bonds = set(
-            [
-                tuple(sorted([bond.GetBeginAtomIdx(), bond.GetEndAtomIdx()]))
-                for bond in rdkit_mol.GetBonds()
-            ]
-        )
+        all_bonds = set()
+        for bond in rdkit_mol.GetBonds():
+            x = bond.GetBeginAtomIdx()
+            y = bond.GetEndAtomIdx()
+            all_bonds.add((x, y) if x < y else (y, x))
         unassigned_bonds = sorted(all_bonds - already_assigned_edges)
 
         if unassigned_atoms or unassigned_bonds:
@@ -2126,17 +2151,16 @@ class RDKitToolkitWrapper(base_wrapper.ToolkitWrapper):
         if molecule._conformers:
             for conformer in molecule._conformers:
                 rdmol_conformer = Chem.Conformer()
+                # Strip the units once per conformer rather than once per atom
+                conformer_unitless = conformer.m_as(unit.angstrom)
                 for atom_idx in range(molecule.n_atoms):
-                    x, y, z = conformer[atom_idx, :].m_as(unit.angstrom)
+                    x, y, z = conformer_unitless[atom_idx, :]
                     rdmol_conformer.SetAtomPosition(atom_idx, Geometry.Point3D(x, y, z))
                 rdmol.AddConformer(rdmol_conformer, assignId=True)
 
         # Retain charges, if present
         if not (molecule._partial_charges is None):
-            rdk_indexed_charges = np.zeros(shape=molecule.n_atoms, dtype=float)
-            for atom_idx, charge in enumerate(molecule._partial_charges):
-                charge_unitless = charge.m_as(unit.elementary_charge)
-                rdk_indexed_charges[atom_idx] = charge_unitless
+            rdk_indexed_charges = molecule._partial_charges_e
             for atom_idx, rdk_atom in enumerate(rdmol.GetAtoms()):
                 rdk_atom.SetDoubleProp("PartialCharge", rdk_indexed_charges[atom_idx])
 
@@ -2345,20 +2369,8 @@ class RDKitToolkitWrapper(base_wrapper.ToolkitWrapper):
         #    # Only the OEAroModel_MDL is supported for now
         #    raise ValueError("Unknown aromaticity model: {}".aromaticity_models)
 
-        # Set up query.
-        qmol = Chem.MolFromSmarts(smarts)  # cannot catch the error
-        if qmol is None:
-            raise ValueError(
-                'RDKit could not parse the SMIRKS string "{}"'.format(smarts)
-            )
-
-        # Create atom mapping for query molecule
-        idx_map = dict()
-        for atom in qmol.GetAtoms():
-            smirks_index = atom.GetAtomMapNum()
-            if smirks_index != 0:
-                idx_map[smirks_index - 1] = atom.GetIdx()
-        map_list = [idx_map[x] for x in sorted(idx_map)]
+        # Set up query. Parsed queries are cached, so ``qmol`` must not be modified here.
+        qmol, map_list = _compile_smarts(smarts)
 
         # choose the largest unsigned int without overflow
         # since the C++ signature is a uint
@@ -2411,6 +2423,54 @@ class RDKitToolkitWrapper(base_wrapper.ToolkitWrapper):
             unique=unique,
         )
 
+    def find_smarts_matches_batch(
+        self,
+        molecule: "Molecule",
+        smarts_list: List[str],
+        aromaticity_model: str = "OEAroModel_MDL",
+        unique: bool = False,
+    ) -> List[List[Tuple[int, ...]]]:
+        """
+        Find all matches of each of several SMARTS for the specified molecule.
+
+        This is equivalent to calling ``find_smarts_matches`` once per SMARTS, but
+        the molecule is converted to an RDKit molecule only once.
+
+        .. warning :: This API is experimental and subject to change.
+
+        Parameters
+        ----------
+        molecule : openff.toolkit.topology.Molecule
+            The molecule for which all specified SMARTS matches are to be located
+        smarts_list : list of str
+            SMARTS strings with optional SMIRKS-style atom tagging
+        aromaticity_model : str, optional, default='OEAroModel_MDL'
+            Molecule is prepared with this aromaticity model prior to querying.
+        unique : bool, default=False
+            If True, only return unique matches. If False, return all matches.
+
+        Returns
+        -------
+        matches : list of list of tuples of atom indices
+            ``matches[i]`` are the matches of ``smarts_list[i]``, as returned by
+            ``find_smarts_matches``.
+
+        .. note :: Currently, the only supported ``aromaticity_model`` is ``OEAroModel_MDL``
+
+        """
+        rdmol = self._connection_table_to_rdkit(
+            molecule, aromaticity_model=aromaticity_model
+        )
+        return [
+            self._find_smarts_matches(
+                rdmol,
+                smarts,
+                aromaticity_model="OEAroModel_MDL",
+                unique=unique,
+            )
+            for smarts in smarts_list
+        ]
+
     def atom_is_in_ring(self, atom: "Atom") -> bool:
         """Return whether or not an atom is in a ring.
 
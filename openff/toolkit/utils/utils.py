@@ -26,7 +26,7 @@ __all__ = [
 import contextlib
 import functools
 import logging
-from typing import Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pint
@@ -207,6 +207,23 @@ def string_to_quantity(quantity_string) -> Union[str, int, float, unit.Quantity]
         return quantity
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_quantity_string(value: str) -> Tuple[Any, Optional[unit.Unit]]:
+    """Parse a string expression into its magnitude and units.
+
+    The same string literals (e.g. ``'1.0 * angstrom'``) recur many times when
+    loading a force field, so the (relatively expensive) parsing is cached. The
+    magnitude and units are returned separately rather than as a ``Quantity``
+    because ``Quantity`` objects can be modified in place (e.g. with ``ito()``)
+    and thus cannot be shared among parameters. If the string does not represent
+    a ``Quantity``, the units are ``None``.
+    """
+    quantity = object_to_quantity(value)
+    if isinstance(quantity, unit.Quantity):
+        return quantity.m, quantity.units
+    return quantity, None
+
+
 def convert_all_strings_to_quantity(
     smirnoff_data: Dict,
     ignore_keys: List[str] = list(),
@@ -253,6 +270,19 @@ def convert_all_strings_to_quantity(
     elif isinstance(smirnoff_data, int) or isinstance(smirnoff_data, float):
         obj_to_return = smirnoff_data
 
+    elif isinstance(smirnoff_data, str):
+        # Most strings are quantities repeated across many parameters, so parse
+        # them through a cache and only build a new Quantity for each occurrence.
+        try:
+            magnitude, units = _parse_quantity_string(smirnoff_data)
+        except (TypeError, DefinitionSyntaxError):
+            obj_to_return = smirnoff_data
+        else:
+            if units is None:
+                obj_to_return = magnitude
+            else:
+                obj_to_return = unit.Quantity(magnitude, units)
+
     else:
         try:
             obj_to_return = object_to_quantity(smirnoff_data)
@@ -771,7 +801,7 @@ def sort_smirnoff_dict(data):
             sorted_dict[key] = sort_smirnoff_dict(val)
         elif isinstance(val, list):
             # Handle case of ParameterLists, which show up in
-            # the smirnoff dicts as lists of OrderedDicts or dicts
+            # the smirnoff dicts as lists of dicts
             new_parameter_list = list()
             for param in val:
                 new_parameter_list.append(sort_smirnoff_dict(param))